@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Form
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import random
 import string
 from fastapi_mail import ConnectionConfig
 import os
-from models import get_db
+from models import get_async_db
 from pydantic import EmailStr, BaseModel
 from services import send_verification_email, verify_and_register, login_user
 import logging
@@ -46,10 +46,10 @@ def generate_verification_code():
 @router.post("/login")
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        return login_user(form_data.username, form_data.password, db)
+        return await login_user(form_data.username, form_data.password, db)
     except HTTPException as he:
         raise he
     except Exception as e:
@@ -75,14 +75,14 @@ class RegisterForm(BaseModel):
 @router.post("/register", status_code=status.HTTP_201_CREATED)
 async def register(
     form_data: RegisterForm,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         logger.info("이메일", form_data.email)
         logger.info("비밀번호", form_data.password)
         logger.info("인증코드", form_data.verification_code)
         
-        return verify_and_register(form_data.email, form_data.password, form_data.verification_code, db)
+        return await verify_and_register(form_data.email, form_data.password, form_data.verification_code, db)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from services.warmup import readiness
+
+router = APIRouter()
+
+
+@router.get("/live")
+async def liveness():
+    """프로세스가 요청을 받을 수 있는지 (예열 여부와 무관)"""
+    return {"alive": True}
+
+
+@router.get("/ready")
+async def readiness_check():
+    """
+    엔진 예열이 끝나야 200, 그 전에는 503
+    로드밸런서가 예열 전 인스턴스로 요청을 보내지 않도록 사용
+    """
+    return JSONResponse(status_code=200 if readiness.ready else 503, content=readiness.to_dict())
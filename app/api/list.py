@@ -1,13 +1,15 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager
 from pydantic import BaseModel
 from typing import List, Optional
 from models import (
     StatisticalTest,
     Project,
     User,
-    get_db
+    get_async_db
 )
 
 import logging
@@ -50,7 +52,7 @@ async def list_statistical_results(
     test_method: Optional[str] = Query(None, description="테스트 유형 필터링"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         # 인증된 사용자 정보 추출
@@ -58,24 +60,24 @@ async def list_statistical_results(
         if not current_user:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        # 기본 쿼리 구성
-        query = db.query(StatisticalTest).join(Project).join(User).filter(
+        # 기본 쿼리 구성 (project 는 join 한 행으로 채워서 응답 변환 시 추가 쿼리 없음)
+        query = select(StatisticalTest).join(Project).join(User).where(
             User.id == current_user['id']
-        )
+        ).options(contains_eager(StatisticalTest.project))
 
         # 필터 조건 적용
         if project_id:
-            query = query.filter(Project.id == project_id)
+            query = query.where(Project.id == project_id)
         if test_method:
-            query = query.filter(StatisticalTest.test_method == test_method)
+            query = query.where(StatisticalTest.test_method == test_method)
 
         # 전체 개수 조회
-        total_count = query.count()
+        total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
 
         # 페이징 처리
-        results = query.order_by(StatisticalTest.id.desc()).offset(
+        results = (await db.scalars(query.order_by(StatisticalTest.id.desc()).offset(
             (page - 1) * limit
-        ).limit(limit).all()
+        ).limit(limit))).all()
 
         logger.info(f"Retrieved {len(results)} statistical test results")
 
@@ -3,9 +3,10 @@ from services import llm_results, llm_conclusions
 import logging
 from schemas import llmResultRequest, llmConclusionRequest
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.statistical_test import StatisticalTest
-from models import get_db
+from models import get_async_db
+from services.executors import llm_executor
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,10 @@ logger.setLevel(logging.INFO)
 router = APIRouter()
 
 
+# Gemini 호출 (chain.invoke) 은 블로킹이라 llm_executor 에서 실행
 @router.post("/results")
-async def get_llm_results(request: llmResultRequest):
+@llm_executor.offload
+def get_llm_results(request: llmResultRequest):
     logger.info(f"llm_results {request.test_type}")
     logger.info(f"{request.question}")
     output = llm_results(
@@ -37,7 +40,8 @@ async def get_llm_results(request: llmResultRequest):
     return output
 
 @router.post("/conclusion")
-async def get_llm_conclusion(request: llmConclusionRequest):
+@llm_executor.offload
+def get_llm_conclusion(request: llmConclusionRequest):
     logger.info(f"llm_conclusion {request.test_type}")
     logger.info(f"{request.experimental_design}")
     logger.info(f"{request.subject_info}")
@@ -48,10 +52,10 @@ async def get_llm_conclusion(request: llmConclusionRequest):
     return output
 
 @router.get("/output/{test_id}")
-async def get_test_results_and_conclusion(test_id: int, db: Session = Depends(get_db)):
+async def get_test_results_and_conclusion(test_id: int, db: AsyncSession = Depends(get_async_db)):
     logger.info(f"Getting results and conclusion for test ID: {test_id}")
     
-    statistical_test = db.query(StatisticalTest).filter(StatisticalTest.id == test_id).first()
+    statistical_test = await db.get(StatisticalTest, test_id)
     
     if not statistical_test:
         logger.error(f"Statistical test with ID {test_id} not found")
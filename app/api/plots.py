@@ -0,0 +1,24 @@
+import re
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+from services.plots import plot_path
+
+router = APIRouter()
+
+PLOT_NAME = re.compile(r"^([0-9a-f]{64})\.svg$")
+
+
+@router.get("/{name}")
+async def get_plot(name: str):
+    """
+    서버에서 그린 검정 결과 그래프 (StatisticalTest.image_url)
+    파일 이름이 내용의 해시라 내용이 바뀌지 않으므로 브라우저가 영구 캐시하도록 함
+    """
+    match = PLOT_NAME.match(name)
+    if not match:
+        raise HTTPException(status_code=404, detail="Plot not found")
+    path = plot_path(match.group(1))
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Plot not found")
+    return FileResponse(path, media_type="image/svg+xml",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
-from models import Project, get_db, ProjectPermission, TableData
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import Project, get_async_db, ProjectPermission, TableData
 from middleware.auth import get_current_user
 from schemas import ProjectCreate, ProjectUpdate
 from sqlalchemy.exc import SQLAlchemyError
@@ -26,63 +26,62 @@ logger.setLevel(logging.INFO)
 router = APIRouter()
 
 @router.post("/create")
-def create_project(
+async def create_project(
     project: ProjectCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
-    return ProjectService.create_project(db, project, current_user)
+    return await ProjectService.create_project(db, project, current_user)
 
 @router.get("/", response_model=list)
-def get_user_projects(
-    db: Session = Depends(get_db),
+async def get_user_projects(
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     """
     인증된 사용자가 만든 모든 프로젝트를 ID 순서대로 가져오는 엔드포인트
     """
-    return ProjectService.get_user_projects(db, current_user)
+    return await ProjectService.get_user_projects(db, current_user)
 
 @router.get("/{project_id}", response_model=dict)
-def get_user_project(
+async def get_user_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     인증된 사용자의 특정 프로젝트를 가져오거나,
     visibility가 'etc'일 경우 ProjectPermission 테이블에서 권한 확인 및 반환.
     """
-    return ProjectService.get_user_project(db, project_id)
+    return await ProjectService.get_user_project(db, project_id)
 
 @router.delete("/{project_id}", response_model=dict)
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     """
     현재 인증된 사용자가 소유한 프로젝트를 삭제하는 엔드포인트.
     """
-    return ProjectService.delete_project(db, project_id, current_user)
+    return await ProjectService.delete_project(db, project_id, current_user)
 
 @router.put("/{project_id}", response_model=dict)
-def update_project(
+async def update_project(
     project_id: int,
     update_data: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     """
     현재 인증된 사용자가 소유한 프로젝트의 이름을 변경하는 엔드포인트.
     프로젝트 이름 중복 여부도 체크하여 업데이트합니다.
     """
-    return ProjectService.update_project(db, project_id, update_data, current_user)
+    return await ProjectService.update_project(db, project_id, update_data, current_user)
 
 @router.websocket("/table")
 async def save_project_table(
     websocket: WebSocket,
     project_id: int,
-    db: Session = Depends(get_db),
 ):
     try:
         await websocket.accept()
@@ -97,7 +96,6 @@ async def save_project_table(
         success, error_code = await ProjectService.handle_table_websocket(
             websocket=websocket,
             project_id=project_id,
-            db=db,
             current_user=current_user
         )
 
@@ -1,15 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List, Union
 
-from models import get_db
+from models import get_async_db
 from services.statistics_results import get_statistical_test_result
 from schemas.results import (
     ANOVAResult,
     PairedTTestResultResponse,
     IndependentTTestResultResponse,
-    OneSampleTTestResultResponse
+    OneSampleTTestResultResponse,
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
 )
 
 router = APIRouter(prefix="/results", tags=["Statistics"])
@@ -20,7 +23,10 @@ StatisticalResult = Union[
     ANOVAResult,
     PairedTTestResultResponse,
     IndependentTTestResultResponse,
-    OneSampleTTestResultResponse
+    OneSampleTTestResultResponse,
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
 ]
 
 import logging
@@ -42,9 +48,9 @@ logger.setLevel(logging.INFO)
 @router.get("/{test_id}", response_model=StatisticalResult)
 async def get_statistical_result(
         test_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
 ):
-    result = get_statistical_test_result(test_id, db)
+    result = await get_statistical_test_result(test_id, db)
     if not result:
         raise HTTPException(status_code=404, detail="Test not found")
     return result
@@ -1,11 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from models import Project, get_db, ProjectPermission, TableData, StatisticalTest, OneWayANOVAResult, PairedTTestResult, IndependentTTestResult, OneSampleTTestResult
+from models import Project, get_db, get_async_db, pool_stats, ProjectPermission, TableData, StatisticalTest, OneWayANOVAResult, PairedTTestResult, IndependentTTestResult, OneSampleTTestResult, MannWhitneyUResult, WilcoxonSignedRankResult, KruskalWallisResult
 from middleware.auth import get_current_user
-from schemas import ProjectCreate, StatisticRequest, RenameStatisticRequest, StatisticalTestIdList, StatisticalResultResponse
+from schemas import ProjectCreate, StatisticRequest, RenameStatisticRequest, StatisticalTestIdList, StatisticalResultResponse, StatisticBatchRequest, CorrelationRequest
 from sqlalchemy.exc import SQLAlchemyError
 from schemas import StatisticRequest
-from services import one_sample_t_test, independent_t_test, one_way_anova, paired_t_test
+from services import get_backend, StatisticsService
+from services.stats_engine import DEFAULT_MU
+from services.rworker import PoolFullError, JobTimeoutError, memory_stats
+from services.executors import stats_executor, db_executor, executor_stats
+from services.table_writer import table_writer
+from services.stats_cache import run_cached_statistic_job, run_cached_statistic_batch, statistics_cache
+from services import summary_stats
+from services.effect_sizes import add_effect_sizes
+from services.posthoc import add_post_hoc
+from services.resampling import resample
+from services.correlation import project_correlation
+from services.table import resolve_column_requests
+from services.missing_values import apply_missing_value_handling
+from services.plots import render_plots
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,10 +39,55 @@ logger.setLevel(logging.INFO)
 
 router = APIRouter()
 
+# 블로킹 작업은 종류별 executor 에서 실행 (services/executors.py)
+# - 엔진 호출, 요약 통계, 효과크기/사후검정: stats_executor
+# - 동기 SQLAlchemy 세션을 쓰는 코드 (표 열 읽기, 결과 저장): db_executor
+# 조회/수정만 하는 핸들러는 AsyncSession (get_async_db) 으로 이벤트 루프에서 바로 처리
+# 계산 핸들러는 동기 세션 하나만 받아서 (요청당 커넥션 하나) db_executor 안에서만 사용
+
+def _post_process(tests: list, results: list):
+    add_effect_sizes(tests, results)
+    add_post_hoc(tests, results)
+
+
+def _clean_groups(requests: list) -> list:
+    """
+    요청마다 결측 처리를 한 번만 해서 캐시 키, 엔진, 재표본, 그래프가 같은 배열을 쓰도록 함
+    데이터 크기에 비례하므로 stats_executor 에서 실행 (요약 요청은 원자료가 없어 None)
+    """
+    return [
+        apply_missing_value_handling(request.value, request.test, request.missingValueHandling)
+        if request.summaries is None else None
+        for request in requests
+    ]
+
+
+def _readable_project(db: Session, project_id: int, user_id: int) -> Project:
+    # 소유자 또는 ProjectPermission 이 있는 사용자만 (db_executor 에서 실행)
+    project = db.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    permission = db.scalar(select(ProjectPermission.id).where(
+        ProjectPermission.project_id == project_id,
+        ProjectPermission.user_id == user_id
+    ))
+    if not permission and project.user_id != user_id:
+        raise HTTPException(status_code=403, detail="Not authorized to access this project")
+    return project
+
+
+def _resolve_columns(db: Session, project_id: int, user_id: int, requests: list) -> list:
+    # 표 열 참조는 저장된 표에서 값을 읽어 value 로 채움 (표를 읽을 수 있는 사용자만)
+    if any(request.columns is not None for request in requests):
+        _readable_project(db, project_id, user_id)
+    return resolve_column_requests(db, project_id, requests)
+
 @router.post("/run")
 async def run_statistic(
     request: StatisticRequest,
     project_id: int,
+    background_tasks: BackgroundTasks,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -34,262 +95,214 @@ async def run_statistic(
         logger.info("current_user: ", current_user)
         
         logger.info(f"Test Type: {request.test}")
-        logger.info(f"value: {request.value}")
-
-        alias = "통계"
-
-        if request.test == "OneWayANOVA":
-            result = one_way_anova(request.value, request.confidenceInterval)
-            logger.info(f"OneWayANOVA Result: {result}")
-            
-            alias = "One Way ANOVA"
-
-            new_test = StatisticalTest(
-                project_id=project_id,
-                alias=alias,
-                test_method=request.test,
-                hypothesis=request.hypothesis,
-                missing_value_handling=request.missingValueHandling,
-                mean_difference=request.meanDifference,
-                confidence_interval=request.confidenceInterval,
-                effect_size=request.effectSize,
-                effect_size_value=request.effectSizeValue,
-                descriptive_stats=request.descriptiveStats,
-                value=request.value,
-                statistical_test_result=result
-            )
-            db.add(new_test)
-            db.flush()
-
-            anova_result = OneWayANOVAResult(
-                statistical_test_id=new_test.id,
-                between_df=result["test_stats"]["between_df"],
-                between_f=result["test_stats"]["between_f"],
-                between_mean_sq=result["test_stats"]["between_mean_sq"],
-                between_sig=result["test_stats"]["between_sig"],
-                between_sum_sq=result["test_stats"]["between_sum_sq"],
-                conf_level=result["test_stats"]["conf_level"],
-                total_df=result["test_stats"]["total_df"],
-                total_sum_sq=result["test_stats"]["total_sum_sq"],
-                within_mean_sq=result["test_stats"]["within_mean_sq"],
-                within_df=result["test_stats"]["within_df"],
-                within_sum_sq=result["test_stats"]["within_sum_sq"],
-                
-                total_ci_lower=result["total_descriptive_stats"]["ci_lower"],
-                total_ci_upper=result["total_descriptive_stats"]["ci_upper"],
-                total_mean=result["total_descriptive_stats"]["mean"],
-                total_n=result["total_descriptive_stats"]["n"],
-                total_sd=result["total_descriptive_stats"]["sd"],
-                total_se=result["total_descriptive_stats"]["se"],
-                
-                group_descriptive_stats=result["group_descriptive_stats"]
-            )
-            db.add(anova_result)
-            db.commit()
-            logger.info("one way anova saved")
-
-        elif request.test == "PairedTTest":
-            result = paired_t_test(request.value, request.confidenceInterval)
-            logger.info(f"PairedTTest Result: {result}")
-            
-            alias = "Paired T Test"
-
-            new_test = StatisticalTest(
-                project_id=project_id,
-                alias=alias,
-                test_method=request.test,
-                hypothesis=request.hypothesis,
-                missing_value_handling=request.missingValueHandling,
-                mean_difference=request.meanDifference,
-                confidence_interval=request.confidenceInterval,
-                effect_size=request.effectSize,
-                effect_size_value=request.effectSizeValue,
-                descriptive_stats=request.descriptiveStats,
-                value=request.value,
-                statistical_test_result=result
-            )
-            db.add(new_test)
-            db.flush()
-
-            paired_result = PairedTTestResult(
-                statistical_test_id=new_test.id,
-                # test stats
-                t_statistic=result["test_stats"]["t_statistic"],
-                df=result["test_stats"]["df"],
-                p_value=result["test_stats"]["p_value"],
-                confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
-                confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
-                conf_level=result["test_stats"]["conf_level"],
-                
-                # group1 stats
-                group1_name=result["group1_stats"]["group_name"],
-                stats_group1_max=result["group1_stats"]["max"],
-                stats_group1_mean=result["group1_stats"]["mean"],
-                stats_group1_median=result["group1_stats"]["median"],
-                stats_group1_min=result["group1_stats"]["min"],
-                stats_group1_n=result["group1_stats"]["n"],
-                stats_group1_sd=result["group1_stats"]["sd"],
-                stats_group1_se=result["group1_stats"]["se"],
-                
-                # group2 stats
-                group2_name=result["group2_stats"]["group_name"],
-                stats_group2_max=result["group2_stats"]["max"],
-                stats_group2_mean=result["group2_stats"]["mean"],
-                stats_group2_median=result["group2_stats"]["median"],
-                stats_group2_min=result["group2_stats"]["min"],
-                stats_group2_n=result["group2_stats"]["n"],
-                stats_group2_sd=result["group2_stats"]["sd"],
-                stats_group2_se=result["group2_stats"]["se"],
-                
-                # diff stats
-                stats_diff_max=result["diff_stats"]["max"],
-                stats_diff_mean=result["diff_stats"]["mean"],
-                stats_diff_median=result["diff_stats"]["median"],
-                stats_diff_min=result["diff_stats"]["min"],
-                stats_diff_n=result["diff_stats"]["n"],
-                stats_diff_sd=result["diff_stats"]["sd"],
-                stats_diff_se=result["diff_stats"]["se"]
-            )
-            db.add(paired_result)
-            db.commit()
-
-            logger.info("paired t test saved")
-            
-        elif request.test == "IndependentTTest":
-            result = independent_t_test(request.value, request.confidenceInterval)
-            logger.info(f"IndependentTTest Result: {result}")
-
-            alias = "Independent T Test"
-
-            new_test = StatisticalTest(
-                project_id=project_id,
-                alias=alias,
-                test_method=request.test,
-                hypothesis=request.hypothesis,
-                missing_value_handling=request.missingValueHandling,
-                mean_difference=request.meanDifference,
-                confidence_interval=request.confidenceInterval,
-                effect_size=request.effectSize,
-                effect_size_value=request.effectSizeValue,
-                descriptive_stats=request.descriptiveStats,
-                value=request.value,
-                statistical_test_result=result
-            )
-            db.add(new_test)
-            db.flush()
-
-            independent_result = IndependentTTestResult(
-                statistical_test_id=new_test.id,
-                # test stats
-                t_statistic=result["test_stats"]["t_statistic"],
-                df=result["test_stats"]["degrees_of_freedom"],
-                p_value=result["test_stats"]["p_value"],
-                confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
-                confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
-                conf_level=result["test_stats"]["conf_level"],
-                
-                # group1 stats
-                group1_name=result["group1_stats"]["group_name"],
-                stats_group1_max=result["group1_stats"]["max"],
-                stats_group1_mean=result["group1_stats"]["mean"],
-                stats_group1_median=result["group1_stats"]["median"],
-                stats_group1_min=result["group1_stats"]["min"],
-                stats_group1_n=result["group1_stats"]["n"],
-                stats_group1_sd=result["group1_stats"]["sd"],
-                stats_group1_se=result["group1_stats"]["se"],
-                
-                # group2 stats
-                group2_name=result["group2_stats"]["group_name"],
-                stats_group2_max=result["group2_stats"]["max"],
-                stats_group2_mean=result["group2_stats"]["mean"],
-                stats_group2_median=result["group2_stats"]["median"],
-                stats_group2_min=result["group2_stats"]["min"],
-                stats_group2_n=result["group2_stats"]["n"],
-                stats_group2_sd=result["group2_stats"]["sd"],
-                stats_group2_se=result["group2_stats"]["se"]
+        logger.info(f"groups: { {name: len(values) for name, values in request.value.items()} }")
+
+        request, = await db_executor.run(_resolve_columns, db, project_id, current_user["user"], [request])
+
+        groups, = await stats_executor.run(_clean_groups, [request])
+        if request.summaries is not None:
+            # 그룹별 요약만으로 계산 (그룹 수에 비례하는 계산이라 엔진/캐시를 거치지 않음)
+            result = await stats_executor.run(
+                summary_stats.run, request.test, request.summaries, request.confidenceInterval, DEFAULT_MU
             )
-            db.add(independent_result)
-            db.commit()
-            
-            logger.info("independent t test saved")
-
-        elif request.test == "OneSampleTTest":
-            result = one_sample_t_test(request.value, 3, request.confidenceInterval)
-            logger.info(f"OneSampleTTest Result: {result}")
-            alias = "One Sample T Test"
-            
-            new_test = StatisticalTest(
-                project_id=project_id,
-                alias=alias,
-                test_method=request.test,
-                hypothesis=request.hypothesis,
-                missing_value_handling=request.missingValueHandling,
-                mean_difference=request.meanDifference,
-                confidence_interval=request.confidenceInterval,
-                effect_size=request.effectSize,
-                effect_size_value=request.effectSizeValue,
-                descriptive_stats=request.descriptiveStats,
-                value=request.value,
-                statistical_test_result=result
+        else:
+            backend = get_backend(request.engine)
+            logger.info(f"engine: {backend.name}")
+
+            result = await run_cached_statistic_job(
+                backend.name, request.test, request.hypothesis, groups, request.confidenceInterval, DEFAULT_MU,
+                request.missingValueHandling
             )
-            db.add(new_test)
-            db.flush()
-
-            one_sample_result = OneSampleTTestResult(
-                statistical_test_id=new_test.id,
-                # test stats
-                t_statistic=result["test_stats"]["t_statistic"],
-                df=result["test_stats"]["df"],
-                p_value=result["test_stats"]["p_value"],
-                confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
-                confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
-                conf_level=result["test_stats"]["conf_level"],
-                mu=result["test_stats"]["mu"],
-                
-                # group stats
-                group_name=result["group_stats"]["group_name"],
-                stats_max=result["group_stats"]["stats_max"],
-                stats_mean=result["group_stats"]["stats_mean"],
-                stats_median=result["group_stats"]["stats_median"],
-                stats_min=result["group_stats"]["stats_min"],
-                stats_n=result["group_stats"]["stats_n"],
-                stats_sd=result["group_stats"]["stats_sd"],
-                stats_se=result["group_stats"]["stats_se"],
-                stats_q1=result["group_stats"]["stats_q1"],
-                stats_q3=result["group_stats"]["stats_q3"],
-                stats_var=result["group_stats"]["stats_var"]
+        await stats_executor.run(_post_process, [request.test], [result])
+        if request.resampling is not None:
+            result["resampling"] = await resample(
+                request.test,
+                groups,
+                request.confidenceInterval,
+                request.resampling.model_dump()
             )
-            db.add(one_sample_result)
-            db.commit()
-            logger.info("one sample t test saved")
+        logger.info(f"{request.test.value} Result: {result}")
 
-        return {"success": True, "result": result, "test_id": new_test.id}
+        test_id, = await db_executor.run(StatisticsService.save_tests, db, project_id, [request], [result])
+        # 그래프는 응답 후 그려서 image_url 을 채움 (요약만 받은 요청은 원자료가 없어 그리지 않음)
+        if request.summaries is None:
+            background_tasks.add_task(render_plots, [(test_id, groups, request.confidenceInterval)])
 
+        return {"success": True, "result": result, "test_id": test_id}
+
+    except HTTPException:
+        raise
+    except PoolFullError as e:
+        logger.warning(f"Statistics queue full: {str(e)}")
+        raise HTTPException(status_code=503, detail="Statistics server is busy", headers={"Retry-After": "1"})
+    except JobTimeoutError as e:
+        logger.error(f"Statistics job timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail="Statistical analysis timed out")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except SQLAlchemyError as e:
-        db.rollback()
+        await db_executor.run(db.rollback)
         logger.error(f"Database error during statistical analysis: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error occurred")
     except Exception as e:
         logger.error(f"Error during statistical analysis: {str(e)}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@router.post("/run-batch")
+async def run_statistic_batch(
+    batch: StatisticBatchRequest,
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    여러 통계 검정을 엔진 호출 한 번, DB 트랜잭션 한 번으로 실행
+    allPairs 를 주면 value (또는 columns) 의 모든 그룹 쌍에 대해 같은 검정을 실행
+    columns 로 표의 열을 참조한 요청은 배치 전체에서 쿼리 한 번으로 읽음
+    summaries 를 준 요청은 요약 통계로 바로 계산하고 나머지만 엔진으로 보냄
+    test_ids 는 요청 순서 (allPairs 는 requests 뒤에 이어짐)
+    """
+    try:
+        requests = StatisticsService.expand_batch(batch)
+        if not requests:
+            raise HTTPException(status_code=400, detail="No statistical tests requested")
+        requests = await db_executor.run(_resolve_columns, db, project_id, current_user["user"], requests)
+
+        # 요청마다 engine 을 줄 수 있으므로 (없으면 batch.engine) 엔진별로 묶어서 엔진마다 한 번 호출
+        by_engine = {}
+        for i, request in enumerate(requests):
+            if request.summaries is None:
+                by_engine.setdefault(get_backend(request.engine or batch.engine).name, []).append(i)
+        logger.info(f"batch of {len(requests)} tests, engines: { {name: len(raw) for name, raw in by_engine.items()} }")
+
+        cleaned = await stats_executor.run(_clean_groups, requests)
+        results = await stats_executor.run(lambda: [
+            summary_stats.run(request.test, request.summaries, request.confidenceInterval, DEFAULT_MU)
+            if request.summaries is not None else None
+            for request in requests
+        ])
+        computed = await asyncio.gather(*(
+            run_cached_statistic_batch(engine, [
+                {
+                    "test_method": requests[i].test,
+                    "hypothesis": requests[i].hypothesis,
+                    "groups_data": cleaned[i],
+                    "conf_level": requests[i].confidenceInterval,
+                    "mu": DEFAULT_MU,
+                    "missing_value_handling": requests[i].missingValueHandling,
+                }
+                for i in raw
+            ])
+            for engine, raw in by_engine.items()
+        ))
+        for raw, engine_results in zip(by_engine.values(), computed):
+            for i, result in zip(raw, engine_results):
+                results[i] = result
+        await stats_executor.run(_post_process, [request.test for request in requests], results)
+        for request, result, groups in zip(requests, results, cleaned):
+            if request.resampling is not None:
+                result["resampling"] = await resample(
+                    request.test,
+                    groups,
+                    request.confidenceInterval,
+                    request.resampling.model_dump()
+                )
+
+        test_ids = await db_executor.run(StatisticsService.save_tests, db, project_id, requests, results)
+        background_tasks.add_task(render_plots, [
+            (test_id, groups, request.confidenceInterval)
+            for request, test_id, groups in zip(requests, test_ids, cleaned) if groups is not None
+        ])
+
+        return {
+            "success": True,
+            "test_ids": test_ids,
+            "results": results,
+            "count": len(test_ids)
+        }
+
+    except HTTPException:
+        raise
+    except PoolFullError as e:
+        logger.warning(f"Statistics queue full: {str(e)}")
+        raise HTTPException(status_code=503, detail="Statistics server is busy", headers={"Retry-After": "1"})
+    except JobTimeoutError as e:
+        logger.error(f"Statistics batch timed out: {str(e)}")
+        raise HTTPException(status_code=504, detail="Statistical analysis timed out")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError as e:
+        await db_executor.run(db.rollback)
+        logger.error(f"Database error during statistical batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error occurred")
+    except Exception as e:
+        logger.error(f"Error during statistical batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.post("/correlation", response_model=dict)
+async def run_correlation(
+    request: CorrelationRequest,
+    project_id: int,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    프로젝트 표의 모든 숫자 열에 대한 상관행렬과 p 값
+    표가 바뀌지 않았으면 (Project.table_version 이 같으면) 캐시된 결과를 반환
+    """
+    project = await db_executor.run(_readable_project, db, project_id, current_user["user"])
+
+    try:
+        result = await project_correlation(
+            db, project_id, project.table_version, request.method, request.missingValueHandling, request.header
+        )
+        return {"success": True, "result": result}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except SQLAlchemyError as e:
+        logger.error(f"Database error during correlation analysis: {str(e)}")
+        raise HTTPException(status_code=500, detail="Database error occurred")
+
+@router.get("/cache", response_model=dict)
+async def get_statistics_cache_stats(
+    current_user = Depends(get_current_user),
+):
+    """
+    통계 결과 캐시 hit/miss 카운터 조회 (캐시 크기 조정용)
+    """
+    return {"success": True, **statistics_cache.stats()}
+
+@router.get("/workers", response_model=dict)
+async def get_statistics_worker_stats(
+    current_user = Depends(get_current_user),
+):
+    """
+    R 워커 풀 상태와 R 메모리 지표 (Ncells/Vcells, RSS, gc 횟수, 메모리 상한 초과 재시작 수)
+    블로킹 작업용 executor (stats / db / llm / auth) 의 대기열 길이, 실행 중 작업 수, 대기 시간
+    DB 커넥션 풀 (동기/비동기) 의 사용 중 커넥션, overflow, checkout 대기 시간, 느린 checkout/timeout 수
+    표 웹소켓 writer 의 배치 수, 저장한 셀 수, 합쳐진 수정 수
+    """
+    return {"success": True, **memory_stats(), "executors": executor_stats(), "db_pool": pool_stats(),
+            "table_writer": table_writer.stats()}
+
 @router.delete("/{test_id}", response_model=dict)
 async def delete_statistic_result(
     test_id: int,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지정된 test_id에 해당하는 통계 결과(StatisticalTest와 관련 결과)를 삭제하는 엔드포인트.
     해당 테스트가 속한 프로젝트의 소유자만 삭제할 수 있도록 권한을 확인합니다.
     """
     # StatisticalTest 레코드 조회
-    test = db.query(StatisticalTest).filter(StatisticalTest.id == test_id).first()
+    test = await db.get(StatisticalTest, test_id)
     if not test:
         raise HTTPException(status_code=404, detail="Test result not found")
     
     # 테스트가 속한 프로젝트 조회 및 소유자 권한 확인
-    project = db.query(Project).filter(Project.id == test.project_id).first()
+    project = await db.get(Project, test.project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Associated project not found")
     if project.user_id != current_user["user"]:
@@ -297,35 +310,47 @@ async def delete_statistic_result(
     
     # 테스트 유형에 따라 관련 결과 레코드를 먼저 삭제
     if test.test_method == "OneWayANOVA":
-        result_row = db.query(OneWayANOVAResult).filter(
+        result_row = await db.scalar(select(OneWayANOVAResult).where(
             OneWayANOVAResult.statistical_test_id == test_id
-        ).first()
+        ))
     elif test.test_method == "PairedTTest":
-        result_row = db.query(PairedTTestResult).filter(
+        result_row = await db.scalar(select(PairedTTestResult).where(
             PairedTTestResult.statistical_test_id == test_id
-        ).first()
+        ))
     elif test.test_method == "IndependentTTest":
-        result_row = db.query(IndependentTTestResult).filter(
+        result_row = await db.scalar(select(IndependentTTestResult).where(
             IndependentTTestResult.statistical_test_id == test_id
-        ).first()
+        ))
     elif test.test_method == "OneSampleTTest":
-        result_row = db.query(OneSampleTTestResult).filter(
+        result_row = await db.scalar(select(OneSampleTTestResult).where(
             OneSampleTTestResult.statistical_test_id == test_id
-        ).first()
+        ))
+    elif test.test_method == "MannWhitneyU":
+        result_row = await db.scalar(select(MannWhitneyUResult).where(
+            MannWhitneyUResult.statistical_test_id == test_id
+        ))
+    elif test.test_method == "WilcoxonSignedRank":
+        result_row = await db.scalar(select(WilcoxonSignedRankResult).where(
+            WilcoxonSignedRankResult.statistical_test_id == test_id
+        ))
+    elif test.test_method == "KruskalWallis":
+        result_row = await db.scalar(select(KruskalWallisResult).where(
+            KruskalWallisResult.statistical_test_id == test_id
+        ))
     else:
         result_row = None
 
     if result_row:
-        db.delete(result_row)
+        await db.delete(result_row)
     
     # 기본 StatisticalTest 레코드 삭제
-    db.delete(test)
+    await db.delete(test)
     
     try:
-        db.commit()
+        await db.commit()
         return {"success": True, "detail": "Test result deleted successfully"}
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Database error during deletion: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error occurred while deleting test result")
     
@@ -334,19 +359,19 @@ async def rename_statistic_result(
     test_id: int,
     request: RenameStatisticRequest,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     지정된 test_id에 해당하는 통계 결과의 alias(이름)을 변경하는 엔드포인트.
     해당 테스트가 속한 프로젝트의 소유자만 이름을 변경할 수 있습니다.
     """
     # StatisticalTest 레코드 조회
-    test = db.query(StatisticalTest).filter(StatisticalTest.id == test_id).first()
+    test = await db.get(StatisticalTest, test_id)
     if not test:
         raise HTTPException(status_code=404, detail="Test result not found")
     
     # 해당 테스트가 속한 프로젝트 조회 및 소유자 권한 확인
-    project = db.query(Project).filter(Project.id == test.project_id).first()
+    project = await db.get(Project, test.project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Associated project not found")
     if project.user_id != current_user["user"]:
@@ -356,8 +381,8 @@ async def rename_statistic_result(
     test.alias = request.new_alias
     
     try:
-        db.commit()
-        db.refresh(test)
+        await db.commit()
+        await db.refresh(test)
         return {
             "success": True,
             "detail": "Test result renamed successfully",
@@ -365,7 +390,7 @@ async def rename_statistic_result(
             "new_alias": test.alias
         }
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Database error during renaming: {str(e)}")
         raise HTTPException(status_code=500, detail="Database error occurred while renaming test result")
 
@@ -374,9 +399,9 @@ async def rename_statistic_result(
 async def get_statistical_test_ids_by_project(
     project_id: int,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
@@ -385,9 +410,9 @@ async def get_statistical_test_ids_by_project(
     if project.user_id != current_user["user"]:
         raise HTTPException(status_code=403, detail="Not authorized to access this project")
     
-    tests = db.query(StatisticalTest.id, StatisticalTest.alias).filter(
+    tests = (await db.execute(select(StatisticalTest.id, StatisticalTest.alias).where(
         StatisticalTest.project_id == project_id
-    ).all()
+    ))).all()
     
     test_info_list = [{"id": test[0], "alias": test[1] or f"Test {test[0]}"} for test in tests]
     
@@ -402,19 +427,19 @@ async def get_statistical_result(
     project_id: int,
     test_id: int,
     current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
     if project.user_id != current_user['user']:
         raise HTTPException(status_code=403, detail="Not authorized to access this project")
     
-    test = db.query(StatisticalTest).filter(
+    test = await db.scalar(select(StatisticalTest).where(
         StatisticalTest.id == test_id,
         StatisticalTest.project_id == project_id
-    ).first()
+    ))
     
     if not test:
         raise HTTPException(status_code=404, detail="Statistical test not found")
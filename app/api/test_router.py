@@ -2,8 +2,8 @@ from fastapi import APIRouter, WebSocket, Depends, WebSocketDisconnect
 from services import llm_results
 from middleware.auth import get_current_user
 from typing import Dict
-from models import get_db, User
-from sqlalchemy.orm import Session
+from models import get_async_db, User
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,7 +28,7 @@ connected_clients: Dict[str, WebSocket] = {}
 @router.websocket("/ws/test")
 async def websocket_endpoint(
     websocket: WebSocket,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     current_user = await get_current_user(websocket=websocket)
     if not current_user:
@@ -38,7 +38,7 @@ async def websocket_endpoint(
         await websocket.accept()
         
         logger.info(f"current_user: {current_user}")
-        user = db.query(User).filter(User.id == current_user["user"]).first()
+        user = await db.get(User, current_user["user"])
         
         if not user:
             await websocket.close(code=4003, reason="User not found")
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse
 
-from models import get_db, User
+from models import get_async_db, User
 import logging
 from middleware.auth import get_current_user
 
@@ -25,12 +25,12 @@ logger.setLevel(logging.INFO)
 router = APIRouter()
 
 @router.get("/")
-def get_user(
-    db: Session = Depends(get_db),
+async def get_user(
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user)
 ):
     logger.info(f"current_user: {current_user}")
-    user = db.query(User).filter(User.id == current_user["user"]).first()
+    user = await db.get(User, current_user["user"])
     if not user:
         logger.error(f"User not found: {current_user}")
         raise HTTPException(status_code=404, detail="User not found")
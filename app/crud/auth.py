@@ -1,12 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from models import User
 from utils import get_password_hash, verify_password, create_access_token
+from services.executors import auth_executor
 
+# bcrypt 해시/검증은 수백 ms 걸리는 CPU 작업이라 통계 계산과 분리된 auth_executor 에서 실행
 
-def authenticate_user(db: Session, email: str, password: str):
-    user = db.query(User).filter(User.email == email).first()
+
+async def authenticate_user(db: AsyncSession, email: str, password: str):
+    user = await db.scalar(select(User).where(User.email == email))
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -14,7 +18,7 @@ def authenticate_user(db: Session, email: str, password: str):
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    if not verify_password(password, user.password):
+    if not await auth_executor.run(verify_password, password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -23,21 +27,21 @@ def authenticate_user(db: Session, email: str, password: str):
     
     return user
 
-def create_user(db: Session, email: str, password: str):
-    if db.query(User).filter(User.email == email).first():
+async def create_user(db: AsyncSession, email: str, password: str):
+    if await db.scalar(select(User.id).where(User.email == email)):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already exist"
         )
     
-    hashed_password = get_password_hash(password)
+    hashed_password = await auth_executor.run(get_password_hash, password)
     new_user = User(
         email=email,
         password=hashed_password
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     return new_user
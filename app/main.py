@@ -1,9 +1,16 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from api import test_router, auth, project, user, statistics, llm, list, results
-from middleware import auth_middleware
+from api import test_router, auth, project, user, statistics, llm, list, results, health, plots
+from middleware import auth_middleware, route_context_middleware
 from contextlib import asynccontextmanager
 from models import init_db
+from models.base import async_engine
+import asyncio
+from services.rworker import stop_worker_pool
+from services.resampling import shutdown_resampling_pool
+from services.executors import shutdown_executors
+from services.warmup import warm_up
+from services.table_writer import table_writer
 import os
 from dotenv import load_dotenv
 from utils import logger
@@ -13,11 +20,25 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    # 워커 풀 시작 + 엔진 예열은 백그라운드로 진행, 끝나면 /health/ready 가 200
+    warmup_task = asyncio.create_task(warm_up())
     yield
+    if not warmup_task.done():
+        warmup_task.cancel()
+        try:
+            await warmup_task
+        except asyncio.CancelledError:
+            pass
+    await table_writer.close()
+    await stop_worker_pool()
+    shutdown_resampling_pool()
+    shutdown_executors()
+    await async_engine.dispose()
 
 app = FastAPI(lifespan=lifespan)
 
 app.middleware("http")(auth_middleware)
+app.middleware("http")(route_context_middleware)
 
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +72,8 @@ app.include_router(statistics.router, tags=["statistics"], prefix="/statistics")
 app.include_router(llm.router, tags=["llm"], prefix="/llm")
 app.include_router(list.router, tags=["list"], prefix="/list")
 app.include_router(results.router, tags=["results"], prefix="/results")
+app.include_router(health.router, tags=["health"], prefix="/health")
+app.include_router(plots.router, tags=["plots"], prefix="/plots")
 
 if __name__ == "__main__":
     logger.info("starting server")
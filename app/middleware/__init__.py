@@ -1 +1,2 @@
-from .auth import auth_middleware
\ No newline at end of file
+from .auth import auth_middleware
+from .route import route_context_middleware
@@ -28,10 +28,11 @@ ALGORITHM = os.getenv("JWT_ALGORITHM")
 
 async def auth_middleware(request: Request, call_next):
     # 인증 필요x 엔드포인트
-    public_paths = ["/auth/login", "/auth/register", "/auth/send-verification", "/docs", "/openapi.json"]
+    public_paths = ["/auth/login", "/auth/register", "/auth/send-verification", "/docs", "/openapi.json",
+                    "/health/live", "/health/ready"]
     
-    # prefix가 /test or public_paths에 포함되면 인증x
-    if request.url.path.startswith("/test") or request.url.path in public_paths:
+    # prefix가 /test, /plots (<img> 로 불러오므로 토큰 없음, 파일 이름이 내용 해시) or public_paths에 포함되면 인증x
+    if request.url.path.startswith(("/test", "/plots/")) or request.url.path in public_paths:
         response = await call_next(request)
         return response
 
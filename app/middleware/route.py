@@ -0,0 +1,11 @@
+from fastapi import Request
+from models.pool import current_route
+
+
+async def route_context_middleware(request: Request, call_next):
+    # 느린 DB 커넥션 checkout 로그에 어떤 요청이었는지 남기기 위해 요청 경로를 contextvar 에 저장
+    token = current_route.set(f"{request.method} {request.url.path}")
+    try:
+        return await call_next(request)
+    finally:
+        current_route.reset(token)
@@ -1,6 +1,6 @@
-from .base import Base, init_db, get_db
+from .base import Base, init_db, get_db, get_async_db, pool_stats
 from .user import User
 from .project import Project, ProjectPermission
 from .table import TableData
-from .statistical_test import StatisticalTest, OneWayANOVAResult, PairedTTestResult, IndependentTTestResult, OneSampleTTestResult
+from .statistical_test import StatisticalTest, OneWayANOVAResult, PairedTTestResult, IndependentTTestResult, OneSampleTTestResult, MannWhitneyUResult, WilcoxonSignedRankResult, KruskalWallisResult, StatisticalResultCache
 
@@ -1,18 +1,125 @@
+import json
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateColumn
 from utils import logger
+from .pool import MeteredQueuePool, MeteredAsyncQueuePool, pool_options
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL)
+# asyncio 드라이버 (MySQL: aiomysql, 로컬/테스트 SQLite: aiosqlite)
+ASYNC_DRIVERS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
+def to_async_url(url: str) -> str:
+    """DATABASE_URL (mysql+pymysql://, sqlite:// ...) -> 같은 DB 의 asyncio 드라이버 URL"""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return url.render_as_string(hide_password=False)
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+# JSON 컬럼에 저장하는 긴 리스트 (StatisticalTest.value 의 요청 원자료 등) 를 이만큼씩 나눠 인코딩
+JSON_ENCODE_BLOCK = 4096
+
+
+def _json_chunks(value):
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            yield f"{', ' if i else ''}{json.dumps(key)}: "
+            yield from _json_chunks(item)
+        yield "}"
+    elif isinstance(value, list) and len(value) > JSON_ENCODE_BLOCK:
+        yield "["
+        for start in range(0, len(value), JSON_ENCODE_BLOCK):
+            yield f"{', ' if start else ''}{json.dumps(value[start:start + JSON_ENCODE_BLOCK])[1:-1]}"
+        yield "]"
+    else:
+        yield json.dumps(value)
+
+
+def json_serializer(value) -> str:
+    """
+    JSON 컬럼 직렬화, 결과는 json.dumps 와 같음
+    json.dumps 는 끝날 때까지 GIL 을 놓지 않으므로 긴 리스트는 블록 단위로 인코딩해서
+    db_executor 스레드가 큰 요청 값을 저장하는 동안에도 이벤트 루프 스레드가 실행될 수 있게 함
+    """
+    return "".join(_json_chunks(value))
+
+
+engine = create_engine(DATABASE_URL, json_serializer=json_serializer, **pool_options(DATABASE_URL, MeteredQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# 이벤트 루프에서 바로 쓰는 DB 경로 (라우트, 웹소켓)
+# 동기 세션은 executor 스레드에서 실행되는 계산/배경 작업에서만 사용
+async_engine = create_async_engine(ASYNC_DATABASE_URL, json_serializer=json_serializer, **pool_options(ASYNC_DATABASE_URL, MeteredAsyncQueuePool))
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
+def add_missing_columns(bind):
+    """
+    create_all 은 이미 있는 테이블에 나중에 추가된 컬럼 (예: oneway_anova_results.post_hoc) 을 만들지 않으므로
+    모델에는 있고 DB 에는 없는 컬럼을 ALTER TABLE ... ADD COLUMN 으로 추가 (이미 있으면 아무것도 하지 않음)
+    추가되는 컬럼은 기존 행이 있어도 되도록 nullable 이거나 server_default 가 있어야 함
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            ddl = CreateColumn(column).compile(dialect=bind.dialect)
+            with bind.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {bind.dialect.identifier_preparer.format_table(table)} ADD COLUMN {ddl}"))
+            logger.info(f'Added column {table.name}.{column.name}')
+
+
+def create_missing_indexes(bind):
+    """
+    create_all 은 이미 있는 테이블에 나중에 추가된 인덱스 (예: table_data 셀 unique 인덱스) 를 만들지 않으므로 여기서 생성
+    새로 만드는 unique 인덱스는 기존 중복 행 (예전 select-then-insert 경쟁으로 생긴 같은 셀의 여러 행) 을
+    가장 최근 행 (id 최댓값) 만 남기고 지운 뒤 생성, 그래도 실패하면 시작을 중단
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            with bind.begin() as conn:
+                if index.unique and "id" in table.columns:
+                    preparer = bind.dialect.identifier_preparer
+                    name = preparer.format_table(table)
+                    columns = ", ".join(preparer.quote(column.name) for column in index.columns)
+                    # MySQL 은 DELETE 대상 테이블을 서브쿼리에서 직접 읽을 수 없으므로 파생 테이블로 감쌈
+                    deleted = conn.execute(text(
+                        f"DELETE FROM {name} WHERE id NOT IN "
+                        f"(SELECT id FROM (SELECT MAX(id) AS id FROM {name} GROUP BY {columns}) AS latest)"
+                    )).rowcount
+                    if deleted:
+                        logger.warning(f'Removed {deleted} duplicate rows from {table.name} before creating {index.name}')
+                index.create(bind=conn)
+            logger.info(f'Created index {index.name}')
+
+
 def init_db():
     try:
         logger.info('Attempting to connect to database...')
@@ -43,10 +150,26 @@ def init_db():
         logger.error(f'Failed to create database tables: {str(table_error)}')
         raise
 
+    add_missing_columns(engine)
+    create_missing_indexes(engine)
+
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def pool_stats() -> dict:
+    """동기/비동기 엔진 커넥션 풀 상태 (사용 중, overflow, checkout 대기 시간)"""
+    return {
+        "sync": MeteredQueuePool.metrics.stats(engine.pool),
+        "async": MeteredAsyncQueuePool.metrics.stats(async_engine.sync_engine.pool),
+    }
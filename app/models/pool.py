@@ -0,0 +1,108 @@
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dotenv import load_dotenv
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from utils import logger
+
+load_dotenv()
+
+# 커넥션 풀 설정
+# - recycle: MySQL wait_timeout (또는 중간 프록시의 idle timeout) 보다 먼저 커넥션을 새로 열어 "server has gone away" 방지
+# - pre_ping: 꺼낼 때마다 가벼운 ping 으로 끊긴 커넥션을 걸러내고 다시 연결
+# DB_EXECUTOR_WORKERS 기본값이 size + overflow 이므로 같이 조정됨
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# 커넥션을 받기까지 이보다 오래 걸리면 요청 경로와 함께 경고 로그
+DB_SLOW_CHECKOUT_SECONDS = float(os.getenv("DB_SLOW_CHECKOUT_SECONDS", 0.5))
+
+# 미들웨어가 요청마다 "METHOD /path" 를 넣음 (executor 스레드로도 contextvars 가 복사되어 전달)
+current_route: ContextVar[str] = ContextVar("current_route", default="-")
+
+
+class PoolMetrics:
+    """커넥션을 꺼내는 데 걸린 시간 (대기 + pre-ping + 새 연결) 누적/최댓값, 느린 checkout, timeout 수"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.slow_checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            slow = wait >= DB_SLOW_CHECKOUT_SECONDS
+            self.slow_checkouts += slow
+        if slow:
+            logger.warning(f"Slow DB connection checkout ({self.name} pool): {wait:.3f}s "
+                           f"route={current_route.get()}{' (timed out)' if timed_out else ''}")
+
+    def stats(self, pool) -> dict:
+        with self._lock:
+            result = {
+                "checkouts": self.checkouts,
+                "slow_checkouts": self.slow_checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait": self.total_wait / self.checkouts if self.checkouts else 0.0,
+                "max_wait": self.max_wait,
+            }
+        if isinstance(pool, QueuePool):
+            result.update(size=pool.size(), in_use=pool.checkedout(), overflow=max(pool.overflow(), 0),
+                          max_overflow=pool._max_overflow, timeout=pool.timeout())
+        return result
+
+
+class _MeteredPool:
+    # dispose() 로 풀이 다시 만들어져도 유지되도록 지표는 클래스에 둠 (엔진마다 클래스 하나)
+    metrics: PoolMetrics
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+class MeteredQueuePool(_MeteredPool, QueuePool):
+    metrics = PoolMetrics("sync")
+
+
+class MeteredAsyncQueuePool(_MeteredPool, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics("async")
+
+
+def pool_options(url: str, poolclass) -> dict:
+    """
+    create_engine / create_async_engine 에 넘길 풀 옵션
+    인메모리 SQLite 는 커넥션 하나를 공유해야 하므로 SQLAlchemy 기본 풀을 그대로 씀
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
@@ -13,6 +13,8 @@ class Project(Base):
     description = Column(Text)
     created_at = Column(DateTime, default=datetime.now)
     modified_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    # 표 셀이 저장될 때마다 1 씩 증가 (modified_at 은 초 단위라 같은 초의 수정을 구분하지 못하므로 캐시 키에는 이 값을 사용)
+    table_version = Column(Integer, default=0, server_default="0")
     
     user = relationship("User", back_populates="projects")
     permissions = relationship("ProjectPermission", back_populates="project")
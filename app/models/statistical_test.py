@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Float, Boolean, JSON, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Float, Boolean, JSON, Text, DateTime
 from sqlalchemy.orm import relationship
+from datetime import datetime
 from .base import Base
 
 class StatisticalTest(Base):
@@ -10,7 +11,7 @@ class StatisticalTest(Base):
     alias = Column(String(255)) # 그.. 유저한테 보이는 이름?이라 해야하나 그거
     # confidence_level = Column(Float) # 신뢰 수준
     confidence_interval = Column(Float) # 신뢰 수준
-    test_method = Column(String(100)) # 통계 방법 // OneWayANOVA, PairedTTest, IndependentTTest, OneSampleTTest
+    test_method = Column(String(100)) # 통계 방법 // OneWayANOVA, PairedTTest, IndependentTTest, OneSampleTTest, MannWhitneyU, WilcoxonSignedRank, KruskalWallis
     hypothesis = Column(String(100)) # 가설 유형 // RightTailed, TwoTailedSame, TwoTailedDiff, RightTailed, LeftTailed
     missing_value_handling = Column(String(100)) # 결측치 처리 방법 // pairwise, ListwiseDeletion
     mean_difference = Column(Float) # 평균 차이
@@ -37,6 +38,9 @@ class StatisticalTest(Base):
     paired_ttest_results = relationship("PairedTTestResult", back_populates="statistical_test")
     independent_ttest_results = relationship("IndependentTTestResult", back_populates="statistical_test")
     one_sample_ttest_results = relationship("OneSampleTTestResult", back_populates="statistical_test")
+    mann_whitney_results = relationship("MannWhitneyUResult", back_populates="statistical_test")
+    wilcoxon_results = relationship("WilcoxonSignedRankResult", back_populates="statistical_test")
+    kruskal_wallis_results = relationship("KruskalWallisResult", back_populates="statistical_test")
 
 class OneWayANOVAResult(Base):
     __tablename__ = "oneway_anova_results"
@@ -86,6 +90,15 @@ class OneWayANOVAResult(Base):
                 'se': 0.3073181485764296}},
     """
     group_descriptive_stats = Column(JSON)
+
+    """
+    모든 그룹 쌍의 사후검정 (열 단위 리스트, services/posthoc.py)
+    {'group1': [...], 'group2': [...], 'mean_difference': [...], 'conf_level': 0.95,
+     'tukey': {'q', 'p_value', 'ci_lower', 'ci_upper'},
+     'games_howell': {'q', 'df', 'p_value', 'ci_lower', 'ci_upper'},
+     'bonferroni': {'t', 'p_value'}, 'holm': {'p_value'}}
+    """
+    post_hoc = Column(JSON)
         
     statistical_test = relationship("StatisticalTest", back_populates="anova_results")
 
@@ -197,3 +210,90 @@ class OneSampleTTestResult(Base):
     
     statistical_test = relationship("StatisticalTest", back_populates="one_sample_ttest_results")
 
+
+class MannWhitneyUResult(Base):
+    __tablename__ = "mann_whitney_results"
+
+    id = Column(Integer, primary_key=True, index=True)
+    statistical_test_id = Column(Integer, ForeignKey("statistical_tests.id"))
+
+    # test stats
+    w_statistic = Column(Float)
+    z_statistic = Column(Float)
+    p_value = Column(Float)
+    rank_biserial = Column(Float)
+    conf_level = Column(Float)
+
+    # group1 stats
+    group1_name = Column(String(255))
+    stats_group1_n = Column(Float)
+    stats_group1_median = Column(Float)
+    stats_group1_mean_rank = Column(Float)
+
+    # group2 stats
+    group2_name = Column(String(255))
+    stats_group2_n = Column(Float)
+    stats_group2_median = Column(Float)
+    stats_group2_mean_rank = Column(Float)
+
+    statistical_test = relationship("StatisticalTest", back_populates="mann_whitney_results")
+
+class WilcoxonSignedRankResult(Base):
+    __tablename__ = "wilcoxon_signed_rank_results"
+
+    id = Column(Integer, primary_key=True, index=True)
+    statistical_test_id = Column(Integer, ForeignKey("statistical_tests.id"))
+
+    # test stats
+    v_statistic = Column(Float)
+    z_statistic = Column(Float)
+    p_value = Column(Float)
+    rank_biserial = Column(Float)
+    mu = Column(Float)
+    paired = Column(Boolean) # True: 대응표본 (group1 - group2), False: 단일표본 (mu 와 비교)
+    conf_level = Column(Float)
+
+    # diff stats (단일표본은 원래 값)
+    stats_diff_n = Column(Float)
+    stats_diff_n_nonzero = Column(Float) # 차이가 0 인 관측치를 제외한 수
+    stats_diff_median = Column(Float)
+
+    """
+    각 그룹별 통계 (1개 또는 2개)
+    {'group1': {'n': 6.0, 'median': 1.5}, 'group2': {'n': 6.0, 'median': 4.5}}
+    """
+    group_stats = Column(JSON)
+
+    statistical_test = relationship("StatisticalTest", back_populates="wilcoxon_results")
+
+class KruskalWallisResult(Base):
+    __tablename__ = "kruskal_wallis_results"
+
+    id = Column(Integer, primary_key=True, index=True)
+    statistical_test_id = Column(Integer, ForeignKey("statistical_tests.id"))
+
+    h_statistic = Column(Float)
+    df = Column(Integer)
+    p_value = Column(Float)
+    epsilon_squared = Column(Float)
+    conf_level = Column(Float)
+
+    """
+    각 그룹별 통계
+    {'group1': {'n': 6.0, 'median': 1.5, 'mean_rank': 3.75},
+     'group2': {'n': 6.0, 'median': 4.5, 'mean_rank': 9.75},
+     'group3': {'n': 6.0, 'median': 7.0, 'mean_rank': 15.0}}
+    """
+    group_stats = Column(JSON)
+
+    statistical_test = relationship("StatisticalTest", back_populates="kruskal_wallis_results")
+
+
+class StatisticalResultCache(Base):
+    __tablename__ = "statistical_result_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cache_key = Column(String(64), unique=True, index=True) # sha256(test method, hypothesis, conf level, group data)
+    test_method = Column(String(100))
+    result = Column(JSON)
+    created_at = Column(DateTime, default=datetime.now)
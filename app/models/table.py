@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 
 class TableData(Base):
     __tablename__ = "table_data"
+    # 셀 하나당 행 하나, 셀 쓰기 (upsert) 와 프로젝트 단위 조회 모두 이 인덱스를 사용
+    __table_args__ = (
+        Index("ux_table_data_cell", "project_id", "row_num", "col_num", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id"))
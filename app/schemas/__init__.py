@@ -1,5 +1,5 @@
 from .auth import UserCreate, EmailSchema
 from .project import ProjectCreate, ProjectNameUpdate, ProjectUpdate
-from .statistics import StatisticRequest, RenameStatisticRequest, StatisticalTestIdList, StatisticalResultResponse
+from .statistics import StatisticRequest, RenameStatisticRequest, StatisticalTestIdList, StatisticalResultResponse, StatisticBatchRequest, CorrelationRequest
 from .analyze import ExperimentData
 from .llm import llmResultRequest, llmConclusionRequest
\ No newline at end of file
@@ -6,7 +6,9 @@ class BaseStatisticalResult(BaseModel):
     confidence_interval: float
     hypothesis: str
     effect_size: Optional[str] = None
-    normality_satisfied: bool
+    normality_satisfied: Optional[bool] = None
+    homoscedasticity_satisfied: Optional[bool] = None
+    independence_satisfied: Optional[bool] = None
     conclusion: Optional[str]
 
 class ANOVAResult(BaseStatisticalResult):
@@ -38,9 +40,40 @@ class OneSampleTTestResultResponse(BaseStatisticalResult):
     sample_stats: Dict[str, float]
     mu: float
 
+class MannWhitneyUResultResponse(BaseStatisticalResult):
+    w_statistic: float
+    z_statistic: Optional[float] = None
+    p_value: Optional[float] = None
+    rank_biserial: float
+    group1_name: str
+    group2_name: str
+    stats_group1_median: float
+    stats_group2_median: float
+    stats_group1_mean_rank: float
+    stats_group2_mean_rank: float
+
+class WilcoxonSignedRankResultResponse(BaseStatisticalResult):
+    v_statistic: float
+    z_statistic: Optional[float] = None
+    p_value: Optional[float] = None
+    rank_biserial: Optional[float] = None
+    mu: float
+    paired: bool
+    group_stats: Dict[str, Dict[str, float]]
+
+class KruskalWallisResultResponse(BaseStatisticalResult):
+    h_statistic: Optional[float] = None
+    df: int
+    p_value: Optional[float] = None
+    epsilon_squared: Optional[float] = None
+    group_stats: Dict[str, Dict[str, float]]
+
 StatisticalResult = Union[
     ANOVAResult,
     PairedTTestResultResponse,
     IndependentTTestResultResponse,
-    OneSampleTTestResultResponse
+    OneSampleTTestResultResponse,
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
 ] 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import Dict, List, Optional, Union
 
 class TestType(str, Enum):
@@ -7,6 +7,9 @@ class TestType(str, Enum):
     PAIRED_T_TEST = "PairedTTest"
     INDEPENDENT_T_TEST = "IndependentTTest"
     ONE_SAMPLE_T_TEST = "OneSampleTTest"
+    MANN_WHITNEY_U = "MannWhitneyU"
+    WILCOXON_SIGNED_RANK = "WilcoxonSignedRank" # 그룹 1개: 단일표본, 2개: 대응표본
+    KRUSKAL_WALLIS = "KruskalWallis"
 
 class HypothesisType(str, Enum):
     TWO_TAILED_SAME = "TwoTailedSame"
@@ -24,6 +27,51 @@ class EffectSizeType(str, Enum):
     STANDARDIZED_MEAN_DIFFERENCE = "Standardized_Mean_Difference"
     NONE = ""
 
+class StatisticsEngine(str, Enum):
+    R = "r"
+    NUMPY = "numpy"
+
+class CorrelationMethod(str, Enum):
+    PEARSON = "pearson"
+    SPEARMAN = "spearman"
+
+class CorrelationRequest(BaseModel):
+    method: CorrelationMethod = CorrelationMethod.PEARSON
+    missingValueHandling: MissingValueHandling = MissingValueHandling.PAIRWISE
+    header: bool = True # 표의 첫 행을 열 이름으로 사용
+
+class ColumnReference(BaseModel):
+    # 프로젝트 표의 열 참조, col (0부터 시작하는 열 번호) 또는 header (0번 행의 열 이름) 중 하나
+    col: Optional[int] = Field(None, ge=0)
+    header: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_one_reference(self):
+        if (self.col is None) == (self.header is None):
+            raise ValueError("Specify exactly one of col or header")
+        return self
+
+class GroupSummaryInput(BaseModel):
+    # 청크 하나의 요약 (M2 = 평균 편차 제곱합, 또는 표본 표준편차 sd), 같은 그룹의 청크들은 서버에서 합침
+    n: int = Field(ge=1)
+    mean: float
+    m2: Optional[float] = Field(None, ge=0)
+    sd: Optional[float] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def check_spread(self):
+        if (self.m2 is None) == (self.sd is None):
+            raise ValueError("Specify exactly one of m2 or sd")
+        if self.m2 is None:
+            self.m2 = self.sd ** 2 * (self.n - 1)
+        return self
+
+class ResamplingOptions(BaseModel):
+    permutations: int = Field(10000, ge=100, le=1000000) # 최대 순열 수 (p 값 구간이 좁아지면 조기 종료)
+    bootstrap: int = Field(2000, ge=100, le=100000)
+    seed: Optional[int] = Field(None, ge=0) # 같은 seed 면 같은 결과, 없으면 서버가 뽑아서 결과에 남김
+    tolerance: float = Field(0.005, gt=0, lt=0.5) # p 값 99% 구간 반폭
+
 class StatisticRequest(BaseModel):
     test: TestType
     hypothesis: HypothesisType
@@ -33,7 +81,27 @@ class StatisticRequest(BaseModel):
     effectSize: EffectSizeType
     effectSizeValue: float
     descriptiveStats: bool
-    value: Dict[str, List[Union[int, float]]]
+    value: Dict[str, List[Optional[Union[int, float]]]] = {} # 빈 셀은 null, missingValueHandling 으로 처리
+    summaries: Optional[Dict[str, List[GroupSummaryInput]]] = None # value 대신 그룹별 (n, mean, M2) 요약, PairedTTest 는 차이값 (group1 - group2) 요약 하나
+    columns: Optional[Dict[str, ColumnReference]] = None # value 대신 저장된 프로젝트 표의 열 참조
+    tableHeader: bool = True # columns 사용 시 표의 0번 행이 열 이름인지
+    resampling: Optional[ResamplingOptions] = None # IndependentTTest, PairedTTest 의 순열 검정 / 부트스트랩
+    engine: Optional[StatisticsEngine] = None # 없으면 STATISTICS_ENGINE 환경변수 기본값
+
+    @model_validator(mode="after")
+    def check_one_data_source(self):
+        given = [source for source in (self.value, self.summaries, self.columns) if source]
+        if len(given) != 1:
+            raise ValueError("Specify exactly one of value, summaries or columns")
+        if self.summaries and self.resampling is not None:
+            # 순열 검정 / 부트스트랩은 원자료가 필요
+            raise ValueError("resampling requires value or columns, not summaries")
+        return self
+
+class StatisticBatchRequest(BaseModel):
+    requests: List[StatisticRequest] = []
+    allPairs: Optional[StatisticRequest] = None # value 의 모든 그룹 쌍에 대해 같은 검정 실행
+    engine: Optional[StatisticsEngine] = None # engine 이 없는 요청에 쓰는 엔진
 
 class RenameStatisticRequest(BaseModel):
     new_alias: str
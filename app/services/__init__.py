@@ -1,6 +1,7 @@
 from .llm import llm, llm_lite
 from .llm_results import llm_results
 from .llm_conclusions import llm_conclusions
-from .rscripts import one_sample_t_test, independent_t_test, one_way_anova, paired_t_test
+from .stats_engine import get_backend, StatisticsBackend
 from .auth import send_verification_email, verify_and_register, login_user
-from .project import ProjectService
\ No newline at end of file
+from .project import ProjectService
+from .statistics import StatisticsService
@@ -0,0 +1,136 @@
+import math
+import os
+import numpy as np
+from scipy import stats
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 가정 검정 유의수준
+ASSUMPTION_ALPHA = 0.05
+
+# Shapiro-Wilk 에 사용하는 최대 표본 수 (R shapiro.test 상한 5000)
+# 이보다 큰 그룹은 입력 순서에서 등간격으로 뽑은 표본으로 검정해서 시간이 n 에 비례해 늘지 않도록 함
+SHAPIRO_MAX_N = min(int(os.getenv("SHAPIRO_MAX_N", 5000)), 5000)
+
+# Durbin-Watson 통계량이 이 범위 안이면 잔차 자기상관이 없다고 봄
+DURBIN_WATSON_RANGE = (1.5, 2.5)
+
+# 엔진이 그룹마다 반환하는 정규성 필드 / 그룹 뒤에 이어지는 등분산성, 독립성 필드
+NORMALITY_FIELDS = ("w", "p_value", "n_used")
+VARIANCE_FIELDS = ("levene_f", "levene_p_value", "bartlett_k2", "bartlett_p_value", "durbin_watson")
+
+
+def _clean(value):
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def subsample_indices(n: int, max_n: int = SHAPIRO_MAX_N) -> np.ndarray:
+    # R 의 round(seq(1, n, length.out = max_n)) 와 같은 위치 (0 부터 시작)
+    return np.round(np.linspace(0, n - 1, max_n)).astype(np.intp)
+
+
+def shapiro_wilk(x: np.ndarray, max_n: int = SHAPIRO_MAX_N) -> tuple:
+    """(W, p, 검정에 사용한 n), 검정할 수 없으면 W, p 는 nan"""
+    n = x.size
+    if n < 3 or np.ptp(x) == 0:
+        return float("nan"), float("nan"), float(n)
+    if n > max_n:
+        x = x[subsample_indices(n, max_n)]
+    w, p_value = stats.shapiro(x)
+    return float(w), float(p_value), float(x.size)
+
+
+def durbin_watson(residuals: np.ndarray) -> float:
+    denominator = float(np.sum(residuals * residuals))
+    if denominator == 0:
+        return float("nan")
+    return float(np.sum(np.diff(residuals) ** 2) / denominator)
+
+
+def bartlett_from_variances(sizes, variances) -> tuple:
+    """그룹별 n, 분산만으로 Bartlett K2 (요약 통계 모드용)"""
+    sizes = np.asarray(sizes, dtype=np.float64)
+    variances = np.asarray(variances, dtype=np.float64)
+    k = sizes.size
+    if k < 2 or np.any(variances <= 0):
+        return float("nan"), float("nan")
+    dof = sizes - 1
+    total_dof = float(np.sum(dof))
+    pooled = float(np.sum(dof * variances)) / total_dof
+    numerator = total_dof * math.log(pooled) - float(np.sum(dof * np.log(variances)))
+    denominator = 1 + (float(np.sum(1 / dof)) - 1 / total_dof) / (3 * (k - 1))
+    k2 = numerator / denominator
+    return float(k2), float(stats.chi2.sf(k2, k - 1))
+
+
+def compute_values(groups: list) -> list:
+    """
+    NumPy 엔진용: R 의 assumption_checks 와 같은 순서의 값 목록
+    groups: 검정 대상 배열들 (잔차는 그룹 평균과의 차이를 입력 순서대로 이어 붙인 것)
+    """
+    values = []
+    for x in groups:
+        values.extend(shapiro_wilk(x))
+
+    if len(groups) > 1 and all(x.size > 1 for x in groups):
+        levene_f, levene_p = stats.levene(*groups, center="median")
+        if all(np.ptp(x) > 0 for x in groups):
+            bartlett_k2, bartlett_p = stats.bartlett(*groups)
+        else:
+            bartlett_k2, bartlett_p = float("nan"), float("nan")
+    else:
+        levene_f = levene_p = bartlett_k2 = bartlett_p = float("nan")
+
+    residuals = np.concatenate([x - np.mean(x) for x in groups])
+    values.extend([levene_f, levene_p, bartlett_k2, bartlett_p, durbin_watson(residuals)])
+    return [float(value) for value in values]
+
+
+def build_assumptions(group_names: list, values, alpha: float = ASSUMPTION_ALPHA) -> dict:
+    """
+    엔진이 반환한 값 목록 (그룹별 NORMALITY_FIELDS + VARIANCE_FIELDS) -> 결과 dict 의 assumptions 섹션
+    satisfied 는 판단할 수 없으면 None
+    """
+    normality = {}
+    for i, name in enumerate(group_names):
+        offset = i * len(NORMALITY_FIELDS)
+        w, p_value, n_used = (_clean(values[offset + j]) for j in range(len(NORMALITY_FIELDS)))
+        normality[name] = {"w": w, "p_value": p_value, "n_used": int(n_used) if n_used is not None else None}
+
+    offset = len(group_names) * len(NORMALITY_FIELDS)
+    levene_f, levene_p, bartlett_k2, bartlett_p, dw = (
+        _clean(values[offset + j]) for j in range(len(VARIANCE_FIELDS))
+    )
+
+    normality_p = [stats_["p_value"] for stats_ in normality.values() if stats_["p_value"] is not None]
+    normality_satisfied = all(p > alpha for p in normality_p) if normality_p else None
+
+    homoscedasticity_p = levene_p if levene_p is not None else bartlett_p
+    homoscedasticity_satisfied = homoscedasticity_p > alpha if homoscedasticity_p is not None else None
+
+    independence_satisfied = DURBIN_WATSON_RANGE[0] <= dw <= DURBIN_WATSON_RANGE[1] if dw is not None else None
+
+    return {
+        "alpha": alpha,
+        "normality": {
+            "method": "Shapiro-Wilk",
+            "max_n": SHAPIRO_MAX_N,
+            "groups": normality,
+            "satisfied": normality_satisfied,
+        },
+        "homoscedasticity": {
+            "levene_f": levene_f,
+            "levene_p_value": levene_p,
+            "bartlett_k2": bartlett_k2,
+            "bartlett_p_value": bartlett_p,
+            "satisfied": homoscedasticity_satisfied,
+        },
+        "independence": {
+            "durbin_watson": dw,
+            "satisfied": independence_satisfied,
+        },
+    }
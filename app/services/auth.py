@@ -4,11 +4,13 @@ import string
 from fastapi import HTTPException, status
 from fastapi_mail import FastMail, MessageSchema
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from utils import create_access_token
 from crud import authenticate_user, create_user
-from models import get_db, User
+from models import User
+from models.base import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +33,8 @@ async def send_verification_email(email: str, mail_config) -> dict:
     if "@" not in email:
         raise HTTPException(status_code=400, detail="Invalid email format")
     
-    db = next(get_db())
-    existing_user = db.query(User).filter(User.email == email).first()
+    async with AsyncSessionLocal() as db:
+        existing_user = await db.scalar(select(User.id).where(User.email == email))
     if existing_user:
         raise HTTPException(
             status_code=400,
@@ -69,7 +71,7 @@ async def send_verification_email(email: str, mail_config) -> dict:
     await fm.send_message(message)
     return {"success": True, "detail": "Verification code sent"}
 
-def verify_and_register(email: str, password: str, verification_code: str, db: Session) -> dict:
+async def verify_and_register(email: str, password: str, verification_code: str, db: AsyncSession) -> dict:
     stored_data = verification_codes.get(email)
     if not stored_data:
         raise HTTPException(
@@ -90,7 +92,7 @@ def verify_and_register(email: str, password: str, verification_code: str, db: S
             detail="Verification code expired"
         )
     
-    new_user = create_user(db, email, password)
+    new_user = await create_user(db, email, password)
     access_token = create_access_token(
         data={"user": new_user.id}
     )
@@ -98,8 +100,8 @@ def verify_and_register(email: str, password: str, verification_code: str, db: S
     verification_codes.pop(email, None)
     return {"success": True, "token": access_token, "detail": "User created successfully"}
 
-def login_user(username: str, password: str, db: Session) -> dict:
-    user = authenticate_user(db, username, password)
+async def login_user(username: str, password: str, db: AsyncSession) -> dict:
+    user = await authenticate_user(db, username, password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,188 @@
+import hashlib
+import logging
+import math
+import warnings
+import numpy as np
+from scipy import stats
+from sqlalchemy.orm import Session
+from .stats_cache import StatisticsCache, STATS_CACHE_SIZE
+from .table import load_versioned_table
+from .executors import db_executor, stats_executor
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+# 프로젝트 표 (TableData) 의 숫자 열 전체에 대한 상관행렬
+# 표를 한 번 읽어서 열 우선 float 행렬 + 결측 마스크를 만든 뒤 행렬곱 몇 번으로 모든 쌍을 계산
+# 결과는 표 버전 (Project.table_version, 셀이 저장될 때마다 증가) 을 키에 넣어 캐시
+
+CORRELATION_METHODS = ("pearson", "spearman")
+
+# 스피어만에서 쌍의 공통 행 안에서 다시 순위를 매길 때 한 번에 처리하는 (행 x 쌍) 원소 수 상한
+SPEARMAN_BLOCK_ELEMENTS = 4_000_000
+
+# 메모리 전용 (표가 바뀌면 키가 달라지므로 DB 에 남길 필요 없음)
+correlation_cache = StatisticsCache(max_entries=STATS_CACHE_SIZE, persistent=False)
+
+
+def _pairwise_pearson(values: np.ndarray, observed: np.ndarray) -> tuple:
+    """
+    쌍마다 두 열이 모두 관측된 행만 사용한 Pearson r 과 n (R 의 use = "pairwise.complete.obs")
+    마스크 행렬곱으로 쌍별 합/제곱합을 한 번에 계산
+    """
+    mask = observed.astype(np.float64)
+    # 상쇄 오차를 줄이기 위해 열 평균으로 먼저 중심화
+    with warnings.catch_warnings():
+        # 관측치가 없는 열 (목록별 삭제 후 남은 행이 없을 때) 의 평균은 nan -> 아래에서 0 으로 채워짐
+        warnings.simplefilter("ignore", RuntimeWarning)
+        centered = values - np.nanmean(values, axis=0) if values.size else values
+    z = np.where(observed, centered, 0.0)
+
+    n = mask.T @ mask
+    sums = z.T @ mask               # sums[i, j]: j 도 관측된 행에서 열 i 의 합
+    squares = (z * z).T @ mask
+    products = z.T @ z
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = products - sums * sums.T / n
+        variance_i = squares - sums * sums / n
+        variance_j = variance_i.T
+        r = covariance / np.sqrt(variance_i * variance_j)
+    return np.clip(r, -1.0, 1.0), n
+
+
+def _average_ranks(x: np.ndarray) -> np.ndarray:
+    """
+    행마다 평균 순위 (동점은 평균, rankdata(method="average") 와 같음)
+    정렬 한 번 + 누적 최대/최소로 동점 구간의 처음/끝 위치를 구함 (행 단위 Python 반복 없음)
+    """
+    n = x.shape[1]
+    order = np.argsort(x, axis=1)
+    ordered = np.take_along_axis(x, order, axis=1)
+    starts = np.ones(x.shape, dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    ends = np.ones(x.shape, dtype=bool)
+    ends[:, :-1] = starts[:, 1:]
+    position = np.arange(n)
+    first = np.maximum.accumulate(np.where(starts, position, 0), axis=1)
+    last = np.minimum.accumulate(np.where(ends, position, n - 1)[:, ::-1], axis=1)[:, ::-1]
+    ranks = np.empty(x.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=1)
+    return ranks
+
+
+def _subset_spearman(values: np.ndarray, observed: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    쌍 (a[k], b[k]) 마다 두 열이 모두 관측된 행 안에서 다시 매긴 순위의 Pearson r
+    쌍들을 (쌍, 행) 행렬로 모아서 모든 쌍의 순위를 한 번에 매기고 행 단위로 r 계산
+    (쌍 수 x 행 수) 가 SPEARMAN_BLOCK_ELEMENTS 를 넘으면 쌍을 블록으로 나눠 반복
+    """
+    # 결측은 inf 로 두면 맨 뒤로 정렬되므로 관측된 값의 순위에 영향을 주지 않음
+    values_t = np.where(observed, values, np.inf).T
+    observed_t = observed.T
+    r = np.empty(a.size)
+    step = max(1, SPEARMAN_BLOCK_ELEMENTS // max(values.shape[0], 1))
+    for start in range(0, a.size, step):
+        rows_a, rows_b = a[start:start + step], b[start:start + step]
+        both = observed_t[rows_a] & observed_t[rows_b]
+        x = _average_ranks(np.where(both, values_t[rows_a], np.inf))
+        y = _average_ranks(np.where(both, values_t[rows_b], np.inf))
+        # 공통 행 안의 순위 평균은 (n + 1) / 2
+        middle = ((both.sum(axis=1) + 1) / 2)[:, None]
+        x = np.where(both, x - middle, 0.0)
+        y = np.where(both, y - middle, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pair_r = (x * y).sum(axis=1) / np.sqrt((x * x).sum(axis=1) * (y * y).sum(axis=1))
+        r[start:start + step] = np.clip(pair_r, -1.0, 1.0)
+    return r
+
+
+def correlation_matrix(values: np.ndarray, observed: np.ndarray, method: str = "pearson",
+                       missing: str = "pairwise") -> dict:
+    """
+    values: (행, 열) 행렬, observed: 같은 모양의 관측 마스크
+    missing: pairwise (쌍마다 두 열이 모두 있는 행) / ListwiseDeletion (모든 열이 있는 행만)
+    p 값은 R cor.test 와 같은 t = r sqrt((n - 2) / (1 - r^2)), df = n - 2 근사
+    """
+    method = getattr(method, "value", method)
+    missing = getattr(missing, "value", missing)
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unsupported correlation method: {method}")
+
+    if missing == "ListwiseDeletion":
+        complete = observed.all(axis=1)
+        values = values[complete]
+        observed = observed[complete]
+
+    if method == "spearman":
+        # 열마다 관측된 값끼리 평균 순위, 결측은 nan 으로 유지
+        ranked = stats.rankdata(np.where(observed, values, np.nan), axis=0, nan_policy="omit")
+        r, n = _pairwise_pearson(ranked, observed)
+        # 쌍의 공통 행이 열 전체 관측보다 적으면 그 행들 안에서 다시 순위를 매겨야 R 과 같음
+        column_n = np.diag(n)
+        i, j = np.triu_indices(n.shape[0], 1)
+        subset = (n[i, j] < column_n[i]) | (n[i, j] < column_n[j])
+        if subset.any():
+            a, b = i[subset], j[subset]
+            r[a, b] = r[b, a] = _subset_spearman(values, observed, a, b)
+    else:
+        r, n = _pairwise_pearson(values, observed)
+
+    df = n - 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = r * np.sqrt(df / (1 - r * r))
+        p_value = np.where(df > 0, 2 * stats.t.sf(np.abs(t), np.maximum(df, 1)), np.nan)
+    np.fill_diagonal(r, 1.0)
+    np.fill_diagonal(p_value, 0.0)
+
+    return {"r": r, "p_value": p_value, "n": n.astype(np.int64), "rows": int(values.shape[0])}
+
+
+def _to_json_matrix(matrix: np.ndarray) -> list:
+    # 계산할 수 없는 쌍 (nan) 은 None
+    return [[None if math.isnan(value) else value for value in row] for row in matrix.tolist()]
+
+
+def make_correlation_key(project_id: int, table_version, method: str, missing: str, header: bool) -> str:
+    parts = [str(project_id), str(table_version), getattr(method, "value", method),
+             getattr(missing, "value", missing), str(bool(header))]
+    return hashlib.sha256("|".join(["correlation"] + parts).encode("utf-8")).hexdigest()
+
+
+async def project_correlation(db: Session, project_id: int, table_version, method: str = "pearson",
+                              missing: str = "pairwise", header: bool = True) -> dict:
+    """
+    table_version (호출한 쪽이 읽은 버전) 의 결과가 캐시에 있으면 표를 다시 읽지 않음
+    없으면 버전과 표를 한 트랜잭션에서 다시 읽고 그 버전으로 캐시 (읽는 중에 수정이 저장됐으면 캐시하지 않음)
+    표 읽기는 db_executor, 행렬 계산은 stats_executor 에서 실행
+    """
+    cached = correlation_cache.get(make_correlation_key(project_id, table_version, method, missing, header))
+    if cached is not None:
+        return cached
+
+    table_version, columns, values, observed = await db_executor.run(load_versioned_table, db, project_id, header)
+    computed = await stats_executor.run(correlation_matrix, values, observed, method, missing)
+    result = {
+        "columns": columns,
+        "method": getattr(method, "value", method),
+        "missing_value_handling": getattr(missing, "value", missing),
+        "rows": computed["rows"],
+        "n": computed["n"].tolist(),
+        "r": _to_json_matrix(computed["r"]),
+        "p_value": _to_json_matrix(computed["p_value"]),
+        "table_version": str(table_version) if table_version is not None else None,
+    }
+    if table_version is not None:
+        correlation_cache.put(make_correlation_key(project_id, table_version, method, missing, header), "Correlation", result)
+    logger.info(f"correlation matrix computed: project {project_id}, {len(columns)} columns")
+    return result
@@ -0,0 +1,173 @@
+import numpy as np
+from scipy import stats
+
+# 검정 결과(test_stats)만으로 효과 크기와 비중심 t/F 분포 기반 신뢰구간 계산
+# 엔진(R/numpy/요약 통계)과 무관하게 같은 결과 dict 에서 계산하므로 엔진 왕복이 추가되지 않음
+# 배치는 검정 종류별로 모아서 한 번에 계산 (비중심 모수 탐색을 배열로 이분법)
+
+BISECTION_STEPS = 100
+
+T_TESTS = ("IndependentTTest", "PairedTTest", "OneSampleTTest")
+
+# 요청의 effectSize -> effect_sizes 섹션의 키
+EFFECT_SIZE_KEYS = {
+    "Cohens_D": "cohens_d",
+    "Standardized_Mean_Difference": "hedges_g",
+    "Eta_Squared": "eta_squared",
+}
+
+
+def _tail_safe(cdf, center: np.ndarray):
+    # scipy 의 비중심 분포 cdf 는 먼 꼬리에서 nan 을 반환할 때가 있음 -> 꼬리 방향의 극한값(0/1)으로 대체
+    def safe_cdf(ncp):
+        p = cdf(ncp)
+        return np.where(np.isnan(p), (ncp < center).astype(np.float64), p)
+    return safe_cdf
+
+
+def _solve_ncp(cdf, target: np.ndarray, start: np.ndarray, lower: float = -np.inf) -> np.ndarray:
+    """
+    cdf(ncp) == target 인 ncp 를 원소별로 탐색 (cdf 는 ncp 에 대해 단조 감소)
+    lower 에서도 cdf 가 target 보다 작으면 lower 를 반환
+    """
+    lo = np.maximum(start - 1.0, lower)
+    hi = start + 1.0
+    step = np.full_like(start, 1.0)
+    for _ in range(64):
+        expand = (cdf(lo) < target) & (lo > lower)
+        if not expand.any():
+            break
+        lo = np.where(expand, np.maximum(lo - step, lower), lo)
+        step = np.where(expand, step * 2, step)
+    step = np.full_like(start, 1.0)
+    for _ in range(64):
+        expand = cdf(hi) > target
+        if not expand.any():
+            break
+        hi = np.where(expand, hi + step, hi)
+        step = np.where(expand, step * 2, step)
+
+    at_lower = cdf(lo) < target
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        above = cdf(mid) > target
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return np.where(at_lower, lo, (lo + hi) / 2)
+
+
+def _ncp_interval(cdf, observed: np.ndarray, conf_level: np.ndarray, lower: float = -np.inf):
+    alpha = 1 - conf_level
+    cdf = _tail_safe(cdf, observed)
+    ncp_lower = _solve_ncp(cdf, 1 - alpha / 2, observed, lower)
+    ncp_upper = _solve_ncp(cdf, alpha / 2, observed, lower)
+    # 분산이 0 이라 검정 통계량이 정의되지 않으면 구간도 nan
+    undefined = ~np.isfinite(observed)
+    return np.where(undefined, np.nan, ncp_lower), np.where(undefined, np.nan, ncp_upper)
+
+
+def _t_inputs(test_method: str, result: dict) -> tuple:
+    """(t, df, d 로 바꾸는 배율)"""
+    test_stats = result["test_stats"]
+    if test_method == "IndependentTTest":
+        n1, n2 = result["group1_stats"]["n"], result["group2_stats"]["n"]
+        return test_stats["t_statistic"], test_stats["degrees_of_freedom"], np.sqrt(1 / n1 + 1 / n2)
+    if test_method == "PairedTTest":
+        return test_stats["t_statistic"], test_stats["df"], 1 / np.sqrt(result["diff_stats"]["n"])
+    return test_stats["t_statistic"], test_stats["df"], 1 / np.sqrt(result["group_stats"]["stats_n"])
+
+
+def t_effect_sizes(t, df, scale, conf_level) -> list:
+    """
+    t 검정 효과 크기 (배열 입력)
+    - Cohen's d = t * scale (독립표본: pooled sd, 대응/단일표본: d_z)
+    - Hedges' g = d * J, J = 1 - 3 / (4 df - 1)
+    - eta^2 = t^2 / (t^2 + df)
+    신뢰구간은 비중심 t 분포의 비중심 모수 구간을 scale 로 변환
+    """
+    t, df, scale, conf_level = (np.asarray(v, dtype=np.float64) for v in (t, df, scale, conf_level))
+    ncp_lower, ncp_upper = _ncp_interval(lambda ncp: stats.nct.cdf(t, df, ncp), t, conf_level)
+
+    d = t * scale
+    correction = 1 - 3 / (4 * df - 1)
+    eta_squared = t * t / (t * t + df)
+    return [
+        {
+            "cohens_d": float(d[i]),
+            "cohens_d_ci_lower": float(ncp_lower[i] * scale[i]),
+            "cohens_d_ci_upper": float(ncp_upper[i] * scale[i]),
+            "hedges_g": float(d[i] * correction[i]),
+            "hedges_g_ci_lower": float(ncp_lower[i] * scale[i] * correction[i]),
+            "hedges_g_ci_upper": float(ncp_upper[i] * scale[i] * correction[i]),
+            "eta_squared": float(eta_squared[i]),
+            "conf_level": float(conf_level[i]),
+        }
+        for i in range(t.size)
+    ]
+
+
+def anova_effect_sizes(f, df1, df2, between_sum_sq, total_sum_sq, within_mean_sq, conf_level) -> list:
+    """
+    일원분산분석 효과 크기 (배열 입력)
+    - eta^2 = SSb / SSt, omega^2 = (SSb - df1 MSw) / (SSt + MSw), Cohen's f = sqrt(eta^2 / (1 - eta^2))
+    eta^2 신뢰구간은 비중심 F 분포의 비중심 모수 lambda 구간에서 lambda / (lambda + N)
+    """
+    f, df1, df2, between_sum_sq, total_sum_sq, within_mean_sq, conf_level = (
+        np.asarray(v, dtype=np.float64)
+        for v in (f, df1, df2, between_sum_sq, total_sum_sq, within_mean_sq, conf_level)
+    )
+    ncp_lower, ncp_upper = _ncp_interval(
+        lambda ncp: stats.ncf.cdf(f, df1, df2, ncp), np.maximum(f * df1 - df1, 0), conf_level, lower=0.0
+    )
+
+    n = df1 + df2 + 1
+    eta_squared = between_sum_sq / total_sum_sq
+    omega_squared = (between_sum_sq - df1 * within_mean_sq) / (total_sum_sq + within_mean_sq)
+    return [
+        {
+            "eta_squared": float(eta_squared[i]),
+            "eta_squared_ci_lower": float(ncp_lower[i] / (ncp_lower[i] + n[i])),
+            "eta_squared_ci_upper": float(ncp_upper[i] / (ncp_upper[i] + n[i])),
+            "omega_squared": float(omega_squared[i]),
+            "cohens_f": float(np.sqrt(eta_squared[i] / (1 - eta_squared[i]))),
+            "conf_level": float(conf_level[i]),
+        }
+        for i in range(f.size)
+    ]
+
+
+def add_effect_sizes(test_methods: list, results: list) -> list:
+    """
+    결과 dict 마다 effect_sizes 섹션을 추가 (검정 종류별로 묶어서 한 번에 계산)
+    """
+    test_methods = [getattr(test_method, "value", test_method) for test_method in test_methods]
+
+    # 비모수 검정은 엔진이 순위 기반 효과 크기 (rank_biserial, epsilon_squared) 를 test_stats 에 넣음
+    anova = [i for i, test_method in enumerate(test_methods) if test_method == "OneWayANOVA"]
+    t_tests = [i for i, test_method in enumerate(test_methods) if test_method in T_TESTS]
+
+    if t_tests:
+        t, df, scale = zip(*(_t_inputs(test_methods[i], results[i]) for i in t_tests))
+        conf_level = [results[i]["test_stats"]["conf_level"] for i in t_tests]
+        for i, effect_sizes in zip(t_tests, t_effect_sizes(t, df, scale, conf_level)):
+            results[i]["effect_sizes"] = effect_sizes
+
+    if anova:
+        test_stats = [results[i]["test_stats"] for i in anova]
+        computed = anova_effect_sizes(*(
+            [s[key] for s in test_stats]
+            for key in ("between_f", "between_df", "within_df", "between_sum_sq", "total_sum_sq",
+                        "within_mean_sq", "conf_level")
+        ))
+        for i, effect_sizes in zip(anova, computed):
+            results[i]["effect_sizes"] = effect_sizes
+
+    return results
+
+
+def selected_effect_size(effect_size: str, result: dict):
+    """요청한 effectSize 에 해당하는 값, 없으면 None"""
+    key = EFFECT_SIZE_KEYS.get(getattr(effect_size, "value", effect_size))
+    if key is None:
+        return None
+    return (result.get("effect_sizes") or {}).get(key)
@@ -0,0 +1,149 @@
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dotenv import load_dotenv
+from models.pool import DB_POOL_SIZE, DB_MAX_OVERFLOW
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# async 핸들러에서 블로킹 작업 (통계 계산/프로세스 내부 R, 동기 DB 세션, LLM 호출, 비밀번호 해시) 을 이벤트 루프 밖에서 실행
+# 종류마다 전용 스레드 풀을 따로 두어서 느린 LLM 호출이 DB 나 계산 작업의 자리를 차지하지 않도록 함
+# 스레드 수가 곧 동시 실행 한도이고 나머지는 풀 안에서 대기 (queued)
+
+_CPU_COUNT = os.cpu_count() or 1
+STATS_EXECUTOR_WORKERS = int(os.getenv("STATS_EXECUTOR_WORKERS", _CPU_COUNT))
+# 동기 엔진 커넥션 풀 (size + overflow) 을 넘지 않도록
+DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", DB_POOL_SIZE + DB_MAX_OVERFLOW))
+LLM_EXECUTOR_WORKERS = int(os.getenv("LLM_EXECUTOR_WORKERS", 8))
+# 비밀번호 해시 (bcrypt) 는 CPU 작업이라 통계 계산과 자리를 나누지 않도록 작은 풀을 따로 둠
+AUTH_EXECUTOR_WORKERS = int(os.getenv("AUTH_EXECUTOR_WORKERS", 2))
+
+
+class BoundedExecutor:
+    """
+    이름 있는 스레드 풀 + 대기열 지표
+    - max_workers: 동시에 실행되는 작업 수 한도
+    - queued / active / max_queued, 대기 시간 (작업이 스레드를 받기까지) 누적과 최댓값
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(max_workers, 1)
+        self._executor = None
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{self.name}-executor")
+        return self._executor
+
+    def _call(self, submitted: float, started: list, function, args, kwargs):
+        wait = time.perf_counter() - submitted
+        with self._lock:
+            # 취소 처리와 동시에 시작될 수 있으므로 먼저 표시한 쪽만 대기열에서 뺌
+            if not started:
+                started.append(True)
+                self.queued -= 1
+            self.active += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+        failed = False
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+                self.failed += failed
+
+    async def run(self, function, *args, **kwargs):
+        """function(*args, **kwargs) 를 이 풀에서 실행하고 결과를 기다림 (contextvars 유지)"""
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        started = []
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, self._call, time.perf_counter(), started, function, args, kwargs)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), call)
+        except asyncio.CancelledError:
+            # 시작 전에 취소된 작업은 실행되지 않으므로 여기서 대기열에서 뺌 (실행 중이었다면 _call 이 정리함)
+            with self._lock:
+                if not started:
+                    started.append(True)
+                    self.queued -= 1
+            raise
+
+    def offload(self, function):
+        """
+        동기 라우트 핸들러를 이 풀에서 실행하는 async 핸들러로 감쌈
+        functools.wraps 로 원래 시그니처를 유지하므로 FastAPI 의 의존성 주입은 그대로 동작
+        """
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            return await self.run(function, *args, **kwargs)
+        return wrapper
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "active": self.active,
+                "max_queued": self.max_queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "avg_wait": self.total_wait / self.completed if self.completed else 0.0,
+                "max_wait": self.max_wait,
+            }
+
+
+stats_executor = BoundedExecutor("stats", STATS_EXECUTOR_WORKERS)
+db_executor = BoundedExecutor("db", DB_EXECUTOR_WORKERS)
+llm_executor = BoundedExecutor("llm", LLM_EXECUTOR_WORKERS)
+auth_executor = BoundedExecutor("auth", AUTH_EXECUTOR_WORKERS)
+
+EXECUTORS = (stats_executor, db_executor, llm_executor, auth_executor)
+
+
+def executor_stats() -> dict:
+    return {executor.name: executor.stats() for executor in EXECUTORS}
+
+
+def shutdown_executors():
+    for executor in EXECUTORS:
+        executor.shutdown()
+    logger.info("executors shut down")
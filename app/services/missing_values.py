@@ -0,0 +1,61 @@
+import numpy as np
+
+# 결측치 (None / NaN) 처리
+# 그룹들을 (그룹, 행) 행렬 하나와 관측 마스크로 만든 뒤 마스크 연산만으로 삭제할 행을 정함
+# 리스트 길이가 다르면 짧은 그룹의 끝 이후는 결측이 아니라 행이 없는 것으로 봄
+
+DEFAULT_MISSING_VALUE_HANDLING = "pairwise"
+
+# 같은 행이 한 쌍이라 pairwise 여도 행 단위로 지워야 하는 검정
+PAIRED_TESTS = ("PairedTTest", "WilcoxonSignedRank")
+
+# 요청 JSON 의 리스트를 float 로 바꾸는 동안은 GIL 을 놓지 않으므로 이만큼씩 나눠 변환
+# (executor 스레드가 큰 리스트를 변환하는 동안에도 이벤트 루프 스레드가 중간중간 실행됨)
+CONVERT_BLOCK = 65536
+
+
+def _fill_row(row: np.ndarray, values):
+    if isinstance(values, np.ndarray):
+        row[:] = values
+        return
+    for start in range(0, len(values), CONVERT_BLOCK):
+        row[start:start + CONVERT_BLOCK] = values[start:start + CONVERT_BLOCK]
+
+
+def mask_matrix(groups_data: dict) -> tuple:
+    """
+    (값 행렬 (그룹, 행) float, 행 존재 마스크, 관측 마스크)
+    None 은 float 변환 시 nan 이 됨
+    """
+    lengths = np.array([len(values) for values in groups_data.values()])
+    n = int(lengths.max()) if lengths.size else 0
+    matrix = np.full((lengths.size, n), np.nan)
+    for i, values in enumerate(groups_data.values()):
+        _fill_row(matrix[i, :lengths[i]], values)
+    present = np.arange(n)[None, :] < lengths[:, None]
+    observed = present & ~np.isnan(matrix)
+    return matrix, present, observed
+
+
+def apply_missing_value_handling(groups_data: dict, test_method: str,
+                                 missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING) -> dict:
+    """
+    결측을 지운 {그룹: float 배열} 반환 (그룹 순서 유지)
+    - ListwiseDeletion 또는 대응 검정: 한 그룹이라도 결측인 행을 모든 그룹에서 삭제 (행 정렬 유지)
+    - pairwise: 그룹마다 자기 결측만 삭제
+    """
+    test_method = getattr(test_method, "value", test_method)
+    missing_value_handling = getattr(missing_value_handling, "value", missing_value_handling)
+    names = list(groups_data)
+    matrix, present, observed = mask_matrix(groups_data)
+
+    if not np.any(present & ~observed):
+        # 결측이 없으면 복사 없이 그대로
+        return {name: matrix[i, :np.count_nonzero(present[i])] for i, name in enumerate(names)}
+
+    if missing_value_handling == "ListwiseDeletion" or (test_method in PAIRED_TESTS and len(names) > 1):
+        complete = np.all(observed | ~present, axis=0)
+        keep = present & complete[None, :]
+    else:
+        keep = observed
+    return {name: matrix[i, keep[i]] for i, name in enumerate(names)}
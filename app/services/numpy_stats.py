@@ -0,0 +1,439 @@
+import numpy as np
+from scipy import stats
+import logging
+from . import assumptions
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+
+logger.info("numpy_stats initialized")
+
+# rscripts.py 와 동일한 결과 dict 를 반환하는 NumPy/SciPy 구현
+# R 을 거치지 않으므로 인터프리터 parse/eval 비용이 없음
+
+def _normalize_conf_level(conf_level: float) -> float:
+    if conf_level > 1:
+        return conf_level / 100
+    return conf_level
+
+def _as_array(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+def _desc_stats(x: np.ndarray) -> dict:
+    # rscripts 의 desc_stats 와 동일 (sd 는 n-1 기준)
+    n = x.size
+    sd = float(np.std(x, ddof=1)) if n > 1 else float("nan")
+    return {
+        'n': float(n),
+        'mean': float(np.mean(x)),
+        'sd': sd,
+        'se': float(sd / np.sqrt(n)),
+        'min': float(np.min(x)),
+        'max': float(np.max(x)),
+        'median': float(np.median(x))
+    }
+
+def _two_sided_t(t_statistic: float, df: float) -> float:
+    return float(2 * stats.t.sf(abs(t_statistic), df))
+
+def _t_conf_int(estimate: float, se: float, df: float, conf_level: float):
+    margin = stats.t.ppf(1 - (1 - conf_level) / 2, df) * se
+    return float(estimate - margin), float(estimate + margin)
+
+def independent_t_test(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) != 2:
+        raise ValueError("Exactly two groups must be provided")
+
+    group1, group2 = list(groups_data.keys())
+    x = _as_array(groups_data[group1])
+    y = _as_array(groups_data[group2])
+
+    # t.test(var.equal = TRUE) 와 동일한 pooled variance
+    n1, n2 = x.size, y.size
+    degrees_of_freedom = float(n1 + n2 - 2)
+    pooled_var = ((n1 - 1) * np.var(x, ddof=1) + (n2 - 1) * np.var(y, ddof=1)) / degrees_of_freedom
+    se = float(np.sqrt(pooled_var * (1 / n1 + 1 / n2)))
+    mean_diff = float(np.mean(x) - np.mean(y))
+
+    t_statistic = mean_diff / se
+    p_value = _two_sided_t(t_statistic, degrees_of_freedom)
+    confidence_interval_lower, confidence_interval_upper = _t_conf_int(mean_diff, se, degrees_of_freedom, conf_level)
+
+    test_stats = {
+        't_statistic': t_statistic,
+        'degrees_of_freedom': degrees_of_freedom,
+        'p_value': p_value,
+        'confidence_interval_upper': confidence_interval_upper,
+        'confidence_interval_lower': confidence_interval_lower,
+        'conf_level': conf_level
+    }
+
+    return {
+        "group1_stats": {'group_name': group1, **_desc_stats(x)},
+        "group2_stats": {'group_name': group2, **_desc_stats(y)},
+        "test_stats": test_stats,
+        "assumptions": assumptions.build_assumptions([group1, group2], assumptions.compute_values([x, y]))
+    }
+
+def one_sample_t_test(group_data: dict, mu: float, conf_level: float):
+    """
+    args
+    group_data: dict = {"school": [1,2,1,3,2,1]}
+    mu: float = 3
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(group_data) != 1:
+        raise ValueError("Exactly one group must be provided")
+
+    group_name = list(group_data.keys())[0]
+    x = _as_array(group_data[group_name])
+
+    n = x.size
+    # R summary() 의 quantile type 7 == numpy linear
+    q_min, q1, median, q3, q_max = np.quantile(x, [0, 0.25, 0.5, 0.75, 1])
+    mean = float(np.mean(x))
+    var = float(np.var(x, ddof=1))
+    std_dev = float(np.sqrt(var))
+    se = std_dev / np.sqrt(n)
+
+    degrees_of_freedom = float(n - 1)
+    t_statistic = (mean - mu) / se
+    p_value = _two_sided_t(t_statistic, degrees_of_freedom)
+    confidence_interval_lower, confidence_interval_upper = _t_conf_int(mean, se, degrees_of_freedom, conf_level)
+
+    return {
+        "group_stats": {
+            "group_name": group_name,
+            "stats_min": float(q_min),
+            "stats_max": float(q_max),
+            "stats_median": float(median),
+            "stats_mean": mean,
+            "stats_sd": std_dev,
+            "stats_se": float(se),
+            "stats_n": float(n),
+            "stats_q1": float(q1),
+            "stats_q3": float(q3),
+            "stats_var": var,
+        },
+        "test_stats": {
+            "t_statistic": float(t_statistic),
+            "df": degrees_of_freedom,
+            "p_value": p_value,
+            "confidence_interval_lower": confidence_interval_lower,
+            "confidence_interval_upper": confidence_interval_upper,
+            "conf_level": conf_level,
+            "mu": mu,
+        },
+        "assumptions": assumptions.build_assumptions([group_name], assumptions.compute_values([x]))
+    }
+
+def paired_t_test(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) != 2:
+        raise ValueError("Exactly two groups must be provided")
+
+    group1, group2 = list(groups_data.keys())
+    x = _as_array(groups_data[group1])
+    y = _as_array(groups_data[group2])
+    if x.size != y.size:
+        raise ValueError("Paired groups must have the same length")
+
+    diff = x - y
+    diff_stats = _desc_stats(diff)
+
+    degrees_of_freedom = float(diff.size - 1)
+    t_statistic = diff_stats['mean'] / diff_stats['se']
+    p_value = _two_sided_t(t_statistic, degrees_of_freedom)
+    confidence_interval_lower, confidence_interval_upper = _t_conf_int(
+        diff_stats['mean'], diff_stats['se'], degrees_of_freedom, conf_level
+    )
+
+    test_stats = {
+        't_statistic': float(t_statistic),
+        'df': degrees_of_freedom,
+        'p_value': p_value,
+        'confidence_interval_lower': confidence_interval_lower,
+        'confidence_interval_upper': confidence_interval_upper,
+        'conf_level': conf_level
+    }
+
+    return {
+        "group1_stats": {'group_name': group1, **_desc_stats(x)},
+        "group2_stats": {'group_name': group2, **_desc_stats(y)},
+        "diff_stats": diff_stats,
+        "test_stats": test_stats,
+        # 대응표본은 차이값의 정규성만 검정
+        "assumptions": assumptions.build_assumptions(["diff"], assumptions.compute_values([diff]))
+    }
+
+def one_way_anova(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4], "group3": [7,8,6,7,8,7]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+
+    groups = list(groups_data.keys())
+    arrays = [_as_array(groups_data[group]) for group in groups]
+    sizes = np.array([a.size for a in arrays])
+    scores = np.concatenate(arrays)
+    codes = np.repeat(np.arange(len(groups)), sizes)
+
+    # 그룹별 합계/평균/제곱합을 bincount 한 번으로 계산
+    means = np.bincount(codes, weights=scores) / sizes
+    residuals = scores - means[codes]
+    within_ss_by_group = np.bincount(codes, weights=residuals * residuals)
+
+    grand_mean = np.mean(scores)
+    between_sum_sq = float(np.sum(sizes * (means - grand_mean) ** 2))
+    within_sum_sq = float(np.sum(within_ss_by_group))
+    between_df = float(len(groups) - 1)
+    within_df = float(scores.size - len(groups))
+    between_mean_sq = between_sum_sq / between_df
+    within_mean_sq = within_sum_sq / within_df
+    between_f = between_mean_sq / within_mean_sq
+    between_sig = float(stats.f.sf(between_f, between_df, within_df))
+
+    # rscripts 의 calculate_stats 와 동일하게 qt(conf_level, n-1) 사용
+    sds = np.sqrt(within_ss_by_group / (sizes - 1))
+    ses = sds / np.sqrt(sizes)
+    margins = stats.t.ppf(conf_level, sizes - 1) * ses
+
+    descriptive_stats = {}
+    for i, group in enumerate(groups):
+        descriptive_stats[group] = {
+            'n': int(sizes[i]),
+            'mean': float(means[i]),
+            'sd': float(sds[i]),
+            'se': float(ses[i]),
+            'ci_lower': float(means[i] - margins[i]),
+            'ci_upper': float(means[i] + margins[i])
+        }
+
+    total_n = scores.size
+    total_sd = float(np.std(scores, ddof=1))
+    total_se = total_sd / np.sqrt(total_n)
+    total_margin = stats.t.ppf(conf_level, total_n - 1) * total_se
+    total_stats = {
+        'n': int(total_n),
+        'mean': float(grand_mean),
+        'sd': total_sd,
+        'se': float(total_se),
+        'ci_lower': float(grand_mean - total_margin),
+        'ci_upper': float(grand_mean + total_margin)
+    }
+
+    test_stats = {
+        "between_sum_sq": between_sum_sq,
+        "between_df": between_df,
+        "between_mean_sq": between_mean_sq,
+        "between_f": float(between_f),
+        "between_sig": between_sig,
+        "within_sum_sq": within_sum_sq,
+        "within_df": within_df,
+        "within_mean_sq": within_mean_sq,
+        "total_sum_sq": between_sum_sq + within_sum_sq,
+        "total_df": between_df + within_df,
+        "conf_level": conf_level,
+    }
+
+    return {
+        "test_stats": test_stats,
+        "group_descriptive_stats": descriptive_stats,
+        "total_descriptive_stats": total_stats,
+        "assumptions": assumptions.build_assumptions(groups, assumptions.compute_values(arrays))
+    }
+
+# 비모수 검정 (R wilcox.test / kruskal.test 의 exact = FALSE, correct = TRUE 와 동일)
+# 순위는 정렬 한 번으로 구하므로 O(n log n), 그룹당 10^6 개도 1초 안에 계산
+
+def _rank(values: np.ndarray):
+    """
+    평균 순위 (R rank 의 ties.method = "average") 와 동점 보정항 sum(t^3 - t)
+    정렬된 배열에서 값이 바뀌는 경계로 동점 구간을 찾아 구간마다 평균 순위를 한 번에 채움
+    """
+    n = values.size
+    order = np.argsort(values)
+    sorted_values = values[order]
+    boundaries = np.flatnonzero(sorted_values[1:] != sorted_values[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [n]))
+    counts = ends - starts
+
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[order] = np.repeat((starts + ends + 1) / 2, counts)
+    counts = counts.astype(np.float64)
+    return ranks, float(np.sum(counts ** 3 - counts))
+
+def _continuity_z(statistic: float, expected: float, sigma: float) -> float:
+    # R 과 같은 연속성 보정: 기댓값 쪽으로 0.5 이동
+    z = statistic - expected
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float((z - np.sign(z) * 0.5) / np.float64(sigma))
+
+def _two_sided_z(z: float) -> float:
+    return float(2 * stats.norm.sf(abs(z)))
+
+def mann_whitney_u(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) != 2:
+        raise ValueError("Exactly two groups must be provided")
+
+    group1, group2 = list(groups_data.keys())
+    x = _as_array(groups_data[group1])
+    y = _as_array(groups_data[group2])
+    if x.size == 0 or y.size == 0:
+        raise ValueError("Each group needs at least one observation")
+
+    n_x, n_y = x.size, y.size
+    n = n_x + n_y
+    ranks, tie_term = _rank(np.concatenate([x, y]))
+    rank_sum_x = float(np.sum(ranks[:n_x]))
+
+    w_statistic = rank_sum_x - n_x * (n_x + 1) / 2
+    sigma = np.sqrt(n_x * n_y / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    z_statistic = _continuity_z(w_statistic, n_x * n_y / 2, sigma)
+
+    test_stats = {
+        'w_statistic': w_statistic,
+        'z_statistic': z_statistic,
+        'p_value': _two_sided_z(z_statistic),
+        'rank_biserial': 2 * w_statistic / (n_x * n_y) - 1,
+        'conf_level': conf_level
+    }
+
+    return {
+        "group1_stats": {'group_name': group1, 'n': float(n_x), 'median': float(np.median(x)),
+                         'mean_rank': rank_sum_x / n_x},
+        "group2_stats": {'group_name': group2, 'n': float(n_y), 'median': float(np.median(y)),
+                         'mean_rank': float(np.sum(ranks[n_x:])) / n_y},
+        "test_stats": test_stats,
+    }
+
+def wilcoxon_signed_rank(groups_data: dict, mu: float, conf_level: float):
+    """
+    그룹이 하나면 mu 와 비교하는 단일표본, 둘이면 차이값 (group1 - group2) 의 대응표본 검정
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    mu: float = 3 (단일표본만 사용, 대응표본은 0)
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) not in (1, 2):
+        raise ValueError("One or two groups must be provided")
+
+    arrays = {name: _as_array(values) for name, values in groups_data.items()}
+    paired = len(arrays) == 2
+    if paired:
+        x, y = arrays.values()
+        if x.size != y.size:
+            raise ValueError("Paired groups must have the same length")
+        diff, mu = x - y, 0.0
+    else:
+        (diff,) = arrays.values()
+    if diff.size == 0:
+        raise ValueError("Each group needs at least one observation")
+
+    # R 과 같이 차이가 0 인 관측치는 제외
+    shifted = diff - mu
+    shifted = shifted[shifted != 0]
+    n = shifted.size
+    ranks, tie_term = _rank(np.abs(shifted))
+
+    v_statistic = float(np.sum(ranks[shifted > 0]))
+    sigma = np.sqrt(n * (n + 1) * (2 * n + 1) / 24 - tie_term / 48)
+    z_statistic = _continuity_z(v_statistic, n * (n + 1) / 4, sigma)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rank_biserial = float(np.float64(2 * v_statistic) / (n * (n + 1) / 2) - 1)
+
+    test_stats = {
+        'v_statistic': v_statistic,
+        'z_statistic': z_statistic,
+        'p_value': _two_sided_z(z_statistic),
+        'rank_biserial': rank_biserial,
+        'mu': float(mu),
+        'paired': paired,
+        'conf_level': conf_level
+    }
+
+    return {
+        "group_stats": {
+            name: {'n': float(values.size), 'median': float(np.median(values))}
+            for name, values in arrays.items()
+        },
+        "diff_stats": {'n': float(diff.size), 'n_nonzero': float(n), 'median': float(np.median(diff))},
+        "test_stats": test_stats,
+    }
+
+def kruskal_wallis(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4], "group3": [7,8,6,7,8,7]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) < 2:
+        raise ValueError("At least two groups must be provided")
+
+    groups = list(groups_data.keys())
+    arrays = [_as_array(groups_data[group]) for group in groups]
+    sizes = np.array([x.size for x in arrays], dtype=np.float64)
+    if np.any(sizes == 0):
+        raise ValueError("Each group needs at least one observation")
+
+    n = float(np.sum(sizes))
+    ranks, tie_term = _rank(np.concatenate(arrays))
+    # 그룹이 이어 붙여진 순서대로 순위 합을 한 번에 계산
+    rank_sums = np.add.reduceat(ranks, np.concatenate(([0], np.cumsum(sizes[:-1]))).astype(np.intp))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 모든 값이 같으면 동점 보정 분모가 0 -> nan (R 과 동일)
+        h_statistic = (12 / (n * (n + 1)) * float(np.sum(rank_sums ** 2 / sizes)) - 3 * (n + 1)) \
+            / np.float64(1 - tie_term / (n ** 3 - n))
+    df = float(len(groups) - 1)
+
+    test_stats = {
+        'h_statistic': float(h_statistic),
+        'df': df,
+        'p_value': float(stats.chi2.sf(h_statistic, df)),
+        'epsilon_squared': float(h_statistic / (n - 1)),
+        'conf_level': conf_level
+    }
+
+    return {
+        "group_stats": {
+            group: {'n': float(sizes[i]), 'median': float(np.median(arrays[i])),
+                    'mean_rank': float(rank_sums[i] / sizes[i])}
+            for i, group in enumerate(groups)
+        },
+        "test_stats": test_stats,
+    }
@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import logging
+from html import escape
+from pathlib import Path
+import numpy as np
+from scipy import stats
+from dotenv import load_dotenv
+from models import StatisticalTest
+from models.base import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# 검정 결과 그래프 (바이올린 + 상자 + 평균/신뢰구간) 를 서버에서 SVG 로 그려 파일로 저장
+# 원자료 대신 그룹별 요약 (사분위수, 수염, 히스토그램 bin, 평균 CI) 만으로 그림
+# 파일 이름은 요약의 sha256 이라 같은 데이터면 이미 그린 파일을 그대로 씀 (content-addressed)
+
+PLOT_STORE_DIR = Path(os.getenv("PLOT_STORE_DIR", "plots"))
+PLOT_URL_PREFIX = "/plots"
+PLOT_BINS = int(os.getenv("PLOT_BINS", 32))
+# 그리는 방식이 바뀌면 올려서 예전 파일을 재사용하지 않도록 함
+PLOT_RENDER_VERSION = 1
+
+WIDTH, HEIGHT = 640, 400
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 56, 16, 16, 40
+
+
+def _round(values) -> list:
+    # 해시가 부동소수 끝자리 차이로 바뀌지 않도록 유효숫자 10자리로 맞춤
+    return [float(f"{v:.10g}") for v in np.atleast_1d(values)]
+
+
+def plot_summary(groups_data: dict, conf_level: float) -> dict:
+    """
+    결측 처리가 끝난 {그룹: 값 배열} -> 그래프용 요약
+    히스토그램은 모든 그룹이 같은 bin 경계를 사용 (y 축 공유)
+    값이 없는 그룹은 제외, 그릴 그룹이 없으면 None
+    """
+    if conf_level > 1:
+        conf_level = conf_level / 100
+    groups = {name: np.asarray(values, dtype=np.float64) for name, values in groups_data.items()}
+    groups = {name: values for name, values in groups.items() if values.size > 0}
+    if not groups:
+        return None
+
+    low = min(float(values.min()) for values in groups.values())
+    high = max(float(values.max()) for values in groups.values())
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, PLOT_BINS + 1)
+
+    summary = {"edges": _round(edges), "groups": []}
+    for name, values in groups.items():
+        n = values.size
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+        mean = float(values.mean())
+        half_width = stats.t.ppf((1 + conf_level) / 2, n - 1) * values.std(ddof=1) / np.sqrt(n) if n > 1 else 0.0
+        counts, _ = np.histogram(values, bins=edges)
+        summary["groups"].append({
+            "name": str(name),
+            "n": int(n),
+            "box": _round([inside.min(), q1, median, q3, inside.max()]),
+            "mean": _round([mean, mean - half_width, mean + half_width]),
+            "density": _round(counts / n),
+        })
+    summary["conf_level"] = conf_level
+    return summary
+
+
+def plot_hash(summary: dict) -> str:
+    payload = json.dumps({"version": PLOT_RENDER_VERSION, "summary": summary}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def render_svg(summary: dict) -> str:
+    """요약 -> SVG 문자열 (그룹마다 바이올린, 상자그림, 평균과 신뢰구간)"""
+    edges = np.asarray(summary["edges"])
+    groups = summary["groups"]
+    low, high = edges[0], edges[-1]
+    plot_width = WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+    plot_height = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    slot = plot_width / len(groups)
+    max_density = max(max(group["density"]) for group in groups) or 1.0
+
+    def y(value):
+        return MARGIN_TOP + plot_height * (1 - (value - low) / (high - low))
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{WIDTH}" height="{HEIGHT}" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        'font-family="sans-serif" font-size="12">',
+        f'<line x1="{MARGIN_LEFT}" y1="{MARGIN_TOP}" x2="{MARGIN_LEFT}" y2="{HEIGHT - MARGIN_BOTTOM}" stroke="#333"/>',
+    ]
+    for tick in np.linspace(low, high, 5):
+        parts.append(f'<text x="{MARGIN_LEFT - 6}" y="{y(tick) + 4:.1f}" text-anchor="end">{tick:.3g}</text>')
+
+    centers = (edges[:-1] + edges[1:]) / 2
+    for i, group in enumerate(groups):
+        center = MARGIN_LEFT + slot * (i + 0.5)
+        half = slot * 0.4 * np.asarray(group["density"]) / max_density
+        outline = [(center + w, y(c)) for w, c in zip(half, centers)] + \
+                  [(center - w, y(c)) for w, c in zip(half[::-1], centers[::-1])]
+        points = " ".join(f"{px:.1f},{py:.1f}" for px, py in outline)
+        parts.append(f'<polygon points="{points}" fill="#9ecae1" fill-opacity="0.5" stroke="#3182bd"/>')
+
+        whisker_low, q1, median, q3, whisker_high = group["box"]
+        box = slot * 0.08
+        parts.append(f'<line x1="{center:.1f}" y1="{y(whisker_low):.1f}" x2="{center:.1f}" y2="{y(whisker_high):.1f}" stroke="#333"/>')
+        parts.append(f'<rect x="{center - box:.1f}" y="{y(q3):.1f}" width="{2 * box:.1f}" '
+                     f'height="{y(q1) - y(q3):.1f}" fill="#fff" stroke="#333"/>')
+        parts.append(f'<line x1="{center - box:.1f}" y1="{y(median):.1f}" x2="{center + box:.1f}" y2="{y(median):.1f}" stroke="#333" stroke-width="2"/>')
+
+        mean, ci_lower, ci_upper = group["mean"]
+        parts.append(f'<line x1="{center + 2 * box:.1f}" y1="{y(ci_lower):.1f}" x2="{center + 2 * box:.1f}" y2="{y(ci_upper):.1f}" stroke="#e6550d" stroke-width="2"/>')
+        parts.append(f'<circle cx="{center + 2 * box:.1f}" cy="{y(mean):.1f}" r="3.5" fill="#e6550d"/>')
+        parts.append(f'<text x="{center:.1f}" y="{HEIGHT - MARGIN_BOTTOM + 18}" text-anchor="middle">'
+                     f'{escape(group["name"])} (n={group["n"]})</text>')
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def plot_path(digest: str) -> Path:
+    return PLOT_STORE_DIR / digest[:2] / f"{digest}.svg"
+
+
+def store_plot(summary: dict) -> str:
+    """
+    요약을 SVG 로 저장하고 URL 반환
+    같은 해시의 파일이 이미 있으면 다시 그리지 않음
+    """
+    digest = plot_hash(summary)
+    path = plot_path(digest)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 동시에 같은 그래프를 그려도 반쯤 쓴 파일이 보이지 않도록 임시 파일에 쓰고 교체
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(render_svg(summary), encoding="utf-8")
+        os.replace(tmp, path)
+    return f"{PLOT_URL_PREFIX}/{digest}.svg"
+
+
+def render_plots(jobs: list):
+    """
+    백그라운드 작업: jobs = [(test_id, 결측 처리된 그룹 데이터, 신뢰수준), ...]
+    그래프를 저장하고 StatisticalTest.image_url 을 갱신
+    요청 세션은 응답과 함께 닫히므로 별도 세션 사용
+    """
+    urls = {}
+    for test_id, groups_data, conf_level in jobs:
+        summary = plot_summary(groups_data, conf_level)
+        if summary is None:
+            continue
+        try:
+            urls[test_id] = store_plot(summary)
+        except OSError as e:
+            logger.error(f"Failed to store plot for test {test_id}: {str(e)}")
+    if not urls:
+        return
+
+    db = SessionLocal()
+    try:
+        for test in db.query(StatisticalTest).filter(StatisticalTest.id.in_(list(urls))).all():
+            test.image_url = urls[test.id]
+        db.commit()
+        logger.info(f"{len(urls)} plots rendered")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to update plot urls: {str(e)}")
+    finally:
+        db.close()
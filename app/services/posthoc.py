@@ -0,0 +1,176 @@
+from functools import lru_cache
+import numpy as np
+from scipy import stats
+from scipy.special import roots_legendre
+
+# 일원분산분석 사후검정 (Tukey HSD, Games-Howell, Bonferroni/Holm)
+# group_descriptive_stats (n, mean, sd) 와 within MS 만 사용하므로 엔진과 무관하고 원본 데이터도 필요 없음
+# 모든 그룹 쌍 k(k-1)/2 개를 배열 연산으로 한 번에 계산
+
+# 스튜던트화 범위 분포 계산용 격자
+# W(w) = P(표준정규 k 개의 범위 <= w) 를 w 격자에 한 번 표로 만든 뒤 보간
+_Z = np.linspace(-8.5, 8.5, 1201)
+_W = np.linspace(0.0, 16.0, 4001)
+# s = sqrt(chi2_df / df) 에 대한 적분은 분위수 공간의 Gauss-Legendre 로 계산
+_U, _U_WEIGHTS = roots_legendre(96)
+_U = (_U + 1) / 2
+_U_WEIGHTS = _U_WEIGHTS / 2
+# cdf 곡선을 계산해 두는 q 격자, 자유도가 이보다 많이 다르면 1/df 등간격 격자에서 보간
+_Q = np.linspace(0.0, 16.0, 801)
+DF_GRID_SIZE = 64
+
+
+@lru_cache(maxsize=32)
+def _range_cdf_table(k: int) -> np.ndarray:
+    phi = stats.norm.pdf(_Z)
+    inner = np.clip(stats.norm.cdf(_Z)[None, :] - stats.norm.cdf(_Z[None, :] - _W[:, None]), 0, 1)
+    table = k * np.trapezoid(phi * inner ** (k - 1), _Z, axis=1)
+    return np.clip(table, 0, 1)
+
+
+class StudentizedRange:
+    """
+    scipy.stats.studentized_range 와 같은 분포 (오차 1e-5 수준)
+    scipy 는 값마다 수치적분을 해서 쌍이 수만 개면 느리므로
+    자유도 격자마다 q 격자 위의 cdf 곡선을 미리 계산하고 (1/df, q) 로 선형 보간
+    """
+
+    def __init__(self, k: int, df):
+        self.df = np.atleast_1d(np.asarray(df, dtype=np.float64))
+        inverse_df = 1 / self.df
+        unique = np.unique(inverse_df)
+        grid = unique if unique.size <= DF_GRID_SIZE else np.linspace(unique[0], unique[-1], DF_GRID_SIZE)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            grid_df = 1 / grid
+            s = np.sqrt(stats.chi2.ppf(_U[:, None], grid_df[None, :]) / grid_df[None, :])
+        # 자유도가 매우 크면 s 는 1 로 수렴
+        s = np.where(np.isfinite(s), s, 1.0)
+
+        table = _range_cdf_table(int(k))
+        w = _Q[None, :, None] * s[:, None, :]
+        self._curves = np.einsum("u,uqg->gq", _U_WEIGHTS, np.interp(w, _W, table, right=1.0))
+
+        position = np.interp(inverse_df, grid, np.arange(grid.size)) if grid.size > 1 else np.zeros_like(inverse_df)
+        self._row = np.minimum(np.floor(position).astype(np.intp), max(grid.size - 2, 0))
+        self._row_weight = position - self._row
+        self._next_row = np.minimum(self._row + 1, grid.size - 1)
+
+    def cdf(self, q) -> np.ndarray:
+        q = np.broadcast_to(np.asarray(q, dtype=np.float64), self.df.shape)
+        position = np.clip(q / _Q[1], 0, _Q.size - 1)
+        column = np.minimum(np.floor(position).astype(np.intp), _Q.size - 2)
+        column_weight = position - column
+
+        def curve(row):
+            return self._curves[row, column] * (1 - column_weight) + self._curves[row, column + 1] * column_weight
+
+        cdf = curve(self._row) * (1 - self._row_weight) + curve(self._next_row) * self._row_weight
+        return np.clip(np.where(q >= _Q[-1], 1.0, cdf), 0, 1)
+
+    def sf(self, q) -> np.ndarray:
+        return 1 - self.cdf(q)
+
+    def ppf(self, p: float) -> np.ndarray:
+        lo = np.zeros_like(self.df)
+        hi = np.full_like(self.df, _Q[-1])
+        for _ in range(50):
+            mid = (lo + hi) / 2
+            below = self.cdf(mid) < p
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        return (lo + hi) / 2
+
+
+def holm_adjust(p_values: np.ndarray) -> np.ndarray:
+    m = p_values.size
+    order = np.argsort(p_values, kind="stable")
+    adjusted = np.maximum.accumulate((m - np.arange(m)) * p_values[order])
+    result = np.empty_like(p_values)
+    result[order] = np.minimum(adjusted, 1)
+    return result
+
+
+def pairwise_comparisons(groups: list, n, mean, sd, within_mean_sq: float, within_df: float,
+                         conf_level: float) -> dict:
+    """
+    모든 그룹 쌍 (i < j, groups 순서) 의 사후검정 결과를 열 단위 리스트로 반환
+    - tukey: Tukey-Kramer (pooled MSw, 불균등 n 허용)
+    - games_howell: 그룹별 분산 + 쌍별 Welch 자유도
+    - bonferroni / holm: pooled sd 쌍별 t 검정 (R pairwise.t.test 기본값) 의 p 보정
+    """
+    n, mean, sd = (np.asarray(v, dtype=np.float64) for v in (n, mean, sd))
+    k = n.size
+    i, j = np.triu_indices(k, 1)
+
+    diff = mean[i] - mean[j]
+    inverse_n = 1 / n[i] + 1 / n[j]
+
+    # Tukey-Kramer
+    tukey_se = np.sqrt(within_mean_sq / 2 * inverse_n)
+    tukey_q = np.abs(diff) / tukey_se
+    tukey = StudentizedRange(k, np.full(diff.shape, within_df))
+    tukey_crit = tukey.ppf(conf_level)
+
+    # Games-Howell
+    var_n_i = sd[i] ** 2 / n[i]
+    var_n_j = sd[j] ** 2 / n[j]
+    gh_se = np.sqrt((var_n_i + var_n_j) / 2)
+    gh_df = (var_n_i + var_n_j) ** 2 / (var_n_i ** 2 / (n[i] - 1) + var_n_j ** 2 / (n[j] - 1))
+    gh_q = np.abs(diff) / gh_se
+    games_howell = StudentizedRange(k, gh_df)
+    gh_crit = games_howell.ppf(conf_level)
+
+    # pooled sd 쌍별 t 검정
+    t_statistic = diff / np.sqrt(within_mean_sq * inverse_n)
+    raw_p = 2 * stats.t.sf(np.abs(t_statistic), within_df)
+
+    def values(array):
+        return [float(value) for value in array]
+
+    return {
+        "group1": [groups[index] for index in i],
+        "group2": [groups[index] for index in j],
+        "mean_difference": values(diff),
+        "conf_level": conf_level,
+        "tukey": {
+            "q": values(tukey_q),
+            "p_value": values(tukey.sf(tukey_q)),
+            "ci_lower": values(diff - tukey_crit * tukey_se),
+            "ci_upper": values(diff + tukey_crit * tukey_se),
+        },
+        "games_howell": {
+            "q": values(gh_q),
+            "df": values(gh_df),
+            "p_value": values(games_howell.sf(gh_q)),
+            "ci_lower": values(diff - gh_crit * gh_se),
+            "ci_upper": values(diff + gh_crit * gh_se),
+        },
+        "bonferroni": {
+            "t": values(t_statistic),
+            "p_value": values(np.minimum(raw_p * raw_p.size, 1)),
+        },
+        "holm": {
+            "p_value": values(holm_adjust(raw_p)),
+        },
+    }
+
+
+def add_post_hoc(test_methods: list, results: list) -> list:
+    """OneWayANOVA 결과 dict 에 post_hoc 섹션 추가"""
+    for test_method, result in zip(test_methods, results):
+        if getattr(test_method, "value", test_method) != "OneWayANOVA":
+            continue
+        group_stats = result["group_descriptive_stats"]
+        groups = list(group_stats)
+        test_stats = result["test_stats"]
+        result["post_hoc"] = pairwise_comparisons(
+            groups,
+            [group_stats[group]["n"] for group in groups],
+            [group_stats[group]["mean"] for group in groups],
+            [group_stats[group]["sd"] for group in groups],
+            test_stats["within_mean_sq"],
+            test_stats["within_df"],
+            test_stats["conf_level"],
+        )
+    return results
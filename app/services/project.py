@@ -1,11 +1,14 @@
+import asyncio
 from fastapi import HTTPException, WebSocket
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from models import Project, ProjectPermission, TableData
+from models.base import AsyncSessionLocal
 from schemas import ProjectCreate, ProjectUpdate
 import logging
-from datetime import datetime
 from fastapi import WebSocketDisconnect
+from services.table_writer import table_writer, TABLE_WS_MAX_PENDING
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +25,7 @@ logger.setLevel(logging.INFO)
 
 class ProjectService:
     @staticmethod
-    def create_project(db: Session, project: ProjectCreate, current_user: dict):
+    async def create_project(db: AsyncSession, project: ProjectCreate, current_user: dict):
         if len(project.name) > 250:
             return {"success": False, "detail": "name is too long"}
             
@@ -30,10 +33,10 @@ class ProjectService:
             return {"success": False, "detail": "description is too long"}
 
         try:
-            existing_project = db.query(Project).filter(
+            existing_project = await db.scalar(select(Project.id).where(
                 Project.name == project.name,
                 Project.user_id == current_user["user"]
-            ).first()
+            ))
             
             if existing_project:
                 raise HTTPException(status_code=400, detail="Project with this name already exists for this user")
@@ -46,8 +49,8 @@ class ProjectService:
             )
             
             db.add(new_project)
-            db.commit()
-            db.refresh(new_project)
+            await db.commit()
+            await db.refresh(new_project)
             
             return {
                 "success": True,
@@ -59,17 +62,17 @@ class ProjectService:
                 "project_user_id": new_project.user_id
             }
         except SQLAlchemyError as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail="Database error occurred while creating project")
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail="Same name project already exists")
 
     @staticmethod
-    def get_user_projects(db: Session, current_user: dict):
-        projects = db.query(Project).filter(
+    async def get_user_projects(db: AsyncSession, current_user: dict):
+        projects = (await db.scalars(select(Project).where(
             Project.user_id == current_user["user"]
-        ).order_by(Project.id.asc()).all()
+        ).order_by(Project.id.asc()))).all()
 
         if not projects:
             return []
@@ -86,17 +89,17 @@ class ProjectService:
         ]
 
     @staticmethod
-    def get_user_project(db: Session, project_id: int):
-        project = db.query(Project).filter(Project.id == project_id).first()
+    async def get_user_project(db: AsyncSession, project_id: int):
+        project = await db.get(Project, project_id)
         
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
         permissions = []
         if project.visibility == "etc":
-            permissions = db.query(ProjectPermission).filter(
+            permissions = (await db.scalars(select(ProjectPermission).where(
                 ProjectPermission.project_id == project_id
-            ).all()
+            ))).all()
 
         response = {
             "id": project.id,
@@ -120,8 +123,8 @@ class ProjectService:
         return response
 
     @staticmethod
-    def delete_project(db: Session, project_id: int, current_user: dict):
-        project = db.query(Project).filter(Project.id == project_id).first()
+    async def delete_project(db: AsyncSession, project_id: int, current_user: dict):
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
@@ -129,28 +132,28 @@ class ProjectService:
             raise HTTPException(status_code=403, detail="Not authorized to delete this project")
         
         try:
-            db.delete(project)
-            db.commit()
+            await db.delete(project)
+            await db.commit()
             return {"success": True, "detail": "Project deleted successfully"}
         except SQLAlchemyError as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Error deleting project: {str(e)}")
             raise HTTPException(status_code=500, detail="Database error occurred while deleting project")
 
     @staticmethod
-    def update_project(db: Session, project_id: int, update_data: ProjectUpdate, current_user: dict):
-        project = db.query(Project).filter(Project.id == project_id).first()
+    async def update_project(db: AsyncSession, project_id: int, update_data: ProjectUpdate, current_user: dict):
+        project = await db.get(Project, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
         if project.user_id != current_user["user"]:
             raise HTTPException(status_code=403, detail="Not authorized to update this project")
         
-        existing_project = db.query(Project).filter(
+        existing_project = await db.scalar(select(Project.id).where(
             Project.name == update_data.name,
             Project.user_id == current_user["user"],
             Project.id != project_id
-        ).first()
+        ))
         if existing_project:
             raise HTTPException(
                 status_code=400,
@@ -162,8 +165,8 @@ class ProjectService:
             project.description = update_data.description
         
         try:
-            db.commit()
-            db.refresh(project)
+            await db.commit()
+            await db.refresh(project)
             return {
                 "success": True,
                 "detail": "Project updated successfully",
@@ -172,41 +175,61 @@ class ProjectService:
                 "project_description": project.description
             }
         except SQLAlchemyError as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Error updating project name: {str(e)}")
             raise HTTPException(status_code=500, detail="Database error occurred while updating project")
 
     @staticmethod
-    async def handle_table_websocket(websocket: WebSocket, project_id: int, db: Session, current_user: dict):
+    async def _acknowledge_table_writes(websocket: WebSocket, pending: asyncio.Queue):
+        while True:
+            message, write = await pending.get()
+            if write is not None:
+                try:
+                    await write
+                except Exception:
+                    # 저장에 실패한 셀만 실패로 응답하고 연결은 유지
+                    message = {
+                        "success": False,
+                        "type": "update",
+                        "row": message["row"],
+                        "col": message["col"],
+                        "message": "Failed to save cell"
+                    }
+            await websocket.send_json(message)
+
+    @staticmethod
+    async def handle_table_websocket(websocket: WebSocket, project_id: int, current_user: dict):
         try:
-            project = db.query(Project).filter(Project.id == project_id).first()
-            logger.info(f"project: {project}")
+            # 권한 확인과 초기 데이터는 짧은 세션으로 읽고 바로 반납 (연결 중에는 세션/커넥션을 잡고 있지 않음)
+            async with AsyncSessionLocal() as db:
+                project = await db.get(Project, project_id)
+                logger.info(f"project: {project}")
 
-            if not project:
-                logger.info(f"Project {project_id} not found")
-                return False, 4002
+                if not project:
+                    logger.info(f"Project {project_id} not found")
+                    return False, 4002
 
-            permission = db.query(ProjectPermission).filter(
-                ProjectPermission.project_id == project_id,
-                ProjectPermission.user_id == current_user["user"]
-            ).first()
-            logger.info(f"permission: {permission}")
-            
-            if not permission and not (
-                project.user_id == current_user["user"] or 
-                project.visibility == "public_all_editor"
-            ):
-                logger.info("no permission")
-                return False, 4003
+                permission = await db.scalar(select(ProjectPermission).where(
+                    ProjectPermission.project_id == project_id,
+                    ProjectPermission.user_id == current_user["user"]
+                ))
+                logger.info(f"permission: {permission}")
+
+                if not permission and not (
+                    project.user_id == current_user["user"] or
+                    project.visibility == "public_all_editor"
+                ):
+                    logger.info("no permission")
+                    return False, 4003
 
-            initial_grid = [['' for _ in range(20)] for _ in range(100)]
-            table_data_list = db.query(TableData).filter(
-                TableData.project_id == project_id
-            ).all()
+                initial_grid = [['' for _ in range(20)] for _ in range(100)]
+                cells = (await db.execute(select(TableData.row_num, TableData.col_num, TableData.value).where(
+                    TableData.project_id == project_id
+                ))).all()
 
-            for data in table_data_list:
-                if 0 <= data.row_num < 100 and 0 <= data.col_num < 20:
-                    initial_grid[data.row_num][data.col_num] = data.value
+            for row_num, col_num, value in cells:
+                if 0 <= row_num < 100 and 0 <= col_num < 20:
+                    initial_grid[row_num][col_num] = value
             
             await websocket.send_json({
                 "type": "initial_data",
@@ -214,46 +237,39 @@ class ProjectService:
                 "data": initial_grid
             })
             
-            while True:
-                data = await websocket.receive_json()
-                row_num = data.get("row")
-                col_num = data.get("col")
-                value = data.get("value")
-                
-                if not (0 <= row_num < 100 and 0 <= col_num < 20):
-                    await websocket.send_json({
-                        "success": False,
-                        "message": "Invalid row or column index"
-                    })
-                    continue
-                
-                table_data = db.query(TableData).filter(
-                    TableData.project_id == project_id,
-                    TableData.row_num == row_num,
-                    TableData.col_num == col_num
-                ).first()
+            # 응답을 기다리지 않고 다음 메시지를 계속 읽어서 붙여넣기 같은 연속 수정이 writer 의 한 배치로 묶이도록 함
+            # 응답은 acknowledge 작업이 받은 순서대로, 각 수정이 커밋된 뒤 보냄
+            pending = asyncio.Queue(maxsize=TABLE_WS_MAX_PENDING)
+            acknowledger = asyncio.create_task(ProjectService._acknowledge_table_writes(websocket, pending))
+            try:
+                while True:
+                    data = await websocket.receive_json()
+                    if acknowledger.done():
+                        # 응답 전송이 실패했으면 그 예외로 종료
+                        acknowledger.result()
+                    row_num = data.get("row")
+                    col_num = data.get("col")
+                    value = data.get("value")
 
-                if table_data:
-                    table_data.value = value
-                else:
-                    table_data = TableData(
-                        project_id=project_id,
-                        row_num=row_num,
-                        col_num=col_num,
-                        value=value
-                    )
-                    db.add(table_data)
-                
-                project.modified_at = datetime.now()
-                db.commit()
-                
-                await websocket.send_json({
-                    "success": True,
-                    "type": "update",
-                    "row": row_num,
-                    "col": col_num,
-                    "value": value
-                })
+                    if not (0 <= row_num < 100 and 0 <= col_num < 20):
+                        await pending.put(({
+                            "success": False,
+                            "message": "Invalid row or column index"
+                        }, None))
+                        continue
+
+                    write = asyncio.ensure_future(table_writer.write(project_id, row_num, col_num, value))
+                    # 연결이 먼저 끊겨 응답을 보내지 못한 실패도 "exception was never retrieved" 로 남지 않도록
+                    write.add_done_callback(lambda future: future.cancelled() or future.exception())
+                    await pending.put(({
+                        "success": True,
+                        "type": "update",
+                        "row": row_num,
+                        "col": col_num,
+                        "value": value
+                    }, write))
+            finally:
+                acknowledger.cancel()
                 
         except WebSocketDisconnect:
             logger.info("websocket disconnected")
@@ -0,0 +1,214 @@
+import asyncio
+import multiprocessing
+import os
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import numpy as np
+from scipy import stats
+from dotenv import load_dotenv
+from .executors import stats_executor
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# 0 이면 프로세스 풀 없이 스레드 하나에서 블록을 순서대로 계산 (CPU 가 하나면 기본값 0)
+_CPU_COUNT = os.cpu_count() or 1
+RESAMPLING_WORKERS = int(os.getenv("RESAMPLING_WORKERS", _CPU_COUNT if _CPU_COUNT > 1 else 0))
+# 블록 하나의 재표본 수 / 블록 하나가 만드는 인덱스 배열의 최대 원소 수 (메모리 상한)
+RESAMPLING_BLOCK_SIZE = int(os.getenv("RESAMPLING_BLOCK_SIZE", 1000))
+RESAMPLING_BLOCK_ELEMENTS = int(os.getenv("RESAMPLING_BLOCK_ELEMENTS", 4_000_000))
+# 조기 종료 판단 사이에 계산하는 블록 수
+# 워커 수와 무관하게 고정해야 같은 seed 면 같은 시점에 멈추고 같은 결과가 나옴
+RESAMPLING_WAVE_BLOCKS = 8
+
+RESAMPLING_TESTS = ("IndependentTTest", "PairedTTest")
+
+# seed 가 없을 때 새로 뽑는 seed 의 비트 수
+# 결과 JSON 에 저장되고 프론트엔드 (JS number) 에서 정확히 표현되어야 다시 재현할 수 있으므로 2^53 미만
+RESAMPLING_SEED_BITS = 53
+
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if RESAMPLING_WORKERS <= 0:
+        return None
+    if _executor is None:
+        # rworker 와 같은 이유로 spawn 사용
+        _executor = ProcessPoolExecutor(max_workers=RESAMPLING_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        logger.info(f"resampling pool started: {RESAMPLING_WORKERS} workers")
+    return _executor
+
+
+async def start_resampling_pool():
+    # spawn 워커는 첫 작업 때 import 비용이 커서 서버 시작 시 미리 띄워 둠
+    executor = _get_executor()
+    if executor is None:
+        logger.info("resampling pool disabled")
+        return
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*(loop.run_in_executor(executor, os.getpid) for _ in range(RESAMPLING_WORKERS)))
+
+
+def shutdown_resampling_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def _mean_differences(kind: str, x: np.ndarray, y: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    if kind == "paired":
+        return x[indices].mean(axis=1)
+    return x[indices[:, :x.size]].mean(axis=1) - y[indices[:, x.size:]].mean(axis=1)
+
+
+def _permutation_block(kind: str, x: np.ndarray, y: np.ndarray, observed: float, size: int, seed) -> int:
+    """
+    재배치 size 번 중 |평균 차이| 가 관측값 이상인 횟수
+    - 독립표본: 두 그룹을 합친 뒤 라벨을 섞음
+    - 대응표본: 차이값의 부호를 무작위로 바꿈 (x 에 차이값이 들어옴)
+    """
+    rng = np.random.default_rng(seed)
+    if kind == "paired":
+        signs = rng.choice(np.array([-1.0, 1.0]), size=(size, x.size))
+        permuted = signs @ x / x.size
+    else:
+        pooled = np.concatenate([x, y])
+        order = rng.permuted(np.tile(np.arange(pooled.size), (size, 1)), axis=1)
+        first_sum = pooled[order[:, :x.size]].sum(axis=1)
+        permuted = first_sum / x.size - (pooled.sum() - first_sum) / y.size
+    # 부동소수점 오차로 관측값과 같은 재배치가 빠지지 않도록 여유를 둠
+    threshold = abs(observed) * (1 - 1e-12)
+    return int(np.count_nonzero(np.abs(permuted) >= threshold))
+
+
+def _bootstrap_block(kind: str, x: np.ndarray, y: np.ndarray, size: int, seed) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    if kind == "paired":
+        return _mean_differences(kind, x, y, rng.integers(0, x.size, size=(size, x.size)))
+    indices = np.concatenate([
+        rng.integers(0, x.size, size=(size, x.size)),
+        rng.integers(0, y.size, size=(size, y.size)),
+    ], axis=1)
+    return _mean_differences(kind, x, y, indices)
+
+
+async def _run_blocks(function, jobs: list) -> list:
+    executor = _get_executor()
+    if executor is None:
+        return await stats_executor.run(lambda: [function(*job) for job in jobs])
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(executor, function, *job) for job in jobs))
+
+
+def _block_sizes(total: int, n: int) -> list:
+    block = max(1, min(RESAMPLING_BLOCK_SIZE, RESAMPLING_BLOCK_ELEMENTS // max(n, 1)))
+    return [min(block, total - start) for start in range(0, total, block)]
+
+
+def _p_value_interval(exceedances: int, permutations: int, conf_level: float = 0.99) -> tuple:
+    # Clopper-Pearson
+    alpha = 1 - conf_level
+    lower = stats.beta.ppf(alpha / 2, exceedances, permutations - exceedances + 1) if exceedances > 0 else 0.0
+    upper = stats.beta.ppf(1 - alpha / 2, exceedances + 1, permutations - exceedances) \
+        if exceedances < permutations else 1.0
+    return float(lower), float(upper)
+
+
+async def resample(test_method: str, groups_data: dict, conf_level: float, options: dict) -> dict:
+    """
+    평균 차이에 대한 순열 검정 p 값과 부트스트랩 신뢰구간
+    options: {"permutations", "bootstrap", "seed", "tolerance"}
+    - 순열 검정은 RESAMPLING_WAVE_BLOCKS 블록씩 계산하고 p 값의 99% 구간 반폭이 tolerance 이하면 멈춤
+    - 블록마다 SeedSequence.spawn 으로 만든 독립 난수열을 사용 (같은 seed 면 워커 수와 무관하게 같은 결과)
+    - seed 가 없으면 새로 뽑아서 결과에 남김 (그 seed 로 다시 요청하면 같은 결과)
+    """
+    test_method = getattr(test_method, "value", test_method)
+    if test_method not in RESAMPLING_TESTS:
+        raise ValueError(f"Resampling supports {', '.join(RESAMPLING_TESTS)} only")
+    if len(groups_data) != 2:
+        raise ValueError("Exactly two groups must be provided")
+    if conf_level > 1:
+        conf_level = conf_level / 100
+
+    x, y = (np.asarray(values, dtype=np.float64) for values in groups_data.values())
+    if test_method == "PairedTTest":
+        if x.size != y.size:
+            raise ValueError("Paired groups must have the same length")
+        kind, x, y = "paired", x - y, np.empty(0)
+    else:
+        kind = "independent"
+    if x.size < 2 or (kind == "independent" and y.size < 2):
+        raise ValueError("Each group needs at least two observations")
+
+    observed = float(x.mean() - (y.mean() if kind == "independent" else 0.0))
+    seed = options.get("seed")
+    if seed is None:
+        seed = secrets.randbits(RESAMPLING_SEED_BITS)
+    root = np.random.SeedSequence(seed)
+    permutation_seeds, bootstrap_seeds = root.spawn(2)
+
+    # 순열 검정 (조기 종료)
+    max_permutations = int(options.get("permutations", 10000))
+    tolerance = float(options.get("tolerance", 0.005))
+    sizes = _block_sizes(max_permutations, x.size + y.size)
+    seeds = permutation_seeds.spawn(len(sizes))
+    exceedances = permutations = 0
+    for start in range(0, len(sizes), RESAMPLING_WAVE_BLOCKS):
+        wave = range(start, min(start + RESAMPLING_WAVE_BLOCKS, len(sizes)))
+        counts = await _run_blocks(_permutation_block, [(kind, x, y, observed, sizes[b], seeds[b]) for b in wave])
+        exceedances += sum(counts)
+        permutations += sum(sizes[b] for b in wave)
+        p_lower, p_upper = _p_value_interval(exceedances, permutations)
+        if (p_upper - p_lower) / 2 <= tolerance:
+            break
+
+    # 부트스트랩 (전체 블록을 한 번에 분산)
+    resamples = int(options.get("bootstrap", 2000))
+    sizes = _block_sizes(resamples, x.size + y.size)
+    blocks = await _run_blocks(
+        _bootstrap_block, [(kind, x, y, size, seed) for size, seed in zip(sizes, bootstrap_seeds.spawn(len(sizes)))]
+    )
+    differences = np.concatenate(blocks)
+    alpha = 1 - conf_level
+    ci_lower, ci_upper = np.quantile(differences, [alpha / 2, 1 - alpha / 2])
+
+    return {
+        "statistic": "mean_difference",
+        "observed": observed,
+        "seed": seed,
+        "permutation": {
+            # Phipson & Smyth: 관측 배치도 하나로 세서 p 가 0 이 되지 않도록 함
+            "p_value": (exceedances + 1) / (permutations + 1),
+            "p_value_ci_lower": p_lower,
+            "p_value_ci_upper": p_upper,
+            "exceedances": exceedances,
+            "permutations": permutations,
+            "max_permutations": max_permutations,
+            "stopped_early": permutations < max_permutations,
+        },
+        "bootstrap": {
+            "method": "percentile",
+            "resamples": int(differences.size),
+            "conf_level": conf_level,
+            "se": float(np.std(differences, ddof=1)),
+            "ci_lower": float(ci_lower),
+            "ci_upper": float(ci_upper),
+        },
+    }
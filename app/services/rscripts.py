@@ -1,6 +1,9 @@
 import rpy2.robjects as ro
+import numpy as np
 from icecream import ic
+from pathlib import Path
 import logging
+from .assumptions import SHAPIRO_MAX_N, build_assumptions
 logger = logging.getLogger(__name__)
 
 formatter = logging.Formatter(
@@ -22,6 +25,49 @@ def _normalize_conf_level(conf_level: float) -> float:
         return conf_level / 100
     return conf_level
 
+R_LIBRARY_PATH = Path(__file__).resolve().parent / 'r' / 'statistics.R'
+R_FUNCTIONS = ("desc_stats", "calculate_stats", "independent_t_test", "one_sample_t_test", "paired_t_test", "one_way_anova",
+               "mann_whitney_u", "wilcoxon_signed_rank", "kruskal_wallis", "memory_usage")
+
+def _load_r_library() -> dict:
+    """
+    statistics.R 를 전용 environment 에 source 한 뒤 함수들을 compiler::cmpfun 으로 바이트 컴파일
+    요청마다 R 코드를 parse/eval 하지 않고 여기서 만든 함수 핸들만 호출함
+    """
+    env = ro.r['new.env'](parent=ro.globalenv)
+    ro.r['sys.source'](str(R_LIBRARY_PATH), envir=env)
+
+    cmpfun = ro.r('compiler::cmpfun')
+    for name in R_FUNCTIONS:
+        # 내부에서 서로 호출하므로 environment 안의 정의도 컴파일된 버전으로 교체
+        env[name] = cmpfun(env[name])
+
+    logger.info(f"R library loaded: {R_LIBRARY_PATH.name}")
+    return {name: env[name] for name in R_FUNCTIONS}
+
+_r_functions = _load_r_library()
+
+# statistics.R 가 반환하는 numeric 벡터의 필드 순서
+DESC_STATS_FIELDS = ('n', 'mean', 'sd', 'se', 'min', 'max', 'median')
+GROUP_STATS_FIELDS = ('n', 'mean', 'sd', 'se', 'ci_lower', 'ci_upper')
+T_TEST_FIELDS = ('t_statistic', 'df', 'p_value', 'confidence_interval_lower', 'confidence_interval_upper')
+ONE_SAMPLE_FIELDS = ('min', 'q1', 'median', 'mean', 'q3', 'max', 'sd', 'n', 'var', 'se') + T_TEST_FIELDS
+ANOVA_FIELDS = ('between_f', 'between_df', 'within_df', 'between_sig',
+                'between_sum_sq', 'within_sum_sq', 'between_mean_sq', 'within_mean_sq')
+RANK_GROUP_FIELDS = ('n', 'median', 'mean_rank')
+MANN_WHITNEY_FIELDS = ('w_statistic', 'z_statistic', 'p_value')
+WILCOXON_FIELDS = ('v_statistic', 'z_statistic', 'p_value', 'n_nonzero', 'n', 'median')
+KRUSKAL_WALLIS_FIELDS = ('h_statistic', 'df', 'p_value')
+MEMORY_FIELDS = ('ncells', 'vcells', 'ncells_mb', 'vcells_mb')
+
+def _to_numpy(result) -> np.ndarray:
+    # R numeric 벡터 전체를 한 번에 변환 (필드마다 rx2 로 FFI 를 넘지 않음)
+    return np.asarray(result, dtype=np.float64)
+
+def _unpack(values: np.ndarray, offset: int, fields: tuple) -> dict:
+    return {field: float(values[offset + i]) for i, field in enumerate(fields)}
+
+
 def independent_t_test(groups_data: dict, conf_level: float):
     """
     args
@@ -37,86 +83,18 @@ def independent_t_test(groups_data: dict, conf_level: float):
     group1_data = ro.FloatVector(groups_data[group1])
     group2_data = ro.FloatVector(groups_data[group2])
 
-    r_code = """
-    t_test_result <- t.test(x = c(%s), 
-                            y = c(%s), 
-                            paired = FALSE, 
-                            var.equal = TRUE, 
-                            conf.level = %f)
-
-    desc_stats <- function(x) {
-        n <- length(x)
-        list(
-            n = n,
-            mean = mean(x),
-            sd = sd(x),
-            se = sd(x)/sqrt(n),
-            min = min(x),
-            max = max(x),
-            median = median(x)
-        )
-    }
-
-    group1_stats <- desc_stats(c(%s))
-    group2_stats <- desc_stats(c(%s))
-
-    result_list <- list(
-        t_stat = t_test_result$statistic,
-        df = t_test_result$parameter,
-        p_value = t_test_result$p.value,
-        conf_int = t_test_result$conf.int,
-        means = c(mean(c(%s)), mean(c(%s))),
-        group1_stats = group1_stats,
-        group2_stats = group2_stats
-    )
-    result_list
-    """ % (
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data),
-        conf_level,
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data),
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data)
-    )
-
-    result = ro.r(r_code)
-
-    t_statistic = float(result.rx2('t_stat')[0])
-    degrees_of_freedom = float(result.rx2('df')[0])
-    p_value = float(result.rx2('p_value')[0])
-    confidence_interval = (float(result.rx2('conf_int')[0]), float(result.rx2('conf_int')[1]))
-
-    group1_stats = {
-        'group_name': group1,
-        'n': float(result.rx2('group1_stats').rx2('n')[0]),
-        'mean': float(result.rx2('group1_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('group1_stats').rx2('sd')[0]),
-        'se': float(result.rx2('group1_stats').rx2('se')[0]),
-        'min': float(result.rx2('group1_stats').rx2('min')[0]),
-        'max': float(result.rx2('group1_stats').rx2('max')[0]),
-        'median': float(result.rx2('group1_stats').rx2('median')[0])
-    }
+    values = _to_numpy(_r_functions["independent_t_test"](group1_data, group2_data, conf_level, SHAPIRO_MAX_N))
 
-    group2_stats = {
-        'group_name': group2,
-        'n': float(result.rx2('group2_stats').rx2('n')[0]),
-        'mean': float(result.rx2('group2_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('group2_stats').rx2('sd')[0]),
-        'se': float(result.rx2('group2_stats').rx2('se')[0]),
-        'min': float(result.rx2('group2_stats').rx2('min')[0]),
-        'max': float(result.rx2('group2_stats').rx2('max')[0]),
-        'median': float(result.rx2('group2_stats').rx2('median')[0])
-    }
-
-    confidence_interval_lower, confidence_interval_upper = confidence_interval
+    t_test = _unpack(values, 0, T_TEST_FIELDS)
+    group1_stats = {'group_name': group1, **_unpack(values, len(T_TEST_FIELDS), DESC_STATS_FIELDS)}
+    group2_stats = {'group_name': group2, **_unpack(values, len(T_TEST_FIELDS) + len(DESC_STATS_FIELDS), DESC_STATS_FIELDS)}
 
     test_stats = {
-        't_statistic': t_statistic,
-        'degrees_of_freedom': degrees_of_freedom,
-        'p_value': p_value,
-        'confidence_interval_upper': confidence_interval_upper,
-        'confidence_interval_lower': confidence_interval_lower,
+        't_statistic': t_test['t_statistic'],
+        'degrees_of_freedom': t_test['df'],
+        'p_value': t_test['p_value'],
+        'confidence_interval_upper': t_test['confidence_interval_upper'],
+        'confidence_interval_lower': t_test['confidence_interval_lower'],
         'conf_level': conf_level
     }
 
@@ -124,7 +102,10 @@ def independent_t_test(groups_data: dict, conf_level: float):
     result_dict = {
         "group1_stats": group1_stats,
         "group2_stats": group2_stats,
-        "test_stats": test_stats
+        "test_stats": test_stats,
+        "assumptions": build_assumptions(
+            [group1, group2], values[len(T_TEST_FIELDS) + 2 * len(DESC_STATS_FIELDS):]
+        )
     }
     return result_dict
 
@@ -142,87 +123,33 @@ def one_sample_t_test(group_data: dict, mu: float, conf_level: float):
     group_name = list(group_data.keys())[0]
     data = ro.FloatVector(group_data[group_name])
 
-    data_str = ','.join(str(x) for x in data)
-
-    r_code = """
-    desc_stats <- list(
-        summary = summary(c(%s)),
-        sd = sd(c(%s)),
-        n = length(c(%s)),
-        var = var(c(%s)),
-        se = sd(c(%s))/sqrt(length(c(%s)))
-    )
-
-    t_test_result <- t.test(x = c(%s), 
-                            mu = %f,
-                            conf.level = %f)
-
-    result_list <- list(
-        summary = desc_stats$summary,
-        sd = desc_stats$sd,
-        n = desc_stats$n,
-        var = desc_stats$var,
-        se = desc_stats$se,
-        t_stat = t_test_result$statistic,
-        df = t_test_result$parameter,
-        p_value = t_test_result$p.value,
-        conf_int = t_test_result$conf.int,
-        mean = t_test_result$estimate
-    )
-    result_list
-    """ % (
-        data_str,
-        data_str,
-        data_str,
-        data_str,
-        data_str,
-        data_str,
-        data_str,
-        mu,
-        conf_level
-    )
-
-    result = ro.r(r_code)
-
-    min= float(result.rx2('summary')[0])
-    q1= float(result.rx2('summary')[1])
-    median= float(result.rx2('summary')[2])
-    mean= float(result.rx2('summary')[3])
-    q3= float(result.rx2('summary')[4])
-    max= float(result.rx2('summary')[5])
-    n= float(result.rx2('n')[0])
-    var= float(result.rx2('var')[0])
-    se= float(result.rx2('se')[0])
-    std_dev = float(result.rx2('sd')[0])
-    t_statistic = float(result.rx2('t_stat')[0])
-    degrees_of_freedom = float(result.rx2('df')[0])
-    p_value = float(result.rx2('p_value')[0])
-    confidence_interval = (float(result.rx2('conf_int')[0]), float(result.rx2('conf_int')[1]))
-    confidence_interval_lower, confidence_interval_upper = confidence_interval
+    values = _to_numpy(_r_functions["one_sample_t_test"](data, mu, conf_level, SHAPIRO_MAX_N))
+    stats = _unpack(values, 0, ONE_SAMPLE_FIELDS)
 
     result = {
         "group_stats": {
             "group_name": group_name,
-            "stats_min": min,
-            "stats_max": max,
-            "stats_median": median,
-            "stats_mean": mean,
-            "stats_sd": std_dev,
-            "stats_se": se,
-            "stats_n": n,
-            "stats_q1": q1,
-            "stats_q3": q3,
-            "stats_var": var,
+            "stats_min": stats['min'],
+            "stats_max": stats['max'],
+            "stats_median": stats['median'],
+            "stats_mean": stats['mean'],
+            "stats_sd": stats['sd'],
+            "stats_se": stats['se'],
+            "stats_n": stats['n'],
+            "stats_q1": stats['q1'],
+            "stats_q3": stats['q3'],
+            "stats_var": stats['var'],
         },
         "test_stats": {
-            "t_statistic": t_statistic,
-            "df": degrees_of_freedom,
-            "p_value": p_value,
-            "confidence_interval_lower": confidence_interval_lower,
-            "confidence_interval_upper": confidence_interval_upper,
+            "t_statistic": stats['t_statistic'],
+            "df": stats['df'],
+            "p_value": stats['p_value'],
+            "confidence_interval_lower": stats['confidence_interval_lower'],
+            "confidence_interval_upper": stats['confidence_interval_upper'],
             "conf_level": conf_level,
             "mu": mu,
-        }
+        },
+        "assumptions": build_assumptions([group_name], values[len(ONE_SAMPLE_FIELDS):])
     }
     return result
 
@@ -241,103 +168,21 @@ def paired_t_test(groups_data: dict, conf_level: float):
     group1_data = ro.FloatVector(groups_data[group1])
     group2_data = ro.FloatVector(groups_data[group2])
 
-    r_code = """
-    t_test_result <- t.test(x = c(%s), 
-                            y = c(%s), 
-                            paired = TRUE,
-                            conf.level = %f)
-
-    desc_stats <- function(x) {
-        n <- length(x)
-        list(
-            n = n,
-            mean = mean(x),
-            sd = sd(x),
-            se = sd(x)/sqrt(n),
-            min = min(x),
-            max = max(x),
-            median = median(x)
-        )
-    }
+    values = _to_numpy(_r_functions["paired_t_test"](group1_data, group2_data, conf_level, SHAPIRO_MAX_N))
 
-    diff_data <- c(%s) - c(%s)
-    diff_stats <- desc_stats(diff_data)
-
-    group1_stats <- desc_stats(c(%s))
-    group2_stats <- desc_stats(c(%s))
-
-    result_list <- list(
-        t_stat = t_test_result$statistic,
-        df = t_test_result$parameter,
-        p_value = t_test_result$p.value,
-        conf_int = t_test_result$conf.int,
-        means = c(mean(c(%s)), mean(c(%s))),
-        group1_stats = group1_stats,
-        group2_stats = group2_stats,
-        diff_stats = diff_stats
-    )
-    result_list
-    """ % (
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data),
-        conf_level,
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data),
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data),
-        ','.join(str(x) for x in group1_data),
-        ','.join(str(x) for x in group2_data)
-    )
-
-    result = ro.r(r_code)
-
-    t_statistic = float(result.rx2('t_stat')[0])
-    degrees_of_freedom = float(result.rx2('df')[0])
-    p_value = float(result.rx2('p_value')[0])
-    confidence_interval = (float(result.rx2('conf_int')[0]), float(result.rx2('conf_int')[1]))
-    group_means = (float(result.rx2('means')[0]), float(result.rx2('means')[1]))
-
-    confidence_interval_lower, confidence_interval_upper = confidence_interval
-
-
-    group1_stats = {
-        'group_name': group1,
-        'n': float(result.rx2('group1_stats').rx2('n')[0]),
-        'mean': float(result.rx2('group1_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('group1_stats').rx2('sd')[0]),
-        'se': float(result.rx2('group1_stats').rx2('se')[0]),
-        'min': float(result.rx2('group1_stats').rx2('min')[0]),
-        'max': float(result.rx2('group1_stats').rx2('max')[0]),
-        'median': float(result.rx2('group1_stats').rx2('median')[0])
-    }
-
-    group2_stats = {
-        'group_name': group2,
-        'n': float(result.rx2('group2_stats').rx2('n')[0]),
-        'mean': float(result.rx2('group2_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('group2_stats').rx2('sd')[0]),
-        'se': float(result.rx2('group2_stats').rx2('se')[0]),
-        'min': float(result.rx2('group2_stats').rx2('min')[0]),
-        'max': float(result.rx2('group2_stats').rx2('max')[0]),
-        'median': float(result.rx2('group2_stats').rx2('median')[0])
-    }
-
-    diff_stats = {
-        'n': float(result.rx2('diff_stats').rx2('n')[0]),
-        'mean': float(result.rx2('diff_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('diff_stats').rx2('sd')[0]),
-        'se': float(result.rx2('diff_stats').rx2('se')[0]),
-        'min': float(result.rx2('diff_stats').rx2('min')[0]),
-        'max': float(result.rx2('diff_stats').rx2('max')[0]),
-        'median': float(result.rx2('diff_stats').rx2('median')[0]),
-    }
+    offset = len(T_TEST_FIELDS)
+    step = len(DESC_STATS_FIELDS)
+    t_test = _unpack(values, 0, T_TEST_FIELDS)
+    group1_stats = {'group_name': group1, **_unpack(values, offset, DESC_STATS_FIELDS)}
+    group2_stats = {'group_name': group2, **_unpack(values, offset + step, DESC_STATS_FIELDS)}
+    diff_stats = _unpack(values, offset + 2 * step, DESC_STATS_FIELDS)
 
     test_stats = {
-        't_statistic': t_statistic,
-        'df': degrees_of_freedom,
-        'p_value': p_value,
-        'confidence_interval_lower': confidence_interval_lower,
-        'confidence_interval_upper': confidence_interval_upper,
+        't_statistic': t_test['t_statistic'],
+        'df': t_test['df'],
+        'p_value': t_test['p_value'],
+        'confidence_interval_lower': t_test['confidence_interval_lower'],
+        'confidence_interval_upper': t_test['confidence_interval_upper'],
         'conf_level': conf_level
     }
 
@@ -346,7 +191,9 @@ def paired_t_test(groups_data: dict, conf_level: float):
         "group1_stats": group1_stats,
         "group2_stats": group2_stats,
         "diff_stats": diff_stats,
-        "test_stats": test_stats
+        "test_stats": test_stats,
+        # 대응표본은 차이값의 정규성만 검정
+        "assumptions": build_assumptions(["diff"], values[offset + 3 * step:])
     }
 
     return result_dict
@@ -359,120 +206,196 @@ def one_way_anova(groups_data: dict, conf_level: float):
     """
     conf_level = _normalize_conf_level(conf_level)
     
-    r_groups_data = {
-        group: ro.FloatVector(data) 
-        for group, data in groups_data.items()
-    }
+    groups = list(groups_data.keys())
+    sizes = np.array([len(groups_data[group]) for group in groups])
 
-    all_data = []
-    group_labels = []
-    for group_name, data in r_groups_data.items():
-        all_data.extend(data)
-        group_labels.extend([group_name] * len(data))
-
-    r_code = """
-    data <- data.frame(
-        score = c(%s),
-        group = factor(c(%s))
-    )
-
-    anova_result <- aov(score ~ group, data = data)
-    summary_result <- summary(anova_result)
-
-    calculate_stats <- function(x) {
-        n <- length(x)
-        mean_val <- mean(x)
-        sd_val <- sd(x)
-        se <- sd_val / sqrt(n)
-        ci <- qt(%f, n-1) * se
-        list(
-            n = n,
-            mean = mean_val,
-            sd = sd_val,
-            se = se,
-            ci_lower = mean_val - ci,
-            ci_upper = mean_val + ci
-        )
-    }
+    # 관측치마다 그룹 이름 문자열을 만들지 않고 1부터 시작하는 정수 코드 + levels 표로 전달
+    scores = np.concatenate([np.asarray(groups_data[group], dtype=np.float64) for group in groups])
+    codes = np.repeat(np.arange(1, len(groups) + 1, dtype=np.int32), sizes)
+
+    values = _to_numpy(_r_functions["one_way_anova"](
+        ro.FloatVector(scores),
+        ro.IntVector(codes),
+        ro.StrVector(groups),
+        conf_level,
+        SHAPIRO_MAX_N
+    ))
+
+    anova = _unpack(values, 0, ANOVA_FIELDS)
+    offset = len(ANOVA_FIELDS)
+    step = len(GROUP_STATS_FIELDS)
+
+    total_stats = _unpack(values, offset, GROUP_STATS_FIELDS)
+    total_stats['n'] = int(total_stats['n'])
 
-    group_stats <- by(data$score, data$group, calculate_stats)
-    total_stats <- calculate_stats(data$score)
-
-    result_list <- list(
-        f_stat = summary_result[[1]]$'F value'[1],
-        df = c(summary_result[[1]]$Df[1], summary_result[[1]]$Df[2]),
-        p_value = summary_result[[1]]$'Pr(>F)'[1],
-        means = tapply(data$score, data$group, mean),
-        sum_sq = c(summary_result[[1]]$'Sum Sq'[1], summary_result[[1]]$'Sum Sq'[2]),
-        mean_sq = c(summary_result[[1]]$'Mean Sq'[1], summary_result[[1]]$'Mean Sq'[2]),
-        group_stats = group_stats,
-        total_stats = total_stats
-    )
-    result_list
-    """ % (
-        ','.join(str(x) for x in all_data),
-        ','.join(f"'{x}'" for x in group_labels),
-        conf_level
-    )
-
-    result = ro.r(r_code)
-
-    between_sum_sq = float(result.rx2('sum_sq')[0])
-    between_df = float(result.rx2('df')[0]) 
-    between_mean_sq = float(result.rx2('mean_sq')[0])
-    between_f = float(result.rx2('f_stat')[0])
-    between_sig = float(result.rx2('p_value')[0])
-
-    within_sum_sq = float(result.rx2('sum_sq')[1])
-    within_df = float(result.rx2('df')[1])
-    within_mean_sq = float(result.rx2('mean_sq')[1])
-
-    total_sum_sq = between_sum_sq + within_sum_sq
-    total_df = between_df + within_df
-
-    groups = list(r_groups_data.keys())
     descriptive_stats = {}
     for i, group in enumerate(groups):
-        stats = {
-            'n': int(result.rx2('group_stats')[i].rx2('n')[0]),
-            'mean': float(result.rx2('group_stats')[i].rx2('mean')[0]),
-            'sd': float(result.rx2('group_stats')[i].rx2('sd')[0]),
-            'se': float(result.rx2('group_stats')[i].rx2('se')[0]),
-            'ci_lower': float(result.rx2('group_stats')[i].rx2('ci_lower')[0]),
-            'ci_upper': float(result.rx2('group_stats')[i].rx2('ci_upper')[0])
-        }
+        stats = _unpack(values, offset + (i + 1) * step, GROUP_STATS_FIELDS)
+        stats['n'] = int(stats['n'])
         descriptive_stats[group] = stats
 
-    total_stats = {
-        'n': int(result.rx2('total_stats').rx2('n')[0]),
-        'mean': float(result.rx2('total_stats').rx2('mean')[0]),
-        'sd': float(result.rx2('total_stats').rx2('sd')[0]),
-        'se': float(result.rx2('total_stats').rx2('se')[0]),
-        'ci_lower': float(result.rx2('total_stats').rx2('ci_lower')[0]),
-        'ci_upper': float(result.rx2('total_stats').rx2('ci_upper')[0])
-    }
-
 
     test_stats = {
-        "between_sum_sq": between_sum_sq,
-        "between_df": between_df,
-        "between_mean_sq": between_mean_sq,
-        "between_f": between_f,
-        "between_sig": between_sig,
-        "within_sum_sq": within_sum_sq,
-        "within_df": within_df,
-        "within_mean_sq": within_mean_sq,
-        "total_sum_sq": total_sum_sq,
-        "total_df": total_df,
+        "between_sum_sq": anova['between_sum_sq'],
+        "between_df": anova['between_df'],
+        "between_mean_sq": anova['between_mean_sq'],
+        "between_f": anova['between_f'],
+        "between_sig": anova['between_sig'],
+        "within_sum_sq": anova['within_sum_sq'],
+        "within_df": anova['within_df'],
+        "within_mean_sq": anova['within_mean_sq'],
+        "total_sum_sq": anova['between_sum_sq'] + anova['within_sum_sq'],
+        "total_df": anova['between_df'] + anova['within_df'],
         "conf_level": conf_level,
     }
 
     return {
         "test_stats": test_stats,
         "group_descriptive_stats": descriptive_stats,
-        "total_descriptive_stats": total_stats
+        "total_descriptive_stats": total_stats,
+        "assumptions": build_assumptions(groups, values[offset + (len(groups) + 1) * step:])
+    }
+
+def mann_whitney_u(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) != 2:
+        raise ValueError("Exactly two groups must be provided")
+
+    group1, group2 = list(groups_data.keys())
+    if len(groups_data[group1]) == 0 or len(groups_data[group2]) == 0:
+        raise ValueError("Each group needs at least one observation")
+
+    values = _to_numpy(_r_functions["mann_whitney_u"](
+        ro.FloatVector(groups_data[group1]), ro.FloatVector(groups_data[group2])
+    ))
+
+    test = _unpack(values, 0, MANN_WHITNEY_FIELDS)
+    offset = len(MANN_WHITNEY_FIELDS)
+    group1_stats = {'group_name': group1, **_unpack(values, offset, RANK_GROUP_FIELDS)}
+    group2_stats = {'group_name': group2, **_unpack(values, offset + len(RANK_GROUP_FIELDS), RANK_GROUP_FIELDS)}
+
+    test_stats = {
+        'w_statistic': test['w_statistic'],
+        'z_statistic': test['z_statistic'],
+        'p_value': test['p_value'],
+        'rank_biserial': 2 * test['w_statistic'] / (group1_stats['n'] * group2_stats['n']) - 1,
+        'conf_level': conf_level
+    }
+
+    return {
+        "group1_stats": group1_stats,
+        "group2_stats": group2_stats,
+        "test_stats": test_stats,
+    }
+
+def wilcoxon_signed_rank(groups_data: dict, mu: float, conf_level: float):
+    """
+    그룹이 하나면 mu 와 비교하는 단일표본, 둘이면 차이값 (group1 - group2) 의 대응표본 검정
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4]}
+    mu: float = 3 (단일표본만 사용, 대응표본은 0)
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) not in (1, 2):
+        raise ValueError("One or two groups must be provided")
+
+    groups = list(groups_data.keys())
+    paired = len(groups) == 2
+    x = groups_data[groups[0]]
+    y = groups_data[groups[1]] if paired else []
+    if paired and len(x) != len(y):
+        raise ValueError("Paired groups must have the same length")
+    if len(x) == 0:
+        raise ValueError("Each group needs at least one observation")
+    if paired:
+        mu = 0.0
+
+    values = _to_numpy(_r_functions["wilcoxon_signed_rank"](ro.FloatVector(x), ro.FloatVector(y), mu))
+
+    test = _unpack(values, 0, WILCOXON_FIELDS)
+    offset = len(WILCOXON_FIELDS)
+    n = test['n_nonzero']
+
+    test_stats = {
+        'v_statistic': test['v_statistic'],
+        'z_statistic': test['z_statistic'],
+        'p_value': test['p_value'],
+        'rank_biserial': 2 * test['v_statistic'] / (n * (n + 1) / 2) - 1 if n > 0 else float("nan"),
+        'mu': float(mu),
+        'paired': paired,
+        'conf_level': conf_level
     }
 
+    return {
+        "group_stats": {
+            group: _unpack(values, offset + 2 * i, ('n', 'median'))
+            for i, group in enumerate(groups)
+        },
+        "diff_stats": {'n': test['n'], 'n_nonzero': n, 'median': test['median']},
+        "test_stats": test_stats,
+    }
+
+def kruskal_wallis(groups_data: dict, conf_level: float):
+    """
+    args
+    groups_data: dict = {"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4], "group3": [7,8,6,7,8,7]}
+    conf_level: float = 0.95
+    """
+    conf_level = _normalize_conf_level(conf_level)
+    if len(groups_data) < 2:
+        raise ValueError("At least two groups must be provided")
+
+    groups = list(groups_data.keys())
+    sizes = np.array([len(groups_data[group]) for group in groups])
+    if np.any(sizes == 0):
+        raise ValueError("Each group needs at least one observation")
+
+    # one_way_anova 와 같이 정수 코드 + levels 표로 전달
+    scores = np.concatenate([np.asarray(groups_data[group], dtype=np.float64) for group in groups])
+    codes = np.repeat(np.arange(1, len(groups) + 1, dtype=np.int32), sizes)
+
+    values = _to_numpy(_r_functions["kruskal_wallis"](
+        ro.FloatVector(scores),
+        ro.IntVector(codes),
+        ro.StrVector(groups)
+    ))
+
+    test = _unpack(values, 0, KRUSKAL_WALLIS_FIELDS)
+    offset = len(KRUSKAL_WALLIS_FIELDS)
+    step = len(RANK_GROUP_FIELDS)
+
+    test_stats = {
+        'h_statistic': test['h_statistic'],
+        'df': test['df'],
+        'p_value': test['p_value'],
+        'epsilon_squared': test['h_statistic'] / (float(scores.size) - 1),
+        'conf_level': conf_level
+    }
+
+    return {
+        "group_stats": {
+            group: _unpack(values, offset + i * step, RANK_GROUP_FIELDS)
+            for i, group in enumerate(groups)
+        },
+        "test_stats": test_stats,
+    }
+
+def memory_usage(collect: bool = False) -> dict:
+    """
+    R 힙 사용량 (Ncells / Vcells 개수와 Mb)
+    collect=True 면 full gc 후 측정, 아니면 가벼운 gc 만 수행
+    """
+    values = _to_numpy(_r_functions["memory_usage"](bool(collect)))
+    memory = _unpack(values, 0, MEMORY_FIELDS)
+    memory['heap_mb'] = memory['ncells_mb'] + memory['vcells_mb']
+    return memory
+
 if __name__ == "__main__":
     itt = independent_t_test({"school": [1,2,1,3,2,1], "home": [5,4,5,5,3,4]}, 0.95)
     ic(itt)
@@ -484,4 +407,4 @@ if __name__ == "__main__":
     ic(pt)
 
     owa = one_way_anova({"group1": [1,2,1,3,2,1], "group2": [5,4,5,5,3,4], "group3": [7,8,6,7,8,7]}, 0.95)
-    ic(owa)
\ No newline at end of file
+    ic(owa)
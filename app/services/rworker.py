@@ -0,0 +1,395 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import logging
+from dotenv import load_dotenv
+from .stats_engine import get_backend, DEFAULT_MU
+from .missing_values import DEFAULT_MISSING_VALUE_HANDLING
+from .executors import stats_executor
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# 0 이면 풀 없이 프로세스 내부 R 인터프리터 사용
+R_WORKERS = int(os.getenv("R_WORKERS", os.cpu_count() or 1))
+R_WORKER_QUEUE_SIZE = int(os.getenv("R_WORKER_QUEUE_SIZE", R_WORKERS * 4))
+R_WORKER_JOB_TIMEOUT = float(os.getenv("R_WORKER_JOB_TIMEOUT", 30))
+R_WORKER_MAX_JOBS = int(os.getenv("R_WORKER_MAX_JOBS", 500))
+R_WORKER_START_TIMEOUT = float(os.getenv("R_WORKER_START_TIMEOUT", 60))
+# 죽은/재시작할 워커를 새로 띄우는 시도 횟수, 모두 실패하면 그 슬롯을 없앰
+R_WORKER_RESPAWN_ATTEMPTS = int(os.getenv("R_WORKER_RESPAWN_ATTEMPTS", 2))
+# R 힙 관리: N 작업마다 또는 R 힙 (Ncells + Vcells) 이 임계값을 넘으면 full gc
+R_GC_EVERY_JOBS = int(os.getenv("R_GC_EVERY_JOBS", 50))
+R_GC_THRESHOLD_MB = float(os.getenv("R_GC_THRESHOLD_MB", 256))
+# gc 후에도 워커 RSS 가 이 값을 넘으면 워커 재시작 (0 이면 사용 안 함)
+R_MEMORY_CEILING_MB = float(os.getenv("R_MEMORY_CEILING_MB", 1024))
+
+
+class PoolFullError(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없음 (HTTP 503)"""
+
+
+class JobTimeoutError(Exception):
+    """작업이 제한 시간 안에 끝나지 않아 워커를 재시작함 (HTTP 504)"""
+
+
+class MemoryGovernor:
+    """
+    작업이 끝날 때마다 R 힙을 측정하고 필요하면 gc
+    - gc_every 작업마다, 또는 R 힙이 gc_threshold_mb 를 넘으면 full gc
+    - full gc 후에도 RSS (측정 불가하면 R 힙) 가 ceiling_mb 를 넘으면 recycle=True
+      R 이 해제한 메모리를 OS 에 돌려주지 않는 경우가 있어 프로세스를 바꾸는 수밖에 없음
+    """
+
+    def __init__(self, gc_every: int = R_GC_EVERY_JOBS, gc_threshold_mb: float = R_GC_THRESHOLD_MB,
+                 ceiling_mb: float = R_MEMORY_CEILING_MB):
+        self.gc_every = gc_every
+        self.gc_threshold_mb = gc_threshold_mb
+        self.ceiling_mb = ceiling_mb
+        self.jobs = 0
+        self.gc_runs = 0
+        self.last = None
+
+    def _over_ceiling(self, memory: dict) -> bool:
+        used = memory.get("rss_mb")
+        if used is None:
+            used = memory.get("heap_mb", 0)
+        return self.ceiling_mb > 0 and used > self.ceiling_mb
+
+    def after_job(self, backend) -> dict:
+        self.jobs += 1
+        collect = self.gc_every > 0 and self.jobs % self.gc_every == 0
+        memory = backend.memory_usage(collect)
+        if not collect and (memory.get("heap_mb", 0) > self.gc_threshold_mb or self._over_ceiling(memory)):
+            # 재시작 여부는 수집 후 사용량으로 판단
+            collect = True
+            memory = backend.memory_usage(True)
+        self.gc_runs += collect
+        self.last = {**memory, "jobs": self.jobs, "gc_runs": self.gc_runs, "recycle": self._over_ceiling(memory)}
+        return self.last
+
+
+def _worker_main(conn, engine: str):
+    # 워커 프로세스: 시작 시 R 함수 라이브러리를 로드하고 모든 검정을 한 번씩 실행한 뒤 파이프로 작업을 받음
+    try:
+        backend = get_backend(engine)
+        backend.warm_up()
+    except Exception as e:
+        conn.send(("init_error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", os.getpid()))
+    governor = MemoryGovernor()
+
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        kind, payload = job
+        try:
+            status, result = "ok", backend.run_batch(payload) if kind == "batch" else backend.run(**payload)
+        except Exception as e:
+            status, result = "error", e
+        try:
+            memory = governor.after_job(backend)
+        except Exception as e:
+            logger.error(f"R memory check failed: {type(e).__name__}: {e}")
+            memory = None
+        # 응답마다 R 메모리 상태를 같이 보냄 (풀이 재시작 여부 판단과 지표에 사용)
+        conn.send((status, result, memory))
+
+
+class RWorker:
+    def __init__(self, ctx, engine: str):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn, engine), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.memory = None
+
+    def wait_ready(self, timeout: float):
+        if not self.conn.poll(timeout):
+            raise JobTimeoutError("R worker did not start in time")
+        status, payload = self.conn.recv()
+        if status != "ready":
+            raise RuntimeError(f"R worker failed to start: {payload}")
+
+    def call(self, job: tuple, timeout: float):
+        self.conn.send(job)
+        if not self.conn.poll(timeout):
+            raise JobTimeoutError(f"statistics job exceeded {timeout}s")
+        return self.conn.recv()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class RWorkerPool:
+    """
+    R 워커 프로세스 풀
+    - 워커마다 R 인터프리터 하나 (동시 호출 불가하므로 워커당 작업 1개)
+    - 실행 중 + 대기 중 작업이 size + queue_size 를 넘으면 PoolFullError
+    - job_timeout 을 넘긴 워커는 kill 후 새로 띄움
+    - max_jobs 만큼 처리한 워커는 재시작해서 R 메모리 누적을 막음
+    - gc 후에도 RSS 가 R_MEMORY_CEILING_MB 를 넘은 워커도 재시작 (MemoryGovernor)
+    - 재시작이 R_WORKER_RESPAWN_ATTEMPTS 번 모두 실패하면 슬롯을 없애고 size 를 줄임 (워커가 하나도 남지 않으면 작업은 RuntimeError)
+    """
+
+    def __init__(self, engine: str = "r", size: int = R_WORKERS, queue_size: int = R_WORKER_QUEUE_SIZE,
+                 job_timeout: float = R_WORKER_JOB_TIMEOUT, max_jobs: int = R_WORKER_MAX_JOBS):
+        self.engine = engine
+        self.size = size
+        self.queue_size = queue_size
+        self.job_timeout = job_timeout
+        self.max_jobs = max_jobs
+        # fork 시 부모의 R/asyncio 상태가 복사되지 않도록 spawn 사용
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle = None
+        self._workers = []
+        self._pending = 0
+        self.recycled = 0
+        self.memory_recycled = 0
+        self.timeouts = 0
+        self.lost = 0
+
+    def _spawn_worker(self) -> RWorker:
+        worker = RWorker(self._ctx, self.engine)
+        try:
+            worker.wait_ready(R_WORKER_START_TIMEOUT)
+        except Exception:
+            worker.kill()
+            raise
+        return worker
+
+    async def start(self):
+        self._idle = asyncio.Queue()
+        # R 초기화가 오래 걸리므로 워커를 한꺼번에 띄우고 준비 완료를 같이 기다림
+        self._workers = [RWorker(self._ctx, self.engine) for _ in range(self.size)]
+        await asyncio.gather(*(
+            asyncio.to_thread(worker.wait_ready, R_WORKER_START_TIMEOUT) for worker in self._workers
+        ))
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+        logger.info(f"R worker pool started: {self.size} workers, queue {self.queue_size}")
+
+    async def stop(self):
+        for worker in self._workers:
+            await asyncio.to_thread(worker.stop)
+        self._workers = []
+        logger.info("R worker pool stopped")
+
+    async def _replace(self, worker: RWorker):
+        """
+        worker 를 kill 하고 새 워커로 교체, 새로 띄우지 못하면 슬롯을 없애고 None 반환
+        (kill 한 워커를 idle 로 돌려놓으면 그 워커를 받은 이후 작업이 모두 실패하므로)
+        """
+        await asyncio.to_thread(worker.kill)
+        for attempt in range(1, R_WORKER_RESPAWN_ATTEMPTS + 1):
+            try:
+                new_worker = await asyncio.to_thread(self._spawn_worker)
+            except Exception as e:
+                logger.error(f"R worker respawn failed ({attempt}/{R_WORKER_RESPAWN_ATTEMPTS}): {str(e)}")
+                continue
+            self._workers = [new_worker if w is worker else w for w in self._workers]
+            return new_worker
+
+        self._workers = [w for w in self._workers if w is not worker]
+        self.size -= 1
+        self.lost += 1
+        logger.error(f"R worker slot dropped, {self.size} workers left")
+        if self.size == 0:
+            # 워커를 기다리는 작업들이 끝없이 기다리지 않도록 빈 풀 표시를 넣음
+            self._idle.put_nowait(None)
+        return None
+
+    async def submit(self, test_method: str, groups_data: dict, conf_level: float, mu: float = DEFAULT_MU,
+                     missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING) -> dict:
+        job = {"test_method": test_method, "groups_data": groups_data, "conf_level": conf_level, "mu": mu,
+               "missing_value_handling": missing_value_handling}
+        return await self._dispatch(("run", job), self.job_timeout)
+
+    async def submit_batch(self, jobs: list) -> list:
+        # 배치 전체를 워커 하나에 한 번에 보냄 (IPC 왕복 1회)
+        return await self._dispatch(("batch", jobs), self.job_timeout * max(len(jobs), 1))
+
+    async def _dispatch(self, job: tuple, timeout: float):
+        if self._pending >= self.size + self.queue_size:
+            raise PoolFullError("statistics queue is full")
+
+        self._pending += 1
+        abandoned = asyncio.Event()
+        task = asyncio.ensure_future(self._run_job(job, timeout, abandoned))
+        # 가져가지 않은 예외가 "never retrieved" 로 남지 않도록
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        try:
+            # 요청이 취소돼도 워커에 보낸 작업의 응답은 끝까지 읽어야 함
+            # 중간에 워커를 idle 로 돌려놓으면 다음 작업이 이전 작업의 응답을 읽게 되므로 작업 자체는 shield 로 보호
+            status, payload = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+
+        if status == "error":
+            raise payload
+        return payload
+
+    async def _run_job(self, job: tuple, timeout: float, abandoned: asyncio.Event):
+        try:
+            worker = await self._idle.get()
+            if worker is None:
+                # 다른 대기 작업도 깨어나도록 다시 넣음
+                self._idle.put_nowait(None)
+                raise RuntimeError("R worker pool has no workers left")
+            try:
+                if abandoned.is_set():
+                    # 워커를 받기 전에 요청이 취소됐으면 실행하지 않음
+                    raise asyncio.CancelledError()
+                status, payload, memory = await asyncio.to_thread(worker.call, job, timeout)
+            except JobTimeoutError:
+                self.timeouts += 1
+                logger.error(f"R worker {worker.process.pid} timed out, respawning")
+                worker = await self._replace(worker)
+                raise
+            except (EOFError, OSError) as e:
+                logger.error(f"R worker {worker.process.pid} died: {str(e)}, respawning")
+                worker = await self._replace(worker)
+                raise
+            else:
+                worker.jobs += 1
+                worker.memory = memory
+                if worker.jobs >= self.max_jobs:
+                    self.recycled += 1
+                    worker = await self._replace(worker)
+                elif memory and memory.get("recycle"):
+                    self.memory_recycled += 1
+                    logger.warning(f"R worker {worker.process.pid} exceeded memory ceiling "
+                                   f"(rss {memory.get('rss_mb')} Mb), respawning")
+                    worker = await self._replace(worker)
+            finally:
+                if worker is not None:
+                    self._idle.put_nowait(worker)
+        finally:
+            self._pending -= 1
+        return status, payload
+
+    def stats(self) -> dict:
+        return {
+            "workers": len(self._workers),
+            "idle": self._idle.qsize() if self._idle else 0,
+            "pending": self._pending,
+            "queue_size": self.queue_size,
+            "recycled": self.recycled,
+            "memory_recycled": self.memory_recycled,
+            "timeouts": self.timeouts,
+            "lost": self.lost,
+            "memory": [
+                {"pid": worker.process.pid, "jobs": worker.jobs, **(worker.memory or {})}
+                for worker in self._workers
+            ],
+        }
+
+
+worker_pool = None
+
+# 풀 없이 프로세스 내부 R 을 쓸 때의 메모리 관리 (인터프리터는 재시작할 수 없으므로 gc 와 경고만)
+local_memory = MemoryGovernor()
+# 임베디드 R 은 스레드 안전하지 않으므로 stats_executor 스레드들 중 하나씩만 R 을 호출
+_local_r_lock = threading.Lock()
+
+
+async def start_worker_pool():
+    global worker_pool
+    if R_WORKERS <= 0:
+        logger.info("R worker pool disabled")
+        return
+    pool = RWorkerPool()
+    try:
+        await pool.start()
+    except Exception as e:
+        # R 이 없는 배포에서는 풀 없이 진행 (numpy 엔진은 영향 없음)
+        logger.error(f"Failed to start R worker pool: {str(e)}")
+        await pool.stop()
+        return
+    worker_pool = pool
+
+
+async def stop_worker_pool():
+    global worker_pool
+    if worker_pool is not None:
+        await worker_pool.stop()
+        worker_pool = None
+
+
+async def run_statistic_job(engine: str, test_method: str, groups_data: dict, conf_level: float,
+                            mu: float = DEFAULT_MU,
+                            missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING) -> dict:
+    """
+    R 엔진 작업은 워커 풀로, 나머지 엔진은 stats_executor 에서 실행 (이벤트 루프를 막지 않음)
+    """
+    backend = get_backend(engine)
+    if backend.name == "r" and worker_pool is not None:
+        return await worker_pool.submit(test_method, groups_data, conf_level, mu, missing_value_handling)
+    return await stats_executor.run(run_in_process, backend, backend.run,
+                                    test_method, groups_data, conf_level, mu, missing_value_handling)
+
+
+async def run_statistic_batch(engine: str, jobs: list) -> list:
+    backend = get_backend(engine)
+    if backend.name == "r" and worker_pool is not None:
+        return await worker_pool.submit_batch(jobs)
+    return await stats_executor.run(run_in_process, backend, backend.run_batch, jobs)
+
+
+def run_in_process(backend, function, *args):
+    """현재 프로세스에서 엔진 호출 (R 이면 전역 잠금 + 메모리 관리), stats_executor 스레드에서 실행"""
+    if backend.name != "r":
+        return function(*args)
+    with _local_r_lock:
+        result = function(*args)
+        _govern_local(backend)
+    return result
+
+
+def _govern_local(backend):
+    memory = local_memory.after_job(backend)
+    if memory["recycle"]:
+        logger.warning(f"in-process R exceeded memory ceiling (rss {memory.get('rss_mb')} Mb), "
+                       "set R_WORKERS > 0 so workers can be recycled")
+
+
+def memory_stats() -> dict:
+    """R 메모리 지표 (워커별 Ncells/Vcells, RSS, gc 횟수, 메모리 초과로 재시작한 수)"""
+    return {
+        "pool": worker_pool.stats() if worker_pool is not None else None,
+        "in_process": local_memory.last,
+        "gc_every_jobs": R_GC_EVERY_JOBS,
+        "gc_threshold_mb": R_GC_THRESHOLD_MB,
+        "memory_ceiling_mb": R_MEMORY_CEILING_MB,
+    }
@@ -0,0 +1,314 @@
+from itertools import combinations
+from sqlalchemy.orm import Session
+from models import (
+    StatisticalTest, OneWayANOVAResult, PairedTTestResult, IndependentTTestResult, OneSampleTTestResult,
+    MannWhitneyUResult, WilcoxonSignedRankResult, KruskalWallisResult
+)
+from .effect_sizes import selected_effect_size
+import logging
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+ALIASES = {
+    "OneWayANOVA": "One Way ANOVA",
+    "PairedTTest": "Paired T Test",
+    "IndependentTTest": "Independent T Test",
+    "OneSampleTTest": "One Sample T Test",
+    "MannWhitneyU": "Mann-Whitney U Test",
+    "WilcoxonSignedRank": "Wilcoxon Signed-Rank Test",
+    "KruskalWallis": "Kruskal-Wallis Test",
+}
+
+
+def _anova_result_row(statistical_test_id: int, result: dict) -> OneWayANOVAResult:
+    return OneWayANOVAResult(
+        statistical_test_id=statistical_test_id,
+        between_df=result["test_stats"]["between_df"],
+        between_f=result["test_stats"]["between_f"],
+        between_mean_sq=result["test_stats"]["between_mean_sq"],
+        between_sig=result["test_stats"]["between_sig"],
+        between_sum_sq=result["test_stats"]["between_sum_sq"],
+        conf_level=result["test_stats"]["conf_level"],
+        total_df=result["test_stats"]["total_df"],
+        total_sum_sq=result["test_stats"]["total_sum_sq"],
+        within_mean_sq=result["test_stats"]["within_mean_sq"],
+        within_df=result["test_stats"]["within_df"],
+        within_sum_sq=result["test_stats"]["within_sum_sq"],
+
+        total_ci_lower=result["total_descriptive_stats"]["ci_lower"],
+        total_ci_upper=result["total_descriptive_stats"]["ci_upper"],
+        total_mean=result["total_descriptive_stats"]["mean"],
+        total_n=result["total_descriptive_stats"]["n"],
+        total_sd=result["total_descriptive_stats"]["sd"],
+        total_se=result["total_descriptive_stats"]["se"],
+
+        group_descriptive_stats=result["group_descriptive_stats"],
+        post_hoc=result.get("post_hoc")
+    )
+
+
+def _paired_result_row(statistical_test_id: int, result: dict) -> PairedTTestResult:
+    return PairedTTestResult(
+        statistical_test_id=statistical_test_id,
+        # test stats
+        t_statistic=result["test_stats"]["t_statistic"],
+        df=result["test_stats"]["df"],
+        p_value=result["test_stats"]["p_value"],
+        confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
+        confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
+        conf_level=result["test_stats"]["conf_level"],
+
+        # group1 stats
+        group1_name=result["group1_stats"]["group_name"],
+        stats_group1_max=result["group1_stats"]["max"],
+        stats_group1_mean=result["group1_stats"]["mean"],
+        stats_group1_median=result["group1_stats"]["median"],
+        stats_group1_min=result["group1_stats"]["min"],
+        stats_group1_n=result["group1_stats"]["n"],
+        stats_group1_sd=result["group1_stats"]["sd"],
+        stats_group1_se=result["group1_stats"]["se"],
+
+        # group2 stats
+        group2_name=result["group2_stats"]["group_name"],
+        stats_group2_max=result["group2_stats"]["max"],
+        stats_group2_mean=result["group2_stats"]["mean"],
+        stats_group2_median=result["group2_stats"]["median"],
+        stats_group2_min=result["group2_stats"]["min"],
+        stats_group2_n=result["group2_stats"]["n"],
+        stats_group2_sd=result["group2_stats"]["sd"],
+        stats_group2_se=result["group2_stats"]["se"],
+
+        # diff stats
+        stats_diff_max=result["diff_stats"]["max"],
+        stats_diff_mean=result["diff_stats"]["mean"],
+        stats_diff_median=result["diff_stats"]["median"],
+        stats_diff_min=result["diff_stats"]["min"],
+        stats_diff_n=result["diff_stats"]["n"],
+        stats_diff_sd=result["diff_stats"]["sd"],
+        stats_diff_se=result["diff_stats"]["se"]
+    )
+
+
+def _independent_result_row(statistical_test_id: int, result: dict) -> IndependentTTestResult:
+    return IndependentTTestResult(
+        statistical_test_id=statistical_test_id,
+        # test stats
+        t_statistic=result["test_stats"]["t_statistic"],
+        df=result["test_stats"]["degrees_of_freedom"],
+        p_value=result["test_stats"]["p_value"],
+        confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
+        confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
+        conf_level=result["test_stats"]["conf_level"],
+
+        # group1 stats
+        group1_name=result["group1_stats"]["group_name"],
+        stats_group1_max=result["group1_stats"]["max"],
+        stats_group1_mean=result["group1_stats"]["mean"],
+        stats_group1_median=result["group1_stats"]["median"],
+        stats_group1_min=result["group1_stats"]["min"],
+        stats_group1_n=result["group1_stats"]["n"],
+        stats_group1_sd=result["group1_stats"]["sd"],
+        stats_group1_se=result["group1_stats"]["se"],
+
+        # group2 stats
+        group2_name=result["group2_stats"]["group_name"],
+        stats_group2_max=result["group2_stats"]["max"],
+        stats_group2_mean=result["group2_stats"]["mean"],
+        stats_group2_median=result["group2_stats"]["median"],
+        stats_group2_min=result["group2_stats"]["min"],
+        stats_group2_n=result["group2_stats"]["n"],
+        stats_group2_sd=result["group2_stats"]["sd"],
+        stats_group2_se=result["group2_stats"]["se"]
+    )
+
+
+def _one_sample_result_row(statistical_test_id: int, result: dict) -> OneSampleTTestResult:
+    return OneSampleTTestResult(
+        statistical_test_id=statistical_test_id,
+        # test stats
+        t_statistic=result["test_stats"]["t_statistic"],
+        df=result["test_stats"]["df"],
+        p_value=result["test_stats"]["p_value"],
+        confidence_interval_upper=result["test_stats"]["confidence_interval_upper"],
+        confidence_interval_lower=result["test_stats"]["confidence_interval_lower"],
+        conf_level=result["test_stats"]["conf_level"],
+        mu=result["test_stats"]["mu"],
+
+        # group stats
+        group_name=result["group_stats"]["group_name"],
+        stats_max=result["group_stats"]["stats_max"],
+        stats_mean=result["group_stats"]["stats_mean"],
+        stats_median=result["group_stats"]["stats_median"],
+        stats_min=result["group_stats"]["stats_min"],
+        stats_n=result["group_stats"]["stats_n"],
+        stats_sd=result["group_stats"]["stats_sd"],
+        stats_se=result["group_stats"]["stats_se"],
+        stats_q1=result["group_stats"]["stats_q1"],
+        stats_q3=result["group_stats"]["stats_q3"],
+        stats_var=result["group_stats"]["stats_var"]
+    )
+
+
+def _mann_whitney_result_row(statistical_test_id: int, result: dict) -> MannWhitneyUResult:
+    return MannWhitneyUResult(
+        statistical_test_id=statistical_test_id,
+        # test stats
+        w_statistic=result["test_stats"]["w_statistic"],
+        z_statistic=result["test_stats"]["z_statistic"],
+        p_value=result["test_stats"]["p_value"],
+        rank_biserial=result["test_stats"]["rank_biserial"],
+        conf_level=result["test_stats"]["conf_level"],
+
+        # group1 stats
+        group1_name=result["group1_stats"]["group_name"],
+        stats_group1_n=result["group1_stats"]["n"],
+        stats_group1_median=result["group1_stats"]["median"],
+        stats_group1_mean_rank=result["group1_stats"]["mean_rank"],
+
+        # group2 stats
+        group2_name=result["group2_stats"]["group_name"],
+        stats_group2_n=result["group2_stats"]["n"],
+        stats_group2_median=result["group2_stats"]["median"],
+        stats_group2_mean_rank=result["group2_stats"]["mean_rank"]
+    )
+
+
+def _wilcoxon_result_row(statistical_test_id: int, result: dict) -> WilcoxonSignedRankResult:
+    return WilcoxonSignedRankResult(
+        statistical_test_id=statistical_test_id,
+        # test stats
+        v_statistic=result["test_stats"]["v_statistic"],
+        z_statistic=result["test_stats"]["z_statistic"],
+        p_value=result["test_stats"]["p_value"],
+        rank_biserial=result["test_stats"]["rank_biserial"],
+        mu=result["test_stats"]["mu"],
+        paired=result["test_stats"]["paired"],
+        conf_level=result["test_stats"]["conf_level"],
+
+        # diff stats
+        stats_diff_n=result["diff_stats"]["n"],
+        stats_diff_n_nonzero=result["diff_stats"]["n_nonzero"],
+        stats_diff_median=result["diff_stats"]["median"],
+
+        group_stats=result["group_stats"]
+    )
+
+
+def _kruskal_wallis_result_row(statistical_test_id: int, result: dict) -> KruskalWallisResult:
+    return KruskalWallisResult(
+        statistical_test_id=statistical_test_id,
+        h_statistic=result["test_stats"]["h_statistic"],
+        df=result["test_stats"]["df"],
+        p_value=result["test_stats"]["p_value"],
+        epsilon_squared=result["test_stats"]["epsilon_squared"],
+        conf_level=result["test_stats"]["conf_level"],
+        group_stats=result["group_stats"]
+    )
+
+
+RESULT_ROW_BUILDERS = {
+    "OneWayANOVA": _anova_result_row,
+    "PairedTTest": _paired_result_row,
+    "IndependentTTest": _independent_result_row,
+    "OneSampleTTest": _one_sample_result_row,
+    "MannWhitneyU": _mann_whitney_result_row,
+    "WilcoxonSignedRank": _wilcoxon_result_row,
+    "KruskalWallis": _kruskal_wallis_result_row,
+}
+
+
+class StatisticsService:
+    @staticmethod
+    def build_statistical_test(project_id: int, request, result: dict) -> StatisticalTest:
+        test_method = getattr(request.test, "value", request.test)
+        # 엔진이 계산한 효과 크기가 있으면 클라이언트 값 대신 저장
+        effect_size_value = selected_effect_size(request.effectSize, result)
+        return StatisticalTest(
+            project_id=project_id,
+            alias=ALIASES.get(test_method, "통계"),
+            test_method=request.test,
+            hypothesis=request.hypothesis,
+            missing_value_handling=request.missingValueHandling,
+            mean_difference=request.meanDifference,
+            confidence_interval=request.confidenceInterval,
+            effect_size=request.effectSize,
+            effect_size_value=effect_size_value if effect_size_value is not None else request.effectSizeValue,
+            descriptive_stats=request.descriptiveStats,
+            value=request.value if request.summaries is None else StatisticsService.summaries_payload(request),
+            statistical_test_result=result,
+            **StatisticsService.assumption_columns(result)
+        )
+
+    @staticmethod
+    def assumption_columns(result: dict) -> dict:
+        # 엔진이 같은 호출에서 계산한 가정 검정 결과 (판단 불가면 None)
+        assumptions = result.get("assumptions") or {}
+        return {
+            "normality_satisfied": (assumptions.get("normality") or {}).get("satisfied"),
+            "homoscedasticity_satisfied": (assumptions.get("homoscedasticity") or {}).get("satisfied"),
+            "independence_satisfied": (assumptions.get("independence") or {}).get("satisfied"),
+        }
+
+    @staticmethod
+    def expand_batch(batch) -> list:
+        requests = list(batch.requests)
+        if batch.allPairs is not None:
+            if batch.allPairs.test not in ("IndependentTTest", "PairedTTest"):
+                raise ValueError("allPairs supports IndependentTTest and PairedTTest only")
+            # 요약 모드면 summaries, 표 열 참조면 columns 의 그룹 쌍으로 펼침
+            if batch.allPairs.summaries is not None:
+                if batch.allPairs.test != "IndependentTTest":
+                    # 대응표본 요약은 쌍마다 차이값 요약이 필요하므로 그룹 요약으로 펼칠 수 없음
+                    raise ValueError("allPairs with summaries supports IndependentTTest only")
+                field = "summaries"
+            elif batch.allPairs.columns is not None:
+                field = "columns"
+            else:
+                field = "value"
+            groups = getattr(batch.allPairs, field)
+            requests.extend(
+                batch.allPairs.model_copy(update={field: {group1: groups[group1], group2: groups[group2]}})
+                for group1, group2 in combinations(groups, 2)
+            )
+        return requests
+
+    @staticmethod
+    def summaries_payload(request) -> dict:
+        return {
+            name: [chunk.model_dump() for chunk in chunks]
+            for name, chunks in request.summaries.items()
+        }
+
+    @staticmethod
+    def save_tests(db: Session, project_id: int, requests: list, results: list) -> list:
+        """
+        StatisticalTest 와 유형별 결과 테이블을 한 트랜잭션으로 저장
+        flush 한 번으로 id 를 받은 뒤 결과 행을 한꺼번에 추가함
+        반환값은 저장된 StatisticalTest id 목록 (커밋 후 만료된 객체를 이벤트 루프에서 다시 읽지 않도록 int 로 반환)
+        """
+        tests = [
+            StatisticsService.build_statistical_test(project_id, request, result)
+            for request, result in zip(requests, results)
+        ]
+        db.add_all(tests)
+        db.flush()
+
+        db.add_all([
+            RESULT_ROW_BUILDERS[getattr(request.test, "value", request.test)](test.id, result)
+            for request, test, result in zip(requests, tests, results)
+        ])
+        test_ids = [test.id for test in tests]
+        db.commit()
+        logger.info(f"{len(tests)} statistical tests saved")
+        return test_ids
@@ -1,78 +1,110 @@
 from typing import Dict, Optional, Union
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import (
     StatisticalTest,
     OneWayANOVAResult,
     PairedTTestResult,
     IndependentTTestResult,
-    OneSampleTTestResult
+    OneSampleTTestResult,
+    MannWhitneyUResult,
+    WilcoxonSignedRankResult,
+    KruskalWallisResult
 )
 from schemas.results import (
     ANOVAResult,
     PairedTTestResultResponse,
     IndependentTTestResultResponse,
-    OneSampleTTestResultResponse
+    OneSampleTTestResultResponse,
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
 )
 
-def get_statistical_test_result(test_id: int, db: Session) -> Optional[Union[
+# 비모수 검정 결과 테이블
+RANK_RESULT_MODELS = {
+    "MannWhitneyU": MannWhitneyUResult,
+    "WilcoxonSignedRank": WilcoxonSignedRankResult,
+    "KruskalWallis": KruskalWallisResult,
+}
+
+async def get_statistical_test_result(test_id: int, db: AsyncSession) -> Optional[Union[
     ANOVAResult,
     PairedTTestResultResponse,
     IndependentTTestResultResponse,
-    OneSampleTTestResultResponse
+    OneSampleTTestResultResponse,
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
 ]]:
-    test = db.query(StatisticalTest).filter(
-        StatisticalTest.id == test_id
-    ).first()
+    test = await db.get(StatisticalTest, test_id)
 
     if not test:
         return None
 
     if test.test_method == "OneWayANOVA":
-        return _handle_anova_result(test, db)
+        return await _handle_anova_result(test, db)
     elif test.test_method == "PairedTTest":
-        return _handle_paired_ttest_result(test, db)
+        return await _handle_paired_ttest_result(test, db)
     elif test.test_method == "IndependentTTest":
-        return _handle_independent_ttest_result(test, db)
+        return await _handle_independent_ttest_result(test, db)
     elif test.test_method == "OneSampleTTest":
-        return _handle_one_sample_ttest_result(test, db)
+        return await _handle_one_sample_ttest_result(test, db)
+    elif test.test_method in RANK_RESULT_MODELS:
+        return await _handle_rank_test_result(test, db)
     
     return None
 
-def _handle_anova_result(test: StatisticalTest, db: Session) -> Optional[ANOVAResult]:
-    result = db.query(OneWayANOVAResult).filter(
+async def _handle_anova_result(test: StatisticalTest, db: AsyncSession) -> Optional[ANOVAResult]:
+    result = await db.scalar(select(OneWayANOVAResult).where(
         OneWayANOVAResult.statistical_test_id == test.id
-    ).first()
+    ))
     
     if not result:
         return None
 
     return {**test.__dict__, **result.__dict__}
 
-def _handle_paired_ttest_result(test: StatisticalTest, db: Session) -> Optional[PairedTTestResultResponse]:
-    result = db.query(PairedTTestResult).filter(
+async def _handle_paired_ttest_result(test: StatisticalTest, db: AsyncSession) -> Optional[PairedTTestResultResponse]:
+    result = await db.scalar(select(PairedTTestResult).where(
         PairedTTestResult.statistical_test_id == test.id
-    ).first()
+    ))
 
     if not result:
         return None
 
     return {**test.__dict__, **result.__dict__}
 
-def _handle_independent_ttest_result(test: StatisticalTest, db: Session) -> Optional[IndependentTTestResultResponse]:
-    result = db.query(IndependentTTestResult).filter(
+async def _handle_independent_ttest_result(test: StatisticalTest, db: AsyncSession) -> Optional[IndependentTTestResultResponse]:
+    result = await db.scalar(select(IndependentTTestResult).where(
         IndependentTTestResult.statistical_test_id == test.id
-    ).first()
+    ))
 
     if not result:
         return None
 
     return {**test.__dict__, **result.__dict__}
 
-def _handle_one_sample_ttest_result(test: StatisticalTest, db: Session) -> Optional[OneSampleTTestResultResponse]:
-    result = db.query(OneSampleTTestResult).filter(
+async def _handle_one_sample_ttest_result(test: StatisticalTest, db: AsyncSession) -> Optional[OneSampleTTestResultResponse]:
+    result = await db.scalar(select(OneSampleTTestResult).where(
         OneSampleTTestResult.statistical_test_id == test.id
-    ).first()
+    ))
+
+    if not result:
+        return None
+
+    return {**test.__dict__, **result.__dict__}
+
+async def _handle_rank_test_result(test: StatisticalTest, db: AsyncSession) -> Optional[Union[
+    MannWhitneyUResultResponse,
+    WilcoxonSignedRankResultResponse,
+    KruskalWallisResultResponse
+]]:
+    model = RANK_RESULT_MODELS[test.test_method]
+    result = await db.scalar(select(model).where(
+        model.statistical_test_id == test.id
+    ))
 
     if not result:
         return None
@@ -0,0 +1,254 @@
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+import logging
+import numpy as np
+from dotenv import load_dotenv
+from sqlalchemy.exc import SQLAlchemyError
+from models import StatisticalResultCache
+from models.base import SessionLocal
+from .stats_engine import DEFAULT_MU
+from .missing_values import DEFAULT_MISSING_VALUE_HANDLING
+from .assumptions import SHAPIRO_MAX_N
+from .rworker import run_statistic_job, run_statistic_batch
+from .executors import db_executor, stats_executor
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+STATS_CACHE_SIZE = int(os.getenv("STATS_CACHE_SIZE", 1024))
+STATS_CACHE_PERSISTENT = os.getenv("STATS_CACHE_PERSISTENT", "false").lower() == "true"
+
+# 결과 dict 구조가 바뀌면 올려서 이전 구조로 저장된 캐시를 쓰지 않도록 함
+RESULT_SCHEMA_VERSION = 2
+
+
+def _normalize_conf_level(conf_level: float) -> float:
+    if conf_level > 1:
+        return conf_level / 100
+    return conf_level
+
+
+def make_cache_key(test_method: str, hypothesis: str, conf_level: float, groups_data: dict, mu: float = DEFAULT_MU,
+                   missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING, engine: str = None) -> str:
+    """
+    (엔진, Shapiro-Wilk 표본 상한, test method, hypothesis, conf level, 결측 처리, 그룹 데이터) 의 정규화된 sha256
+    엔진 (R / NumPy) 이나 SHAPIRO_MAX_N 이 다르면 결과가 다를 수 있으므로 키에 포함
+    None 은 nan 으로 맞춰서 해시
+    1 과 1.0 처럼 같은 값은 float64 로 맞춰서 같은 키가 나오도록 함
+    그룹 순서는 결과(group1/group2)에 영향을 주므로 유지
+    """
+    digest = hashlib.sha256()
+    header = f"v{RESULT_SCHEMA_VERSION}|{engine}|{SHAPIRO_MAX_N}|{getattr(test_method, 'value', test_method)}|{getattr(hypothesis, 'value', hypothesis)}|" \
+             f"{float(_normalize_conf_level(conf_level))!r}|{float(mu)!r}|" \
+             f"{getattr(missing_value_handling, 'value', missing_value_handling)}"
+    digest.update(header.encode("utf-8"))
+    for group_name, values in groups_data.items():
+        name = str(group_name).encode("utf-8")
+        digest.update(len(name).to_bytes(4, "little"))
+        digest.update(name)
+        data = np.asarray(values, dtype=np.float64)
+        digest.update(data.size.to_bytes(8, "little"))
+        digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+class StatisticsCache:
+    """
+    통계 결과 LRU 캐시
+    - 메모리: 최근 사용 순으로 max_entries 개 유지
+    - persistent=True 면 statistical_result_cache 테이블을 2차 캐시로 사용
+    """
+
+    def __init__(self, max_entries: int = STATS_CACHE_SIZE, persistent: bool = STATS_CACHE_PERSISTENT):
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str):
+        result = self._get_memory(key)
+        if result is None:
+            result = self._get_persistent(key)
+        return result
+
+    def put(self, key: str, test_method: str, result: dict):
+        self._remember(key, copy.deepcopy(result))
+        if self.persistent:
+            self._store(key, test_method, result)
+
+    async def get_async(self, key: str):
+        """get 과 같지만 DB 조회는 db_executor 에서 (메모리 hit 는 이벤트 루프에서 바로 반환)"""
+        result = self._get_memory(key)
+        if result is None:
+            result = await db_executor.run(self._get_persistent, key)
+        return result
+
+    async def put_async(self, key: str, test_method: str, result: dict):
+        self._remember(key, copy.deepcopy(result))
+        if self.persistent:
+            await db_executor.run(self._store, key, test_method, result)
+
+    async def get_many_async(self, keys: list) -> list:
+        # 메모리에 없는 키만 모아서 db_executor 호출 한 번으로 조회
+        results = [self._get_memory(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            loaded = await db_executor.run(lambda: [self._get_persistent(keys[i]) for i in missing])
+            for i, result in zip(missing, loaded):
+                results[i] = result
+        return results
+
+    async def put_many_async(self, entries: list):
+        """entries: [(key, test_method, result), ...]"""
+        for key, _, result in entries:
+            self._remember(key, copy.deepcopy(result))
+        if self.persistent and entries:
+            await db_executor.run(lambda: [self._store(*entry) for entry in entries])
+
+    def _get_memory(self, key: str):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(result)
+        return None
+
+    def _get_persistent(self, key: str):
+        if self.persistent:
+            result = self._load(key)
+            if result is not None:
+                with self._lock:
+                    self.persistent_hits += 1
+                self._remember(key, result)
+                return copy.deepcopy(result)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _remember(self, key: str, result: dict):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _load(self, key: str):
+        db = SessionLocal()
+        try:
+            row = db.query(StatisticalResultCache.result).filter(
+                StatisticalResultCache.cache_key == key
+            ).first()
+            return row[0] if row else None
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading statistics cache: {str(e)}")
+            return None
+        finally:
+            db.close()
+
+    def _store(self, key: str, test_method: str, result: dict):
+        # 요청 트랜잭션과 분리해서 저장 (동시 요청이 같은 키를 넣어도 본 요청은 실패하지 않도록)
+        db = SessionLocal()
+        try:
+            db.add(StatisticalResultCache(
+                cache_key=key,
+                test_method=getattr(test_method, "value", test_method),
+                result=result
+            ))
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning(f"Statistics cache entry not stored: {str(e)}")
+        finally:
+            db.close()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "persistent": self.persistent,
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.persistent_hits) / lookups if lookups else 0.0,
+            }
+
+
+statistics_cache = StatisticsCache()
+
+
+async def run_cached_statistic_job(engine: str, test_method: str, hypothesis: str, groups_data: dict,
+                                   conf_level: float, mu: float = DEFAULT_MU,
+                                   missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING) -> dict:
+    # 키 계산은 데이터 크기에 비례하므로 이벤트 루프가 아니라 stats_executor 에서
+    key = await stats_executor.run(
+        make_cache_key, test_method, hypothesis, conf_level, groups_data, mu, missing_value_handling, engine
+    )
+    result = await statistics_cache.get_async(key)
+    if result is not None:
+        logger.info(f"statistics cache hit: {key[:12]}")
+        return result
+
+    result = await run_statistic_job(engine, test_method, groups_data, conf_level, mu, missing_value_handling)
+    await statistics_cache.put_async(key, test_method, result)
+    return result
+
+
+async def run_cached_statistic_batch(engine: str, jobs: list) -> list:
+    """
+    jobs: [{"test_method", "hypothesis", "groups_data", "conf_level", "mu", "missing_value_handling"}, ...]
+    캐시에 없는 작업만 모아서 엔진을 한 번 호출
+    """
+    keys = await stats_executor.run(lambda: [
+        make_cache_key(job["test_method"], job["hypothesis"], job["conf_level"], job["groups_data"], job["mu"],
+                       job.get("missing_value_handling", DEFAULT_MISSING_VALUE_HANDLING), engine)
+        for job in jobs
+    ])
+    results = await statistics_cache.get_many_async(keys)
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        computed = await run_statistic_batch(engine, [
+            {
+                "test_method": jobs[i]["test_method"],
+                "groups_data": jobs[i]["groups_data"],
+                "conf_level": jobs[i]["conf_level"],
+                "mu": jobs[i]["mu"],
+                "missing_value_handling": jobs[i].get("missing_value_handling", DEFAULT_MISSING_VALUE_HANDLING),
+            }
+            for i in missing
+        ])
+        for i, result in zip(missing, computed):
+            results[i] = result
+        await statistics_cache.put_many_async([(keys[i], jobs[i]["test_method"], results[i]) for i in missing])
+
+    logger.info(f"statistics batch: {len(jobs)} jobs, {len(jobs) - len(missing)} cache hits")
+    return results
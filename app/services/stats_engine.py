@@ -0,0 +1,169 @@
+import importlib
+import os
+import logging
+from dotenv import load_dotenv
+from .missing_values import apply_missing_value_handling, DEFAULT_MISSING_VALUE_HANDLING
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# 배포 단위 기본 엔진 // r, numpy
+DEFAULT_ENGINE = os.getenv("STATISTICS_ENGINE", "r")
+
+# OneSampleTTest 의 기본 비교 평균
+DEFAULT_MU = 3
+
+
+# 서버 시작 시 엔진 예열용 합성 데이터 (모든 검정을 한 번씩 실행해서 R 패키지 로드, 첫 dispatch, 변환 설정을 미리 끝냄)
+WARMUP_GROUPS = {
+    "group1": [1.0, 2.0, 1.0, 3.0, 2.0, 1.0, 2.5, 1.5],
+    "group2": [5.0, 4.0, 5.0, 5.0, 3.0, 4.0, 4.5, 3.5],
+    "group3": [7.0, 8.0, 6.0, 7.0, 8.0, 7.0, 6.5, 7.5],
+}
+WARMUP_TESTS = {
+    "IndependentTTest": ("group1", "group2"),
+    "PairedTTest": ("group1", "group2"),
+    "OneSampleTTest": ("group1",),
+    "OneWayANOVA": ("group1", "group2", "group3"),
+    "MannWhitneyU": ("group1", "group2"),
+    "WilcoxonSignedRank": ("group1", "group2"),
+    "KruskalWallis": ("group1", "group2", "group3"),
+}
+
+
+def rss_mb():
+    """현재 프로세스 RSS (Mb), /proc 이 없는 플랫폼에서는 None"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def warmup_jobs() -> list:
+    return [
+        {
+            "test_method": test_method,
+            "groups_data": {group: WARMUP_GROUPS[group] for group in groups},
+            "conf_level": 0.95,
+        }
+        for test_method, groups in WARMUP_TESTS.items()
+    ]
+
+
+class StatisticsBackend:
+    """
+    통계 엔진 인터페이스
+    모든 엔진은 rscripts.py 와 같은 결과 dict (test_stats, group1_stats, group_descriptive_stats ...) 를 반환해야 함
+    """
+    name = None
+    module = None
+
+    def _impl(self):
+        # rpy2 가 없는 배포에서도 numpy 엔진은 쓸 수 있도록 처음 호출될 때 import
+        return importlib.import_module(self.module, __package__)
+
+    def independent_t_test(self, groups_data: dict, conf_level: float) -> dict:
+        return self._impl().independent_t_test(groups_data, conf_level)
+
+    def paired_t_test(self, groups_data: dict, conf_level: float) -> dict:
+        return self._impl().paired_t_test(groups_data, conf_level)
+
+    def one_sample_t_test(self, group_data: dict, mu: float, conf_level: float) -> dict:
+        return self._impl().one_sample_t_test(group_data, mu, conf_level)
+
+    def one_way_anova(self, groups_data: dict, conf_level: float) -> dict:
+        return self._impl().one_way_anova(groups_data, conf_level)
+
+    def mann_whitney_u(self, groups_data: dict, conf_level: float) -> dict:
+        return self._impl().mann_whitney_u(groups_data, conf_level)
+
+    def wilcoxon_signed_rank(self, groups_data: dict, mu: float, conf_level: float) -> dict:
+        return self._impl().wilcoxon_signed_rank(groups_data, mu, conf_level)
+
+    def kruskal_wallis(self, groups_data: dict, conf_level: float) -> dict:
+        return self._impl().kruskal_wallis(groups_data, conf_level)
+
+    def run(self, test_method: str, groups_data: dict, conf_level: float, mu: float = DEFAULT_MU,
+            missing_value_handling: str = DEFAULT_MISSING_VALUE_HANDLING) -> dict:
+        # 값에 None/NaN 이 있어도 되도록 엔진에 넘기기 전에 결측 처리
+        groups_data = apply_missing_value_handling(groups_data, test_method, missing_value_handling)
+        if test_method == "OneWayANOVA":
+            return self.one_way_anova(groups_data, conf_level)
+        elif test_method == "PairedTTest":
+            return self.paired_t_test(groups_data, conf_level)
+        elif test_method == "IndependentTTest":
+            return self.independent_t_test(groups_data, conf_level)
+        elif test_method == "OneSampleTTest":
+            return self.one_sample_t_test(groups_data, mu, conf_level)
+        elif test_method == "MannWhitneyU":
+            return self.mann_whitney_u(groups_data, conf_level)
+        elif test_method == "WilcoxonSignedRank":
+            # 그룹이 하나면 단일표본 (mu), 둘이면 대응표본
+            return self.wilcoxon_signed_rank(groups_data, mu, conf_level)
+        elif test_method == "KruskalWallis":
+            return self.kruskal_wallis(groups_data, conf_level)
+        raise ValueError(f"Unsupported test method: {test_method}")
+
+    def warm_up(self) -> list:
+        """함수 라이브러리를 로드하고 모든 검정을 합성 데이터로 한 번씩 실행"""
+        self._impl()
+        return self.run_batch(warmup_jobs())
+
+    def memory_usage(self, collect: bool = False) -> dict:
+        """
+        프로세스 RSS 와 엔진 자체 힙 사용량 (R 은 Ncells/Vcells)
+        collect=True 면 엔진 힙을 먼저 수집
+        """
+        impl = self._impl()
+        memory = impl.memory_usage(collect) if hasattr(impl, "memory_usage") else {}
+        return {**memory, "rss_mb": rss_mb()}
+
+    def run_batch(self, jobs: list) -> list:
+        """
+        jobs: [{"test_method": ..., "groups_data": ..., "conf_level": ..., "mu": ..., "missing_value_handling": ...}, ...]
+        결과는 jobs 와 같은 순서
+        """
+        return [self.run(**job) for job in jobs]
+
+
+class RBackend(StatisticsBackend):
+    """rpy2 임베디드 R 엔진 (기준 엔진)"""
+    name = "r"
+    module = ".rscripts"
+
+
+class NumpyBackend(StatisticsBackend):
+    """R 없이 동작하는 NumPy/SciPy 엔진"""
+    name = "numpy"
+    module = ".numpy_stats"
+
+
+_backends = {
+    RBackend.name: RBackend(),
+    NumpyBackend.name: NumpyBackend(),
+}
+
+
+def get_backend(name: str = None) -> StatisticsBackend:
+    """
+    name 이 없으면 STATISTICS_ENGINE 환경변수의 엔진을 사용
+    """
+    engine = getattr(name, "value", name) or DEFAULT_ENGINE
+    backend = _backends.get(engine)
+    if backend is None:
+        raise ValueError(f"Unknown statistics engine: {engine}")
+    return backend
@@ -0,0 +1,294 @@
+import numpy as np
+from scipy import stats
+import logging
+from .stats_engine import DEFAULT_MU
+from .assumptions import build_assumptions, bartlett_from_variances
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+# 원본 데이터 대신 그룹별 (n, mean, M2) 요약만으로 t-test / ANOVA 계산
+# 계산량과 요청 크기가 관측치 수가 아니라 그룹 수에 비례함
+# min/max/median/사분위수는 요약으로 알 수 없으므로 None
+# 가정 검정도 정규성/Levene/독립성은 원본이 필요하므로 None, Bartlett 만 분산으로 계산
+
+
+class GroupSummary:
+    """
+    Welford/Chan 방식으로 합칠 수 있는 그룹 요약 (n, mean, M2 = 편차 제곱합)
+    - update: 값 하나씩 추가 (Welford)
+    - merge: 다른 청크/워커의 요약과 합침 (Chan et al.)
+    """
+
+    def __init__(self, n: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.n = int(n)
+        self.mean = float(mean)
+        self.m2 = float(m2)
+
+    @classmethod
+    def from_values(cls, values) -> "GroupSummary":
+        x = np.asarray(values, dtype=np.float64)
+        if x.size == 0:
+            return cls()
+        mean = float(np.mean(x))
+        return cls(x.size, mean, float(np.sum((x - mean) ** 2)))
+
+    @classmethod
+    def combine(cls, summaries) -> "GroupSummary":
+        total = cls()
+        for summary in summaries:
+            total.merge(summary)
+        return total
+
+    def update(self, value: float) -> "GroupSummary":
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+        return self
+
+    def merge(self, other: "GroupSummary") -> "GroupSummary":
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else float("nan")
+
+    @property
+    def sd(self) -> float:
+        return float(np.sqrt(self.variance))
+
+    @property
+    def se(self) -> float:
+        return self.sd / float(np.sqrt(self.n))
+
+    def to_dict(self) -> dict:
+        return {"n": self.n, "mean": self.mean, "m2": self.m2}
+
+
+def _normalize_conf_level(conf_level: float) -> float:
+    if conf_level > 1:
+        return conf_level / 100
+    return conf_level
+
+def _as_summary(summary) -> GroupSummary:
+    # dict / pydantic 모델 / GroupSummary, 또는 그 리스트(청크별 요약) 모두 허용
+    if isinstance(summary, GroupSummary):
+        return summary
+    if isinstance(summary, (list, tuple)):
+        return GroupSummary.combine(_as_summary(chunk) for chunk in summary)
+    if not isinstance(summary, dict):
+        summary = summary.model_dump()
+    return GroupSummary(summary["n"], summary["mean"], summary["m2"])
+
+def merge_summaries(summaries: dict) -> dict:
+    """{"group1": [chunk, chunk, ...], ...} -> {"group1": GroupSummary, ...}"""
+    merged = {name: _as_summary(chunks) for name, chunks in summaries.items()}
+    for name, summary in merged.items():
+        if summary.n < 2:
+            raise ValueError(f"Group '{name}' needs at least two observations")
+    return merged
+
+def _desc_stats(summary: GroupSummary) -> dict:
+    return {
+        'n': float(summary.n),
+        'mean': summary.mean,
+        'sd': summary.sd,
+        'se': summary.se,
+        'min': None,
+        'max': None,
+        'median': None
+    }
+
+def _two_sided_t(t_statistic: float, df: float) -> float:
+    return float(2 * stats.t.sf(abs(t_statistic), df))
+
+def _t_conf_int(estimate: float, se: float, df: float, conf_level: float):
+    margin = stats.t.ppf(1 - (1 - conf_level) / 2, df) * se
+    return float(estimate - margin), float(estimate + margin)
+
+def _group_ci_stats(summary: GroupSummary, conf_level: float) -> dict:
+    # rscripts 의 calculate_stats 와 동일하게 qt(conf_level, n-1) 사용
+    margin = float(stats.t.ppf(conf_level, summary.n - 1)) * summary.se
+    return {
+        'n': summary.n,
+        'mean': summary.mean,
+        'sd': summary.sd,
+        'se': summary.se,
+        'ci_lower': summary.mean - margin,
+        'ci_upper': summary.mean + margin
+    }
+
+def _summary_assumptions(merged: dict) -> dict:
+    nan = float("nan")
+    if len(merged) > 1:
+        bartlett_k2, bartlett_p = bartlett_from_variances(
+            [s.n for s in merged.values()], [s.variance for s in merged.values()]
+        )
+    else:
+        bartlett_k2, bartlett_p = nan, nan
+    values = [nan, nan, nan] * len(merged) + [nan, nan, bartlett_k2, bartlett_p, nan]
+    return build_assumptions(list(merged), values)
+
+def independent_t_test(summaries: dict, conf_level: float):
+    conf_level = _normalize_conf_level(conf_level)
+    if len(summaries) != 2:
+        raise ValueError("Exactly two groups must be provided")
+
+    merged = merge_summaries(summaries)
+    (group1, x), (group2, y) = merged.items()
+
+    degrees_of_freedom = float(x.n + y.n - 2)
+    pooled_var = (x.m2 + y.m2) / degrees_of_freedom
+    se = float(np.sqrt(pooled_var * (1 / x.n + 1 / y.n)))
+    mean_diff = x.mean - y.mean
+
+    t_statistic = mean_diff / se
+    confidence_interval_lower, confidence_interval_upper = _t_conf_int(mean_diff, se, degrees_of_freedom, conf_level)
+
+    return {
+        "group1_stats": {'group_name': group1, **_desc_stats(x)},
+        "group2_stats": {'group_name': group2, **_desc_stats(y)},
+        "test_stats": {
+            't_statistic': float(t_statistic),
+            'degrees_of_freedom': degrees_of_freedom,
+            'p_value': _two_sided_t(t_statistic, degrees_of_freedom),
+            'confidence_interval_upper': confidence_interval_upper,
+            'confidence_interval_lower': confidence_interval_lower,
+            'conf_level': conf_level
+        },
+        "assumptions": _summary_assumptions(merged)
+    }
+
+def one_sample_t_test(summaries: dict, mu: float, conf_level: float):
+    conf_level = _normalize_conf_level(conf_level)
+    if len(summaries) != 1:
+        raise ValueError("Exactly one group must be provided")
+
+    merged = merge_summaries(summaries)
+    (group_name, x), = merged.items()
+
+    degrees_of_freedom = float(x.n - 1)
+    t_statistic = (x.mean - mu) / x.se
+    confidence_interval_lower, confidence_interval_upper = _t_conf_int(x.mean, x.se, degrees_of_freedom, conf_level)
+
+    return {
+        "group_stats": {
+            "group_name": group_name,
+            "stats_min": None,
+            "stats_max": None,
+            "stats_median": None,
+            "stats_mean": x.mean,
+            "stats_sd": x.sd,
+            "stats_se": x.se,
+            "stats_n": float(x.n),
+            "stats_q1": None,
+            "stats_q3": None,
+            "stats_var": x.variance,
+        },
+        "test_stats": {
+            "t_statistic": float(t_statistic),
+            "df": degrees_of_freedom,
+            "p_value": _two_sided_t(t_statistic, degrees_of_freedom),
+            "confidence_interval_lower": confidence_interval_lower,
+            "confidence_interval_upper": confidence_interval_upper,
+            "conf_level": conf_level,
+            "mu": mu,
+        },
+        "assumptions": _summary_assumptions(merged)
+    }
+
+def paired_t_test(summaries: dict, conf_level: float):
+    """
+    대응표본 t 검정 = 차이값 (group1 - group2) 의 단일표본 t 검정 (mu = 0)
+    그룹별 요약으로는 공분산을 알 수 없으므로 차이값의 요약 하나만 받음
+    """
+    if len(summaries) != 1:
+        raise ValueError("PairedTTest summaries must be a single summary of the differences (group1 - group2)")
+    one_sample = one_sample_t_test(summaries, 0.0, conf_level)
+    (group_name, chunks), = summaries.items()
+    diff = _as_summary(chunks)
+    # 그룹별 값은 알 수 없으므로 쌍의 수만 채움
+    group_stats = {**_desc_stats(diff), 'mean': None, 'sd': None, 'se': None}
+
+    test_stats = one_sample["test_stats"]
+    return {
+        "group1_stats": {'group_name': group_name, **group_stats},
+        "group2_stats": {'group_name': None, **group_stats},
+        "diff_stats": _desc_stats(diff),
+        "test_stats": {
+            't_statistic': test_stats["t_statistic"],
+            'df': test_stats["df"],
+            'p_value': test_stats["p_value"],
+            'confidence_interval_lower': test_stats["confidence_interval_lower"],
+            'confidence_interval_upper': test_stats["confidence_interval_upper"],
+            'conf_level': test_stats["conf_level"]
+        },
+        "assumptions": _summary_assumptions({"diff": diff})
+    }
+
+def one_way_anova(summaries: dict, conf_level: float):
+    conf_level = _normalize_conf_level(conf_level)
+    merged = merge_summaries(summaries)
+    if len(merged) < 2:
+        raise ValueError("At least two groups must be provided")
+
+    total = GroupSummary.combine(merged.values())
+
+    between_sum_sq = float(sum(s.n * (s.mean - total.mean) ** 2 for s in merged.values()))
+    within_sum_sq = float(sum(s.m2 for s in merged.values()))
+    between_df = float(len(merged) - 1)
+    within_df = float(total.n - len(merged))
+    between_mean_sq = between_sum_sq / between_df
+    within_mean_sq = within_sum_sq / within_df
+    between_f = between_mean_sq / within_mean_sq
+
+    test_stats = {
+        "between_sum_sq": between_sum_sq,
+        "between_df": between_df,
+        "between_mean_sq": between_mean_sq,
+        "between_f": float(between_f),
+        "between_sig": float(stats.f.sf(between_f, between_df, within_df)),
+        "within_sum_sq": within_sum_sq,
+        "within_df": within_df,
+        "within_mean_sq": within_mean_sq,
+        "total_sum_sq": between_sum_sq + within_sum_sq,
+        "total_df": between_df + within_df,
+        "conf_level": conf_level,
+    }
+
+    return {
+        "test_stats": test_stats,
+        "group_descriptive_stats": {name: _group_ci_stats(s, conf_level) for name, s in merged.items()},
+        "total_descriptive_stats": _group_ci_stats(total, conf_level),
+        "assumptions": _summary_assumptions(merged)
+    }
+
+def run(test_method: str, summaries: dict, conf_level: float, mu: float = DEFAULT_MU) -> dict:
+    test_method = getattr(test_method, "value", test_method)
+    if test_method == "IndependentTTest":
+        return independent_t_test(summaries, conf_level)
+    if test_method == "OneSampleTTest":
+        return one_sample_t_test(summaries, mu, conf_level)
+    if test_method == "PairedTTest":
+        return paired_t_test(summaries, conf_level)
+    if test_method == "OneWayANOVA":
+        return one_way_anova(summaries, conf_level)
+    raise ValueError(f"{test_method} does not support summary statistics")
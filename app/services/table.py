@@ -0,0 +1,162 @@
+import math
+import logging
+import numpy as np
+from sqlalchemy.orm import Session
+from models import Project, TableData
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+# 프로젝트 표 (TableData, /projects/table 웹소켓으로 편집) 를 통계 입력으로 읽는 함수 모음
+# 0번 행은 header=True 일 때 열 이름
+
+def parse_cell(value):
+    """셀 문자열 -> (숫자 여부, 값), 빈 셀과 nan/inf 는 결측"""
+    if value is None or not str(value).strip():
+        return True, math.nan
+    try:
+        number = float(value)
+    except ValueError:
+        return False, math.nan
+    return True, number if math.isfinite(number) else math.nan
+
+
+def load_table_matrix(db: Session, project_id: int, header: bool = True) -> tuple:
+    """
+    프로젝트 표를 한 번에 읽어서 (열 이름, 값 행렬 (행, 열) 열 우선, 관측 마스크) 반환
+    값이 아닌 셀이 하나라도 있는 열과 값이 2개 미만인 열은 제외
+    header=True 면 0번 행을 열 이름으로 사용
+    """
+    cells = db.query(TableData.row_num, TableData.col_num, TableData.value).filter(
+        TableData.project_id == project_id
+    ).all()
+    if not cells:
+        return [], np.empty((0, 0), order="F"), np.empty((0, 0), dtype=bool, order="F")
+
+    n_rows = max(row for row, _, _ in cells) + 1
+    n_cols = max(col for _, col, _ in cells) + 1
+    first_row = 1 if header else 0
+
+    values = np.full((n_rows, n_cols), np.nan, order="F")
+    numeric = np.ones(n_cols, dtype=bool)
+    names = [f"column{col + 1}" for col in range(n_cols)]
+    for row, col, value in cells:
+        if row < 0 or col < 0:
+            continue
+        if row < first_row:
+            if value is not None and str(value).strip():
+                names[col] = str(value).strip()
+            continue
+        is_number, number = parse_cell(value)
+        numeric[col] &= is_number
+        values[row, col] = number
+
+    values = values[first_row:]
+    observed = ~np.isnan(values)
+    keep = numeric & (observed.sum(axis=0) >= 2)
+    columns = np.flatnonzero(keep)
+    return [names[col] for col in columns], np.asfortranarray(values[:, columns]), np.asfortranarray(observed[:, columns])
+
+
+def load_versioned_table(db: Session, project_id: int, header: bool = True) -> tuple:
+    """
+    (표 버전, 열 이름, 값 행렬, 관측 마스크), 버전과 셀을 같은 트랜잭션에서 읽음
+    스냅샷을 보장하지 않는 격리 수준 (READ COMMITTED, SQLite 의 자동 커밋 읽기) 에서 읽는 사이에
+    수정이 저장됐으면 버전을 None 으로 반환 (호출한 쪽은 결과를 그 버전으로 캐시하지 않음)
+    """
+    version_query = db.query(Project.table_version).filter(Project.id == project_id)
+    version = version_query.scalar()
+    columns, values, observed = load_table_matrix(db, project_id, header)
+    if version_query.scalar() != version:
+        version = None
+    return version, columns, values, observed
+
+
+def _header_index(db: Session, project_id: int) -> dict:
+    # 열 이름 -> 열 번호 (0번 행만 읽음), 같은 이름이 여러 번이면 앞 열
+    cells = db.query(TableData.col_num, TableData.value).filter(
+        TableData.project_id == project_id,
+        TableData.row_num == 0
+    ).order_by(TableData.col_num.desc()).all()
+    return {str(value).strip(): col for col, value in cells if value is not None and str(value).strip()}
+
+
+def _resolve_index(reference, headers: dict) -> int:
+    if reference.col is not None:
+        return reference.col
+    if reference.header not in headers:
+        raise ValueError(f"Column not found: {reference.header}")
+    return headers[reference.header]
+
+
+def load_columns(db: Session, project_id: int, col_nums: list, header: bool = True) -> dict:
+    """
+    지정한 열들만 쿼리 한 번으로 읽어서 {열 번호: 행 순서 값 배열 (결측 nan)} 반환
+    모든 열은 같은 행 범위 (데이터 시작 행 ~ 가장 아래 셀) 로 맞춤
+    숫자가 아닌 셀이 있으면 ValueError
+    """
+    first_row = 1 if header else 0
+    col_nums = sorted(set(col_nums))
+    cells = db.query(TableData.row_num, TableData.col_num, TableData.value).filter(
+        TableData.project_id == project_id,
+        TableData.col_num.in_(col_nums),
+        TableData.row_num >= first_row
+    ).all()
+
+    n_rows = max((row for row, _, _ in cells), default=first_row - 1) + 1 - first_row
+    columns = {col: np.full(n_rows, np.nan) for col in col_nums}
+    for row, col, value in cells:
+        is_number, number = parse_cell(value)
+        if not is_number:
+            raise ValueError(f"Non-numeric value in column {col} row {row}: {value}")
+        columns[col][row - first_row] = number
+    return columns
+
+
+def resolve_column_requests(db: Session, project_id: int, requests: list) -> list:
+    """
+    columns 로 표의 열을 참조한 요청들을 value 를 채운 요청으로 바꿈 (순서 유지, 행 정렬 유지)
+    배치 전체에서 참조한 열을 쿼리 한 번으로 읽음
+    """
+    pending = [request for request in requests if request.columns is not None]
+    if not pending:
+        return requests
+
+    headers = {}
+    if any(ref.header is not None for request in pending for ref in request.columns.values()):
+        headers = _header_index(db, project_id)
+
+    by_header = {}
+    for request in pending:
+        by_header.setdefault(request.tableHeader, set()).update(
+            _resolve_index(ref, headers) for ref in request.columns.values()
+        )
+    loaded = {has_header: load_columns(db, project_id, list(col_nums), has_header)
+              for has_header, col_nums in by_header.items()}
+
+    resolved = []
+    for request in requests:
+        if request.columns is None:
+            resolved.append(request)
+            continue
+        names = list(request.columns)
+        columns = loaded[request.tableHeader]
+        # 빈 셀은 None 으로 남기고 결측 처리는 엔진이 missingValueHandling 대로 함
+        resolved.append(request.model_copy(update={
+            "value": {
+                name: [None if math.isnan(v) else v for v in columns[_resolve_index(request.columns[name], headers)].tolist()]
+                for name in names
+            }
+        }))
+    logger.info(f"{len(pending)} requests resolved from table columns")
+    return resolved
@@ -0,0 +1,185 @@
+import asyncio
+import os
+import logging
+from datetime import datetime
+from dotenv import load_dotenv
+from sqlalchemy import update
+from sqlalchemy.dialects import mysql, sqlite
+from models import Project, TableData
+from models.base import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+load_dotenv()
+
+# 표 웹소켓의 셀 수정을 모든 연결이 공유하는 writer 하나가 모아서 저장
+# 연결마다 세션을 열어두지 않으므로 열린 탭 수가 아니라 쓰기 양만큼만 DB 커넥션을 사용
+# 한 배치 = 세션 하나 + upsert 한 문장 + 커밋 한 번, 같은 셀을 여러 번 고치면 마지막 값만 저장
+TABLE_WRITE_BATCH = int(os.getenv("TABLE_WRITE_BATCH", 200))
+# 첫 수정이 들어온 뒤 같은 배치에 묶일 수정을 기다리는 시간 (초)
+TABLE_WRITE_LINGER = float(os.getenv("TABLE_WRITE_LINGER", 0.005))
+# 연결 하나가 응답을 기다리지 않고 쌓아둘 수 있는 수정 수, 넘으면 다음 메시지를 읽지 않고 기다림
+TABLE_WS_MAX_PENDING = int(os.getenv("TABLE_WS_MAX_PENDING", 1000))
+
+
+def cell_upsert(dialect: str, rows: list):
+    """
+    셀 여러 개를 한 문장으로 insert-or-update
+    (project_id, row_num, col_num) unique 인덱스로 충돌을 판단하므로 셀마다 SELECT 하지 않음
+    """
+    if dialect == "mysql":
+        statement = mysql.insert(TableData).values(rows)
+        return statement.on_duplicate_key_update(value=statement.inserted.value)
+    if dialect == "sqlite":
+        statement = sqlite.insert(TableData).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=[TableData.project_id, TableData.row_num, TableData.col_num],
+            set_={"value": statement.excluded.value},
+        )
+    raise ValueError(f"Unsupported database for cell upsert: {dialect}")
+
+
+class TableWriter:
+    """
+    write(project_id, row, col, value) 는 수정이 커밋된 뒤 반환 (실패하면 예외)
+    - 배치가 실패하면 셀마다 따로 다시 저장해서 실패한 셀의 write 만 예외
+    - 쓰기 작업은 첫 write 때 현재 이벤트 루프에서 시작, close() 로 남은 수정을 저장하고 종료
+    - batches / writes / coalesced / failed 지표
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+        self._queue = None
+        self._task = None
+        self._loop = None
+        self.batches = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.failed = 0
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def write(self, project_id: int, row_num: int, col_num: int, value):
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((project_id, row_num, col_num, value, future))
+        await future
+
+    async def _next_batch(self) -> list:
+        # close() 가 넣은 None 을 만나면 거기까지만 배치로 묶음
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + TABLE_WRITE_LINGER
+        while batch[-1] is not None and len(batch) < TABLE_WRITE_BATCH:
+            if self._queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            else:
+                batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            stopping = batch[-1] is None
+            if stopping:
+                batch.pop()
+            if batch:
+                await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: list):
+        # 입력 순서대로 덮어써서 셀마다 마지막 값만 남김 (같은 셀을 기다리는 write 는 모두 같은 결과)
+        cells, waiters = {}, {}
+        for project_id, row_num, col_num, value, future in batch:
+            cells[(project_id, row_num, col_num)] = value
+            waiters.setdefault((project_id, row_num, col_num), []).append(future)
+        self.coalesced += len(batch) - len(cells)
+
+        try:
+            await self._write_cells(cells)
+        except Exception as e:
+            if len(cells) == 1:
+                self._finish(waiters, cells, e)
+                return
+            # 여러 연결/프로젝트의 수정이 섞인 배치이므로 한 셀 때문에 전체를 실패시키지 않고 셀마다 다시 시도
+            logger.warning(f"Table batch of {len(cells)} cells failed, retrying cell by cell: {str(e)}")
+            for key, value in cells.items():
+                try:
+                    await self._write_cells({key: value})
+                except Exception as cell_error:
+                    self._finish(waiters, [key], cell_error)
+                else:
+                    self._finish(waiters, [key])
+        else:
+            self._finish(waiters, cells)
+
+    def _finish(self, waiters: dict, keys, error: Exception = None):
+        for key in keys:
+            for future in waiters[key]:
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(None)
+                else:
+                    self.failed += 1
+                    future.set_exception(error)
+        if error is not None:
+            logger.error(f"Failed to write table cells {list(keys)}: {str(error)}")
+
+    async def _write_cells(self, cells: dict):
+        rows = [
+            {"project_id": project_id, "row_num": row_num, "col_num": col_num, "value": value}
+            for (project_id, row_num, col_num), value in cells.items()
+        ]
+        async with self.session_factory() as db:
+            await db.execute(cell_upsert(db.bind.dialect.name, rows))
+            project_ids = {project_id for project_id, _, _ in cells}
+            await db.execute(update(Project).where(Project.id.in_(project_ids)).values(
+                modified_at=datetime.now(), table_version=Project.table_version + 1
+            ))
+            await db.commit()
+        self.batches += 1
+        self.writes += len(cells)
+
+    async def close(self):
+        """대기 중인 수정을 저장한 뒤 쓰기 작업 종료"""
+        if self._task is not None and not self._task.done() and self._loop is asyncio.get_running_loop():
+            await self._queue.put(None)
+            await self._task
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "writes": self.writes,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+        }
+
+
+table_writer = TableWriter()
@@ -0,0 +1,85 @@
+import time
+import logging
+from . import rworker
+from .stats_engine import get_backend, DEFAULT_ENGINE, warmup_jobs
+from .resampling import start_resampling_pool
+from .executors import stats_executor
+from .effect_sizes import add_effect_sizes
+from .posthoc import add_post_hoc
+
+logger = logging.getLogger(__name__)
+
+formatter = logging.Formatter(
+    '[%(asctime)s] %(levelname)s [%(name)s:%(lineno)d] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+handler = logging.StreamHandler()
+handler.setFormatter(formatter)
+
+logger.addHandler(handler)
+logger.setLevel(logging.INFO)
+
+# 서버 시작 후 백그라운드에서 통계 엔진을 예열하고 끝나면 ready
+# lifespan 이 예열을 기다리면 그동안 readiness 요청도 받을 수 없으므로 작업으로 분리함
+
+
+class Readiness:
+    """예열 상태 (/health/ready 응답)"""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at = None
+        self.finished_at = None
+        self.engines = {}
+
+    def to_dict(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmup_seconds": self.finished_at - self.started_at if self.finished_at else None,
+            "engines": self.engines,
+        }
+
+
+readiness = Readiness()
+
+
+async def _warm_up_engine(engine: str) -> dict:
+    """
+    R 워커 풀이 있으면 워커는 시작할 때 스스로 예열하므로 풀을 통한 왕복만 한 번 확인
+    그 외에는 현재 프로세스에서 모든 검정을 한 번씩 실행
+    """
+    started = time.perf_counter()
+    try:
+        backend = get_backend(engine)
+        if backend.name == "r" and rworker.worker_pool is not None:
+            results = [await rworker.worker_pool.submit(**job) for job in warmup_jobs()]
+        else:
+            results = await stats_executor.run(rworker.run_in_process, backend, backend.warm_up)
+        # 엔진과 무관한 후처리 (scipy 특수함수, 스튜던트화 범위 표) 도 같이 예열
+        test_methods = [job["test_method"] for job in warmup_jobs()]
+        add_effect_sizes(test_methods, results)
+        add_post_hoc(test_methods, results)
+    except Exception as e:
+        logger.error(f"{engine} engine warm-up failed: {type(e).__name__}: {e}")
+        return {"ok": False, "seconds": time.perf_counter() - started, "error": f"{type(e).__name__}: {e}"}
+    return {"ok": True, "seconds": time.perf_counter() - started, "error": None}
+
+
+async def warm_up(engines: tuple = None, default_engine: str = None):
+    """
+    워커 풀 시작 -> 엔진별 예열 -> ready
+    기본 엔진 (STATISTICS_ENGINE) 예열이 실패하면 ready 가 되지 않음
+    """
+    default_engine = default_engine or DEFAULT_ENGINE
+    engines = engines or tuple(dict.fromkeys((default_engine, "numpy")))
+    readiness.started_at = time.perf_counter()
+
+    await rworker.start_worker_pool()
+    await start_resampling_pool()
+    for engine in engines:
+        readiness.engines[engine] = await _warm_up_engine(engine)
+
+    readiness.finished_at = time.perf_counter()
+    readiness.ready = readiness.engines.get(default_engine, {}).get("ok", False)
+    logger.info(f"warm-up finished in {readiness.finished_at - readiness.started_at:.2f}s, ready: {readiness.ready}")
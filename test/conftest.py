@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# app/main.py 와 동일하게 app 디렉토리를 import 기준으로 사용
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+# 테스트에서는 실제 DB / Gemini 대신 로컬 값 사용
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("GOOGLE_API_KEY", "test")
@@ -0,0 +1,42 @@
+import numpy as np
+from scipy import stats
+
+from services import assumptions, numpy_stats, summary_stats
+from services.summary_stats import GroupSummary
+
+
+def test_anova_assumptions_match_scipy():
+    rng = np.random.default_rng(3)
+    groups = {"a": rng.normal(0, 1, 40), "b": rng.normal(1, 1, 35), "c": rng.normal(2, 3, 30)}
+    result = numpy_stats.one_way_anova({k: v.tolist() for k, v in groups.items()}, 0.95)["assumptions"]
+
+    for name, x in groups.items():
+        assert np.isclose(result["normality"]["groups"][name]["p_value"], stats.shapiro(x).pvalue)
+    assert np.isclose(result["homoscedasticity"]["levene_p_value"], stats.levene(*groups.values()).pvalue)
+    assert np.isclose(result["homoscedasticity"]["bartlett_p_value"], stats.bartlett(*groups.values()).pvalue)
+    assert result["homoscedasticity"]["satisfied"] is False
+    assert result["independence"]["satisfied"] is True
+
+
+def test_large_group_normality_is_subsampled():
+    x = np.random.default_rng(4).normal(size=assumptions.SHAPIRO_MAX_N * 3 + 7)
+    w, p_value, n_used = assumptions.shapiro_wilk(x)
+    assert n_used == assumptions.SHAPIRO_MAX_N
+    indices = assumptions.subsample_indices(x.size)
+    assert indices[0] == 0 and indices[-1] == x.size - 1
+
+
+def test_untestable_groups_are_none():
+    result = numpy_stats.independent_t_test({"a": [1, 1, 1], "b": [2, 3]}, 95)["assumptions"]
+    assert result["normality"]["groups"]["a"]["p_value"] is None
+    assert result["normality"]["satisfied"] is None
+    assert result["homoscedasticity"]["bartlett_p_value"] is None
+
+
+def test_summary_bartlett_matches_raw():
+    rng = np.random.default_rng(5)
+    groups = [rng.normal(0, s, 60) for s in (1, 1.5, 2)]
+    summaries = {f"g{i}": [GroupSummary.from_values(x).to_dict()] for i, x in enumerate(groups)}
+    result = summary_stats.one_way_anova(summaries, 0.95)["assumptions"]
+    assert np.isclose(result["homoscedasticity"]["bartlett_k2"], stats.bartlett(*groups).statistic)
+    assert result["normality"]["satisfied"] is None
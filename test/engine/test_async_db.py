@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from models import Base, User
+from models.base import to_async_url
+from schemas import ProjectCreate, ProjectUpdate
+from services.project import ProjectService
+
+
+def test_to_async_url_swaps_driver():
+    assert to_async_url("sqlite://") == "sqlite+aiosqlite://"
+    assert to_async_url("sqlite:///app.db") == "sqlite+aiosqlite:///app.db"
+    assert to_async_url("mysql+pymysql://u:p@db/app") == "mysql+aiomysql://u:p@db/app"
+    assert to_async_url("mysql+aiomysql://u:p@db/app") == "mysql+aiomysql://u:p@db/app"
+
+
+async def _project_lifecycle():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, expire_on_commit=False)
+    user = {"user": 1}
+
+    async with session() as db:
+        db.add(User(id=1, email="a@example.com", password="x"))
+        await db.commit()
+
+        created = await ProjectService.create_project(db, ProjectCreate(name="p", description="d"), user)
+        project_id = created["project_id"]
+        assert created["success"] and created["project_visibility"] == "private"
+
+        with pytest.raises(HTTPException):
+            await ProjectService.create_project(db, ProjectCreate(name="p", description="d"), user)
+
+        updated = await ProjectService.update_project(db, project_id, ProjectUpdate(name="q"), user)
+        assert updated["project_name"] == "q" and updated["project_description"] == "d"
+
+        with pytest.raises(HTTPException) as exc:
+            await ProjectService.update_project(db, project_id, ProjectUpdate(name="r"), {"user": 2})
+        assert exc.value.status_code == 403
+
+        projects = await ProjectService.get_user_projects(db, user)
+        assert [project["id"] for project in projects] == [project_id]
+        assert (await ProjectService.get_user_project(db, project_id))["name"] == "q"
+
+        await ProjectService.delete_project(db, project_id, user)
+        with pytest.raises(HTTPException) as exc:
+            await ProjectService.get_user_project(db, project_id)
+        assert exc.value.status_code == 404
+
+    await engine.dispose()
+
+
+def test_project_service_on_async_session():
+    asyncio.run(_project_lifecycle())
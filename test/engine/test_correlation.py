@@ -0,0 +1,107 @@
+import asyncio
+
+import numpy as np
+import pytest
+from scipy import stats
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Project, TableData
+from services import correlation, table
+
+
+def random_table(seed, rows=60, columns=5, missing=0.15):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(rows, columns))
+    values[:, 1] += values[:, 0]
+    values = values.round(1)  # 스피어만 동점 포함
+    observed = rng.random((rows, columns)) > missing
+    return np.where(observed, values, np.nan), observed
+
+
+@pytest.mark.parametrize("method", ["pearson", "spearman"])
+def test_pairwise_matches_per_pair(method):
+    values, observed = random_table(0)
+    result = correlation.correlation_matrix(values, observed, method, "pairwise")
+    test = stats.pearsonr if method == "pearson" else stats.spearmanr
+
+    for a in range(values.shape[1]):
+        for b in range(a + 1, values.shape[1]):
+            rows = observed[:, a] & observed[:, b]
+            expected = test(values[rows, a], values[rows, b])
+            assert result["n"][a, b] == rows.sum()
+            assert result["r"][a, b] == pytest.approx(expected.statistic, abs=1e-12)
+            assert result["p_value"][a, b] == pytest.approx(expected.pvalue, rel=1e-8)
+
+
+def test_spearman_blocks_match_single_pass(monkeypatch):
+    values, observed = random_table(2, columns=8, missing=0.3)
+    expected = correlation.correlation_matrix(values, observed, "spearman")
+    # 쌍 하나씩 블록으로 나눠도 같은 결과
+    monkeypatch.setattr(correlation, "SPEARMAN_BLOCK_ELEMENTS", 1)
+    blocked = correlation.correlation_matrix(values, observed, "spearman")
+    np.testing.assert_allclose(blocked["r"], expected["r"], atol=1e-12)
+
+
+def test_listwise_uses_complete_rows():
+    values, observed = random_table(1)
+    result = correlation.correlation_matrix(values, observed, "pearson", "ListwiseDeletion")
+    complete = observed.all(axis=1)
+    assert result["rows"] == complete.sum()
+    np.testing.assert_allclose(result["r"], np.corrcoef(values[complete], rowvar=False), atol=1e-12)
+
+
+@pytest.fixture
+def table_db():
+    # 표는 db_executor 스레드에서 읽으므로 모든 스레드가 같은 인메모리 DB 를 보도록 StaticPool
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    grid = [["x", "y", "label"], ["1", "2", "a"], ["2", "4.5", "b"], ["3", "", "c"], ["4", "7", "d"], ["5", "11", "e"]]
+    db.add(Project(id=1, name="p", table_version=1))
+    db.add_all([
+        TableData(project_id=1, row_num=row, col_num=col, value=value)
+        for row, cells in enumerate(grid) for col, value in enumerate(cells)
+    ])
+    db.commit()
+    correlation.correlation_cache.clear()
+    yield db
+    db.close()
+
+
+def edit_cell(db, row, col, value):
+    # TableWriter 처럼 셀과 표 버전을 한 트랜잭션으로 저장
+    db.query(TableData).filter(TableData.row_num == row, TableData.col_num == col).update({"value": value})
+    db.query(Project).filter(Project.id == 1).update({"table_version": Project.table_version + 1})
+    db.commit()
+
+
+def test_project_correlation_reads_table_and_caches(table_db):
+    result = asyncio.run(correlation.project_correlation(table_db, 1, 1))
+    assert result["columns"] == ["x", "y"] and result["table_version"] == "1"
+    assert result["n"][0][1] == 4
+    assert result["r"][0][1] == pytest.approx(stats.pearsonr([1, 2, 4, 5], [2, 4.5, 7, 11]).statistic)
+
+    # 같은 버전이면 표를 다시 읽지 않음
+    edit_cell(table_db, 1, 1, "100")
+    assert asyncio.run(correlation.project_correlation(table_db, 1, 1)) == result
+    updated = asyncio.run(correlation.project_correlation(table_db, 1, 2))
+    assert updated["r"][0][1] != result["r"][0][1] and updated["table_version"] == "2"
+
+
+def test_edit_while_reading_is_not_cached_under_old_version(table_db, monkeypatch):
+    load_table_matrix = table.load_table_matrix
+
+    def load_then_edit(db, project_id, header):
+        loaded = load_table_matrix(db, project_id, header)
+        edit_cell(db, 1, 1, "100")
+        return loaded
+
+    monkeypatch.setattr(table, "load_table_matrix", load_then_edit)
+    stale = asyncio.run(correlation.project_correlation(table_db, 1, 1))
+    assert stale["table_version"] is None
+
+    monkeypatch.setattr(table, "load_table_matrix", load_table_matrix)
+    # 버전 1 로 캐시되지 않았으므로 다시 읽음
+    assert asyncio.run(correlation.project_correlation(table_db, 1, 1))["table_version"] == "2"
@@ -0,0 +1,50 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from models import pool
+from models.pool import MeteredQueuePool, PoolMetrics, current_route, pool_options
+
+
+class _TestPool(MeteredQueuePool):
+    metrics = PoolMetrics("test")
+
+
+def test_pool_options_keep_default_pool_for_memory_sqlite():
+    assert pool_options("sqlite://", MeteredQueuePool) == {}
+    options = pool_options("mysql+pymysql://u:p@db/app", MeteredQueuePool)
+    assert options["poolclass"] is MeteredQueuePool
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == pool.DB_POOL_RECYCLE
+
+
+def test_checkout_metrics_and_timeout(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(pool, "DB_SLOW_CHECKOUT_SECONDS", 0.05)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    options = dict(pool_options(url, _TestPool), pool_size=1, max_overflow=1, pool_timeout=0.1)
+    engine = create_engine(url, **options)
+
+    first = engine.connect()
+    second = engine.connect()
+    first.execute(text("select 1"))
+    stats = _TestPool.metrics.stats(engine.pool)
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 2 and stats["overflow"] == 1
+
+    # size 1 + overflow 1 이 모두 사용 중이면 timeout 까지 기다린 뒤 실패, 요청 경로와 함께 로그
+    token = current_route.set("POST /statistics/run")
+    caplog.set_level(logging.WARNING)
+    try:
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    finally:
+        current_route.reset(token)
+    stats = _TestPool.metrics.stats(engine.pool)
+    assert stats["timeouts"] == 1 and stats["slow_checkouts"] == 1
+    assert "route=POST /statistics/run" in caplog.text
+
+    second.close()
+    first.close()
+    assert _TestPool.metrics.stats(engine.pool)["in_use"] == 0
+    engine.dispose()
@@ -0,0 +1,49 @@
+import numpy as np
+from scipy import optimize, stats
+
+from services import numpy_stats
+from services.effect_sizes import add_effect_sizes, selected_effect_size
+
+
+def brentq_ncp(cdf, target, center):
+    return optimize.brentq(lambda ncp: cdf(ncp) - target, center - 4, center + 4)
+
+
+def test_independent_cohens_d_and_ci():
+    rng = np.random.default_rng(6)
+    x, y = rng.normal(0, 1, 30), rng.normal(0.8, 1, 25)
+    result, = add_effect_sizes(["IndependentTTest"], [numpy_stats.independent_t_test({"x": x.tolist(), "y": y.tolist()}, 95)])
+    effect_sizes = result["effect_sizes"]
+
+    pooled_sd = np.sqrt(((x.size - 1) * x.var(ddof=1) + (y.size - 1) * y.var(ddof=1)) / (x.size + y.size - 2))
+    assert np.isclose(effect_sizes["cohens_d"], (x.mean() - y.mean()) / pooled_sd)
+
+    t, df = result["test_stats"]["t_statistic"], result["test_stats"]["degrees_of_freedom"]
+    scale = np.sqrt(1 / x.size + 1 / y.size)
+    lower = brentq_ncp(lambda ncp: stats.nct.cdf(t, df, ncp), 0.975, t) * scale
+    upper = brentq_ncp(lambda ncp: stats.nct.cdf(t, df, ncp), 0.025, t) * scale
+    assert np.isclose(effect_sizes["cohens_d_ci_lower"], lower, atol=1e-8)
+    assert np.isclose(effect_sizes["cohens_d_ci_upper"], upper, atol=1e-8)
+    assert abs(effect_sizes["hedges_g"]) < abs(effect_sizes["cohens_d"])
+
+
+def test_anova_eta_squared_ci_is_clamped_at_zero():
+    rng = np.random.default_rng(7)
+    strong = {f"g{i}": rng.normal(i, 1, 20).tolist() for i in range(3)}
+    # 같은 값을 섞은 그룹들이라 평균이 모두 같음 → between SS = 0, F = 0 < 1
+    base = rng.normal(0, 1, 20)
+    null = {f"g{i}": rng.permutation(base).tolist() for i in range(3)}
+    results = add_effect_sizes(["OneWayANOVA"] * 2, [numpy_stats.one_way_anova(strong, 95), numpy_stats.one_way_anova(null, 95)])
+
+    test_stats = results[0]["test_stats"]
+    assert np.isclose(results[0]["effect_sizes"]["eta_squared"], test_stats["between_sum_sq"] / test_stats["total_sum_sq"])
+    assert 0 < results[0]["effect_sizes"]["eta_squared_ci_lower"] < results[0]["effect_sizes"]["eta_squared"]
+    assert results[0]["effect_sizes"]["omega_squared"] < results[0]["effect_sizes"]["eta_squared"]
+    assert results[1]["test_stats"]["between_f"] < 1
+    assert results[1]["effect_sizes"]["eta_squared_ci_lower"] == 0
+
+
+def test_selected_effect_size():
+    result, = add_effect_sizes(["PairedTTest"], [numpy_stats.paired_t_test({"a": [1, 2, 3, 4, 6], "b": [2, 2, 5, 5, 8]}, 95)])
+    assert selected_effect_size("Cohens_D", result) == result["effect_sizes"]["cohens_d"]
+    assert selected_effect_size("", result) is None
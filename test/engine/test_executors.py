@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import numpy as np
+from fastapi import BackgroundTasks, Body, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.statistics import run_statistic
+from models import Base
+from models.base import json_serializer
+from schemas import StatisticRequest
+from services.executors import BoundedExecutor, llm_executor, db_executor
+
+# 혼합 부하에서 이벤트 루프가 이 시간 이상 멈추면 실패
+STALL_THRESHOLD = 0.1
+
+
+async def max_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    # 짧게 잠들었다 깨는 시간이 예정보다 얼마나 늦었는지의 최댓값
+    worst = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - start - interval)
+    return worst
+
+
+def test_event_loop_does_not_stall_under_mixed_load(tmp_path):
+    rng = np.random.default_rng(0)
+    # 라우트 핸들러를 그대로 호출해서 캐시 키, 결측 처리, 결과 저장까지 모두 이벤트 루프 밖에서 도는지 확인
+    request = StatisticRequest(
+        test="MannWhitneyU", hypothesis="TwoTailedSame", missingValueHandling="pairwise", confidenceInterval=95,
+        effectSize="", effectSizeValue=0, descriptiveStats=True, engine="numpy",
+        value={"a": rng.normal(size=1_000_000).tolist(), "b": rng.normal(0.1, size=1_000_000).tolist()},
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'stall.db'}", json_serializer=json_serializer,
+                           connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    async def scenario():
+        stop = asyncio.Event()
+        monitor = asyncio.create_task(max_loop_lag(stop))
+        await asyncio.sleep(0.02)
+        response, *_ = await asyncio.gather(
+            run_statistic(request, 1, BackgroundTasks(), {"user": 1}, db),
+            *(llm_executor.run(time.sleep, 0.3) for _ in range(4)),   # 느린 외부 호출
+            *(db_executor.run(time.sleep, 0.05) for _ in range(20)),  # 짧은 블로킹 쿼리
+        )
+        stop.set()
+        assert response["success"]
+        return await monitor
+
+    try:
+        assert asyncio.run(scenario()) < STALL_THRESHOLD
+    finally:
+        db.close()
+        engine.dispose()
+
+
+def test_executor_limits_concurrency_and_reports_queue_depth():
+    executor = BoundedExecutor("test", 2)
+
+    async def scenario():
+        await asyncio.gather(*(executor.run(time.sleep, 0.05) for _ in range(6)))
+
+    try:
+        asyncio.run(scenario())
+        stats = executor.stats()
+    finally:
+        executor.shutdown()
+    assert stats["completed"] == 6 and stats["queued"] == 0 and stats["active"] == 0
+    assert stats["max_queued"] >= 4  # 2개는 바로 스레드를 받을 수 있음
+    assert stats["max_wait"] >= 0.1
+
+
+def test_offloaded_handler_keeps_signature_and_runs_off_loop():
+    app = FastAPI()
+    thread_names = []
+
+    @app.post("/echo")
+    @db_executor.offload
+    def echo(value: int = Body(embed=True)):
+        import threading
+        thread_names.append(threading.current_thread().name)
+        return {"value": value}
+
+    with TestClient(app) as client:
+        assert client.post("/echo", json={"value": 3}).json() == {"value": 3}
+        assert client.post("/echo", json={}).status_code == 422
+    assert thread_names[0].startswith("db-executor")
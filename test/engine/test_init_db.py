@@ -0,0 +1,47 @@
+import json
+
+from sqlalchemy import create_engine, inspect, text
+
+from models import Base
+from models.base import JSON_ENCODE_BLOCK, add_missing_columns, create_missing_indexes, json_serializer
+
+
+def test_json_serializer_matches_json_dumps():
+    long = [i / 7 for i in range(2 * JSON_ENCODE_BLOCK + 3)]
+    for value in ({"a": long, "b": [None, 1, 2.5]}, {"x": {"y": long}}, {1: long}, [long], [], {}, None, "s"):
+        assert json_serializer(value) == json.dumps(value)
+
+
+def test_add_missing_columns_is_idempotent():
+    # post_hoc 이 생기기 전에 만들어진 oneway_anova_results 테이블
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE oneway_anova_results (id INTEGER PRIMARY KEY, statistical_test_id INTEGER, between_f FLOAT)"))
+        conn.execute(text("INSERT INTO oneway_anova_results (id, statistical_test_id, between_f) VALUES (1, 1, 2.5)"))
+    Base.metadata.create_all(engine)
+
+    add_missing_columns(engine)
+    add_missing_columns(engine)
+
+    columns = {column["name"] for column in inspect(engine).get_columns("oneway_anova_results")}
+    assert {"post_hoc", "group_descriptive_stats", "between_f"} <= columns
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT between_f, post_hoc FROM oneway_anova_results")).one() == (2.5, None)
+
+
+def test_unique_cell_index_removes_duplicate_cells_first():
+    # unique 인덱스가 없던 때 같은 셀에 두 번 insert 된 행이 남아 있는 table_data
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE table_data (id INTEGER PRIMARY KEY, project_id INTEGER, "
+                          "row_num INTEGER, col_num INTEGER, value VARCHAR(255))"))
+        conn.execute(text("INSERT INTO table_data VALUES (1, 1, 0, 0, 'old'), (2, 1, 0, 1, 'b'), (3, 1, 0, 0, 'new')"))
+    Base.metadata.create_all(engine)
+
+    create_missing_indexes(engine)
+    create_missing_indexes(engine)
+
+    assert "ux_table_data_cell" in {index["name"] for index in inspect(engine).get_indexes("table_data")}
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT id, value FROM table_data ORDER BY id")).all()
+    assert rows == [(2, "b"), (3, "new")]
@@ -0,0 +1,55 @@
+import math
+import time
+
+import numpy as np
+
+from services import numpy_stats
+from services.missing_values import apply_missing_value_handling
+from services.stats_cache import make_cache_key
+from services.stats_engine import get_backend
+
+
+def as_lists(groups):
+    return {name: values.tolist() for name, values in groups.items()}
+
+
+def test_pairwise_drops_each_groups_missing():
+    groups = {"a": [1, None, 3, float("nan")], "b": [4, 5, None]}
+    assert as_lists(apply_missing_value_handling(groups, "IndependentTTest", "pairwise")) == \
+        {"a": [1.0, 3.0], "b": [4.0, 5.0]}
+
+
+def test_listwise_ignores_rows_past_a_shorter_group():
+    groups = {"a": [1, None, 3, 4], "b": [4, 5, None]}
+    assert as_lists(apply_missing_value_handling(groups, "IndependentTTest", "ListwiseDeletion")) == \
+        {"a": [1.0, 4.0], "b": [4.0]}
+
+
+def test_paired_tests_delete_rows_even_when_pairwise():
+    groups = {"a": [1, None, 3, 4], "b": [2, 5, None, 1]}
+    for test in ("PairedTTest", "WilcoxonSignedRank"):
+        assert as_lists(apply_missing_value_handling(groups, test, "pairwise")) == {"a": [1.0, 4.0], "b": [2.0, 1.0]}
+
+
+def test_engine_accepts_none():
+    groups = {"a": [1, 2, None, 1, 3, 2, 1], "b": [5, 4, 5, 5, 3, 4, None]}
+    result = get_backend("numpy").run("PairedTTest", groups, 95, missing_value_handling="pairwise")
+    expected = numpy_stats.paired_t_test({"a": [1, 2, 1, 3, 2], "b": [5, 4, 5, 3, 4]}, 95)
+    assert math.isclose(result["test_stats"]["t_statistic"], expected["test_stats"]["t_statistic"])
+
+
+def test_cache_key_depends_on_handling():
+    groups = {"a": [1, None, 3], "b": [4, 5, 6]}
+    assert make_cache_key("PairedTTest", "TwoTailedSame", 95, groups, 3, "pairwise") != \
+        make_cache_key("PairedTTest", "TwoTailedSame", 95, groups, 3, "ListwiseDeletion")
+
+
+def test_large_paired_input_is_vectorized():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=1_000_000)
+    y = rng.normal(size=1_000_000)
+    x[rng.random(x.size) < 0.01] = np.nan
+    start = time.perf_counter()
+    cleaned = apply_missing_value_handling({"x": x, "y": y}, "PairedTTest", "ListwiseDeletion")
+    assert time.perf_counter() - start < 1.0
+    assert cleaned["x"].size == cleaned["y"].size == np.count_nonzero(~np.isnan(x))
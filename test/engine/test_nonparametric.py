@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from services import numpy_stats
+from services.stats_engine import get_backend
+
+from test_numpy_parity import assert_same_result
+
+
+def integer_groups(seed, sizes, high=20):
+    # 동점이 많도록 정수 값 사용
+    rng = np.random.default_rng(seed)
+    return {f"group{i + 1}": rng.integers(i, high + i, size=size).astype(float).tolist() for i, size in enumerate(sizes)}
+
+
+def test_rank_averages_ties():
+    ranks, tie_term = numpy_stats._rank(np.array([3.0, 1.0, 3.0, 2.0, 3.0]))
+    assert ranks.tolist() == [4.0, 1.0, 4.0, 2.0, 4.0]
+    assert tie_term == 3 ** 3 - 3
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_mann_whitney_u_matches_scipy(seed):
+    groups = integer_groups(seed, [35, 50])
+    x, y = groups.values()
+    expected = stats.mannwhitneyu(x, y, use_continuity=True, method="asymptotic")
+
+    test_stats = numpy_stats.mann_whitney_u(groups, 95)["test_stats"]
+    assert test_stats["w_statistic"] == expected.statistic
+    assert math.isclose(test_stats["p_value"], expected.pvalue, rel_tol=1e-10)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_wilcoxon_signed_rank_matches_scipy(seed):
+    groups = integer_groups(seed, [40, 40])
+    x, y = (np.asarray(values) for values in groups.values())
+
+    paired = numpy_stats.wilcoxon_signed_rank(groups, 3, 95)
+    expected = stats.wilcoxon(x, y, correction=True, method="approx")
+    assert paired["test_stats"]["paired"] and paired["test_stats"]["mu"] == 0
+    assert paired["diff_stats"]["n_nonzero"] == np.count_nonzero(x - y)
+    assert math.isclose(paired["test_stats"]["p_value"], expected.pvalue, rel_tol=1e-10)
+
+    one_sample = numpy_stats.wilcoxon_signed_rank({"group1": groups["group1"]}, 8, 95)
+    expected = stats.wilcoxon(x - 8, correction=True, method="approx")
+    assert math.isclose(one_sample["test_stats"]["p_value"], expected.pvalue, rel_tol=1e-10)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_kruskal_wallis_matches_scipy(seed):
+    groups = integer_groups(seed, [12, 20, 17, 9], high=6)
+    expected = stats.kruskal(*groups.values())
+
+    result = numpy_stats.kruskal_wallis(groups, 0.95)
+    assert math.isclose(result["test_stats"]["h_statistic"], expected.statistic, rel_tol=1e-10)
+    assert math.isclose(result["test_stats"]["p_value"], expected.pvalue, rel_tol=1e-10)
+    assert sum(s["mean_rank"] * s["n"] for s in result["group_stats"].values()) == pytest.approx(58 * 59 / 2)
+
+
+def test_constant_values_are_undefined():
+    result = numpy_stats.kruskal_wallis({"a": [1, 1], "b": [1, 1]}, 0.95)
+    assert math.isnan(result["test_stats"]["h_statistic"])
+    result = numpy_stats.wilcoxon_signed_rank({"a": [1, 2], "b": [1, 2]}, 0, 0.95)
+    assert result["diff_stats"]["n_nonzero"] == 0
+    assert math.isnan(result["test_stats"]["p_value"])
+
+
+def test_backend_dispatch():
+    backend = get_backend("numpy")
+    groups = integer_groups(0, [10, 10])
+    assert "w_statistic" in backend.run("MannWhitneyU", groups, 95)["test_stats"]
+    assert not backend.run("WilcoxonSignedRank", {"group1": groups["group1"]}, 95, 5)["test_stats"]["paired"]
+    assert "h_statistic" in backend.run("KruskalWallis", groups, 95)["test_stats"]
+
+
+@pytest.fixture(scope="module")
+def rscripts():
+    pytest.importorskip("rpy2")
+    from services import rscripts
+    return rscripts
+
+
+class TestRParity:
+    """rpy2 + R 이 설치된 환경에서 wilcox.test / kruskal.test 결과와 일치하는지 확인"""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_mann_whitney_u(self, rscripts, seed):
+        groups = integer_groups(seed, [30, 45])
+        assert_same_result(numpy_stats.mann_whitney_u(groups, 95), rscripts.mann_whitney_u(groups, 95))
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_wilcoxon_signed_rank(self, rscripts, seed):
+        groups = integer_groups(seed, [40, 40])
+        assert_same_result(numpy_stats.wilcoxon_signed_rank(groups, 0, 95),
+                           rscripts.wilcoxon_signed_rank(groups, 0, 95))
+        group = {"group1": groups["group1"]}
+        assert_same_result(numpy_stats.wilcoxon_signed_rank(group, 8, 95),
+                           rscripts.wilcoxon_signed_rank(group, 8, 95))
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_kruskal_wallis(self, rscripts, seed):
+        groups = integer_groups(seed, [12, 20, 17, 9], high=6)
+        assert_same_result(numpy_stats.kruskal_wallis(groups, 0.95), rscripts.kruskal_wallis(groups, 0.95))
@@ -0,0 +1,100 @@
+import math
+
+import numpy as np
+import pytest
+
+from services import numpy_stats
+
+TOLERANCE = 1e-10
+
+# R 4.x 에서 rscripts.one_way_anova 로 계산한 기준값
+ANOVA_GROUPS = {"g1": [1, 2, 1, 3, 2, 1], "g2": [5, 4, 5, 5, 3, 4], "g3": [7, 8, 6, 7, 8, 7]}
+ANOVA_R_OUTPUT = {
+    'group_descriptive_stats': {
+        'g1': {'ci_lower': 0.9949838755556591, 'ci_upper': 2.3383494577776744, 'mean': 1.6666666666666667,
+               'n': 6, 'sd': 0.816496580927726, 'se': 0.33333333333333337},
+        'g2': {'ci_lower': 3.6616505422223256, 'ci_upper': 5.0050161244443405, 'mean': 4.333333333333333,
+               'n': 6, 'sd': 0.816496580927726, 'se': 0.33333333333333337},
+        'g3': {'ci_lower': 6.547405731282017, 'ci_upper': 7.785927602051317, 'mean': 7.166666666666667,
+               'n': 6, 'sd': 0.752772652709081, 'se': 0.3073181485764296},
+    },
+    'test_stats': {'between_df': 2.0, 'between_f': 71.6666666666667, 'between_mean_sq': 45.3888888888889,
+                   'between_sig': 2.1081027807666718e-08, 'between_sum_sq': 90.7777777777778, 'conf_level': 0.95,
+                   'total_df': 17.0, 'total_sum_sq': 100.2777777777778, 'within_df': 15.0,
+                   'within_mean_sq': 0.6333333333333332, 'within_sum_sq': 9.499999999999998},
+    'total_descriptive_stats': {'ci_lower': 3.3930416685103193, 'ci_upper': 5.384736109267459,
+                                'mean': 4.388888888888889, 'n': 18, 'sd': 2.42872246468334,
+                                'se': 0.5724553747992317},
+}
+
+
+def assert_same_result(actual, expected, path="result"):
+    if isinstance(expected, dict):
+        assert set(actual) == set(expected), path
+        for key in expected:
+            assert_same_result(actual[key], expected[key], f"{path}.{key}")
+    elif expected is None or isinstance(expected, (str, bool)):
+        assert actual == expected, path
+    elif isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(actual), path
+    else:
+        assert math.isclose(actual, expected, rel_tol=TOLERANCE, abs_tol=TOLERANCE), \
+            f"{path}: {actual} != {expected}"
+
+
+def random_groups(seed, sizes):
+    rng = np.random.default_rng(seed)
+    return {
+        f"group{i + 1}": rng.normal(loc=10 * i, scale=1 + i, size=size).round(3).tolist()
+        for i, size in enumerate(sizes)
+    }
+
+
+def test_one_way_anova_matches_r_reference():
+    result = numpy_stats.one_way_anova(ANOVA_GROUPS, 0.95)
+    # 가정 검정은 기준값 이후에 추가됨 (test_assumptions.py 에서 확인)
+    result.pop("assumptions")
+    assert_same_result(result, ANOVA_R_OUTPUT)
+
+
+def test_conf_level_percent_is_normalized():
+    result = numpy_stats.one_way_anova(ANOVA_GROUPS, 95)
+    assert result["test_stats"]["conf_level"] == 0.95
+
+
+def test_group_count_validation():
+    with pytest.raises(ValueError):
+        numpy_stats.independent_t_test({"a": [1, 2, 3]}, 0.95)
+    with pytest.raises(ValueError):
+        numpy_stats.one_sample_t_test({"a": [1, 2], "b": [3, 4]}, 3, 0.95)
+
+
+@pytest.fixture(scope="module")
+def rscripts():
+    pytest.importorskip("rpy2")
+    from services import rscripts
+    return rscripts
+
+
+class TestRParity:
+    """rpy2 + R 이 설치된 환경에서 R 엔진과 1e-10 이내로 일치하는지 확인"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_independent_t_test(self, rscripts, seed):
+        groups = random_groups(seed, [30, 45])
+        assert_same_result(numpy_stats.independent_t_test(groups, 95), rscripts.independent_t_test(groups, 95))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_paired_t_test(self, rscripts, seed):
+        groups = random_groups(seed, [40, 40])
+        assert_same_result(numpy_stats.paired_t_test(groups, 0.9), rscripts.paired_t_test(groups, 0.9))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_one_sample_t_test(self, rscripts, seed):
+        groups = random_groups(seed, [25])
+        assert_same_result(numpy_stats.one_sample_t_test(groups, 3, 99), rscripts.one_sample_t_test(groups, 3, 99))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_one_way_anova(self, rscripts, seed):
+        groups = random_groups(seed, [12, 20, 17, 9])
+        assert_same_result(numpy_stats.one_way_anova(groups, 0.95), rscripts.one_way_anova(groups, 0.95))
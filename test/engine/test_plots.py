@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, StatisticalTest
+from services import plots
+
+GROUPS = {"school": np.array([1, 2, 1, 3, 2, 1, 40.0]), "home": np.array([5, 4, 5, 5, 3, 4.0])}
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(plots, "PLOT_STORE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_summary_uses_quartiles_whiskers_and_shared_bins():
+    summary = plots.plot_summary(GROUPS, 95)
+    school, home = summary["groups"]
+    assert len(summary["edges"]) == plots.PLOT_BINS + 1
+    # 40 은 수염 밖 이상치
+    assert school["box"] == [1.0, 1.0, 2.0, 2.5, 3.0]
+    assert school["n"] == 7 and sum(school["density"]) == pytest.approx(1.0)
+    assert home["mean"][1] < np.mean(GROUPS["home"]) < home["mean"][2]
+
+
+def test_same_data_reuses_stored_render(store):
+    url = plots.store_plot(plots.plot_summary(GROUPS, 95))
+    path, = store.glob("*/*.svg")
+    mtime = path.stat().st_mtime_ns
+    assert plots.store_plot(plots.plot_summary({k: v.copy() for k, v in GROUPS.items()}, 95)) == url
+    assert path.stat().st_mtime_ns == mtime
+    assert url == f"/plots/{path.name}" and path.read_text().startswith("<svg")
+    assert plots.store_plot(plots.plot_summary(GROUPS, 99)) != url
+
+
+def test_render_plots_sets_image_url(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(plots, "SessionLocal", session_factory)
+    db = session_factory()
+    db.add_all([StatisticalTest(id=1, project_id=1), StatisticalTest(id=2, project_id=1)])
+    db.commit()
+
+    plots.render_plots([(1, GROUPS, 95), (2, {"empty": np.array([])}, 95)])
+
+    db.expire_all()
+    assert db.get(StatisticalTest, 1).image_url.startswith("/plots/")
+    assert db.get(StatisticalTest, 2).image_url is None
@@ -0,0 +1,48 @@
+import numpy as np
+from scipy import stats
+
+from services import numpy_stats
+from services.posthoc import StudentizedRange, add_post_hoc, holm_adjust
+
+TOLERANCE = 1e-4
+
+
+def random_groups(seed, sizes):
+    rng = np.random.default_rng(seed)
+    return {f"g{i}": rng.normal(i * 0.4, 1 + 0.2 * i, size).tolist() for i, size in enumerate(sizes)}
+
+
+def test_studentized_range_matches_scipy():
+    q = np.array([0.5, 2.0, 3.5, 5.0, 0.5, 2.0, 3.5, 5.0])
+    df = np.array([4.0, 4.0, 4.0, 4.0, 60.0, 60.0, 60.0, 60.0])
+    distribution = StudentizedRange(5, df)
+    assert np.allclose(distribution.cdf(q), stats.studentized_range.cdf(q, 5, df), atol=TOLERANCE)
+    assert np.allclose(distribution.ppf(0.95), stats.studentized_range.ppf(0.95, 5, df), atol=1e-3)
+
+
+def test_tukey_matches_scipy_tukey_hsd():
+    groups = random_groups(8, [12, 15, 9, 20])
+    result, = add_post_hoc(["OneWayANOVA"], [numpy_stats.one_way_anova(groups, 95)])
+    post_hoc = result["post_hoc"]
+
+    expected = stats.tukey_hsd(*groups.values())
+    interval = expected.confidence_interval(0.95)
+    names = list(groups)
+    for index, (group1, group2) in enumerate(zip(post_hoc["group1"], post_hoc["group2"])):
+        i, j = names.index(group1), names.index(group2)
+        assert abs(post_hoc["tukey"]["p_value"][index] - expected.pvalue[i, j]) < TOLERANCE
+        assert abs(post_hoc["tukey"]["ci_lower"][index] - interval.low[i, j]) < 1e-3
+        assert abs(post_hoc["tukey"]["ci_upper"][index] - interval.high[i, j]) < 1e-3
+
+
+def test_holm_is_step_down_and_bounded():
+    p_values = np.array([0.01, 0.04, 0.03, 0.005, 0.5])
+    adjusted = holm_adjust(p_values)
+    assert np.allclose(adjusted, [0.04, 0.09, 0.09, 0.025, 0.5])
+
+
+def test_pair_count_for_many_groups():
+    groups = random_groups(9, [5] * 40)
+    result, = add_post_hoc(["OneWayANOVA"], [numpy_stats.one_way_anova(groups, 95)])
+    assert len(result["post_hoc"]["group1"]) == 40 * 39 // 2
+    assert all(0 <= p <= 1 for p in result["post_hoc"]["games_howell"]["p_value"])
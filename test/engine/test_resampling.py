@@ -0,0 +1,52 @@
+import asyncio
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from services import resampling
+
+
+@pytest.fixture(autouse=True)
+def in_process(monkeypatch):
+    monkeypatch.setattr(resampling, "RESAMPLING_WORKERS", 0)
+
+
+def run(test_method, groups, **options):
+    return asyncio.run(resampling.resample(test_method, groups, 95, options))
+
+
+def test_seed_makes_results_reproducible():
+    rng = np.random.default_rng(10)
+    groups = {"a": rng.normal(0, 1, 15).tolist(), "b": rng.normal(0.5, 1, 12).tolist()}
+    first = run("IndependentTTest", groups, permutations=3000, bootstrap=500, seed=42)
+    second = run("IndependentTTest", groups, permutations=3000, bootstrap=500, seed=42)
+    assert first == second
+
+
+def test_generated_seed_is_stored_and_reproduces_the_result():
+    groups = {"a": [1.0, 2.5, 1.8, 3.1, 2.2, 2.9], "b": [2.4, 3.3, 2.1, 4.0, 3.6, 3.8]}
+    first = run("IndependentTTest", groups, permutations=1000, bootstrap=200)
+    # JS number 로 정확히 표현되는 정수
+    assert 0 <= first["seed"] < 2 ** 53
+    assert run("IndependentTTest", groups, permutations=1000, bootstrap=200, seed=first["seed"]) == first
+
+
+def test_permutation_p_value_tracks_t_test():
+    rng = np.random.default_rng(11)
+    x, y = rng.normal(0, 1, 25), rng.normal(0.6, 1, 25)
+    result = run("IndependentTTest", {"x": x.tolist(), "y": y.tolist()}, permutations=20000, seed=1, tolerance=0.001)
+    assert abs(result["permutation"]["p_value"] - stats.ttest_ind(x, y).pvalue) < 0.02
+    assert result["bootstrap"]["ci_lower"] < result["observed"] < result["bootstrap"]["ci_upper"]
+
+
+def test_clear_effect_stops_early():
+    groups = {"a": [1.0, 1.2, 0.9, 1.1, 1.0, 1.3] * 3, "b": [5.0, 5.2, 4.9, 5.1, 5.3, 4.8] * 3}
+    result = run("PairedTTest", groups, permutations=200000, seed=3)
+    assert result["permutation"]["stopped_early"]
+    assert result["permutation"]["permutations"] < 200000
+
+
+def test_unsupported_test_is_rejected():
+    with pytest.raises(ValueError):
+        run("OneWayANOVA", {"a": [1, 2], "b": [3, 4], "c": [5, 6]})
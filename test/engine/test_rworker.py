@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+
+from services import numpy_stats
+from services.rworker import RWorkerPool, PoolFullError, MemoryGovernor
+
+GROUPS = {"school": [1, 2, 1, 3, 2, 1], "home": [5, 4, 5, 5, 3, 4]}
+
+
+def test_pool_runs_jobs_and_applies_backpressure():
+    async def scenario():
+        pool = RWorkerPool(engine="numpy", size=1, queue_size=1, job_timeout=30, max_jobs=2)
+        await pool.start()
+        try:
+            results = await asyncio.gather(
+                *(pool.submit("IndependentTTest", GROUPS, 95) for _ in range(4)),
+                return_exceptions=True,
+            )
+            stats = pool.stats()
+        finally:
+            await pool.stop()
+        return results, stats
+
+    results, stats = asyncio.run(scenario())
+
+    expected = numpy_stats.independent_t_test(GROUPS, 95)
+    assert results[:2] == [expected, expected]
+    assert all(isinstance(r, PoolFullError) for r in results[2:])
+    assert stats["recycled"] == 1
+    assert stats["pending"] == 0
+
+
+def test_worker_errors_are_reraised():
+    async def scenario():
+        pool = RWorkerPool(engine="numpy", size=1, queue_size=0)
+        await pool.start()
+        try:
+            await pool.submit("OneSampleTTest", GROUPS, 95)
+        finally:
+            await pool.stop()
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_cancelled_job_does_not_leak_its_reply():
+    # 응답을 기다리던 요청이 취소돼도 워커의 응답은 풀이 읽어서 버리므로 다음 작업은 자기 결과를 받음
+    big = {"a": list(range(200000)), "b": list(range(1, 200001))}
+    job = {"test_method": "IndependentTTest", "groups_data": big, "conf_level": 95, "mu": 0,
+           "missing_value_handling": "pairwise"}
+
+    async def scenario():
+        pool = RWorkerPool(engine="numpy", size=1, queue_size=2, job_timeout=60)
+        await pool.start()
+        try:
+            slow = asyncio.ensure_future(pool.submit_batch([job] * 10))
+            await asyncio.sleep(0.05)
+            slow.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await slow
+            result = await pool.submit("IndependentTTest", GROUPS, 95)
+            stats = pool.stats()
+        finally:
+            await pool.stop()
+        return result, stats
+
+    result, stats = asyncio.run(scenario())
+    assert result == numpy_stats.independent_t_test(GROUPS, 95)
+    assert stats["pending"] == 0 and stats["idle"] == 1
+
+
+def test_failed_respawn_drops_the_worker_slot():
+    # 재시작 (max_jobs=1 이라 매 작업 후) 이 실패하면 kill 한 워커를 idle 로 돌려놓지 않음
+    async def scenario():
+        pool = RWorkerPool(engine="numpy", size=1, queue_size=2, max_jobs=1)
+        await pool.start()
+
+        def fail_spawn():
+            raise RuntimeError("spawn failed")
+
+        pool._spawn_worker = fail_spawn
+        try:
+            result = await pool.submit("IndependentTTest", GROUPS, 95)
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(pool.submit("IndependentTTest", GROUPS, 95), 5)
+            stats = pool.stats()
+        finally:
+            await pool.stop()
+        return result, stats
+
+    result, stats = asyncio.run(scenario())
+    assert result == numpy_stats.independent_t_test(GROUPS, 95)
+    assert stats["workers"] == 0 and stats["lost"] == 1 and stats["pending"] == 0
+
+
+class FakeBackend:
+    def __init__(self, heap_mb, rss_mb):
+        self.heap_mb = heap_mb
+        self.rss_mb = rss_mb
+        self.collections = 0
+
+    def memory_usage(self, collect=False):
+        if collect:
+            self.collections += 1
+            self.heap_mb /= 2
+        return {"heap_mb": self.heap_mb, "rss_mb": self.rss_mb}
+
+
+def test_governor_collects_periodically_and_over_threshold():
+    backend = FakeBackend(heap_mb=10, rss_mb=100)
+    governor = MemoryGovernor(gc_every=3, gc_threshold_mb=50, ceiling_mb=1000)
+    for _ in range(3):
+        memory = governor.after_job(backend)
+    assert backend.collections == 1 and not memory["recycle"]
+
+    backend.heap_mb = 80
+    memory = governor.after_job(backend)
+    assert backend.collections == 2 and memory["heap_mb"] == 40 and memory["gc_runs"] == 2
+
+
+def test_governor_recycles_when_still_over_ceiling():
+    backend = FakeBackend(heap_mb=10, rss_mb=2000)
+    memory = MemoryGovernor(gc_every=0, gc_threshold_mb=50, ceiling_mb=1000).after_job(backend)
+    assert backend.collections == 1 and memory["recycle"]
+    assert not MemoryGovernor(gc_every=0, gc_threshold_mb=50, ceiling_mb=0).after_job(backend)["recycle"]
+
+
+def test_pool_recycles_workers_over_memory_ceiling(monkeypatch):
+    # 워커는 spawn 으로 시작되므로 환경변수로 상한을 전달 (어떤 프로세스든 1Mb 는 넘음)
+    monkeypatch.setenv("R_MEMORY_CEILING_MB", "1")
+
+    async def scenario():
+        pool = RWorkerPool(engine="numpy", size=1, queue_size=0)
+        await pool.start()
+        try:
+            result = await pool.submit("IndependentTTest", GROUPS, 95)
+            stats = pool.stats()
+        finally:
+            await pool.stop()
+        return result, stats
+
+    result, stats = asyncio.run(scenario())
+    assert result == numpy_stats.independent_t_test(GROUPS, 95)
+    assert stats["memory_recycled"] == 1
+    assert stats["memory"][0]["jobs"] == 0
@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.statistics import run_statistic_batch
+from models import Base
+from schemas import StatisticBatchRequest
+from services.stats_cache import make_cache_key, statistics_cache
+
+VALUE = {"a": [1.0, 2.0, 4.0, 4.5, 6.0], "b": [2.0, 2.5, 5.0, 7.0, 9.0]}
+
+
+def make_request(engine=None):
+    return dict(
+        test="IndependentTTest", hypothesis="TwoTailedSame", missingValueHandling="pairwise", confidenceInterval=95,
+        effectSize="", effectSizeValue=0, descriptiveStats=True, value=VALUE, engine=engine,
+    )
+
+
+def test_batch_honors_request_engine(tmp_path):
+    # 배치 기본 엔진이 R 이어도 engine 을 준 요청은 그 엔진으로 실행 (여기에는 R 이 없음)
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    batch = StatisticBatchRequest(requests=[make_request("numpy"), make_request("numpy")], engine="r")
+    statistics_cache.clear()
+    try:
+        response = asyncio.run(run_statistic_batch(batch, 1, BackgroundTasks(), {"user": 1}, db))
+    finally:
+        db.close()
+        engine.dispose()
+
+    assert response["success"] and response["count"] == 2
+    key = make_cache_key("IndependentTTest", "TwoTailedSame", 95, VALUE, engine="numpy")
+    assert statistics_cache.get(key) is not None
@@ -0,0 +1,41 @@
+from services import stats_cache
+from services.stats_cache import StatisticsCache, make_cache_key
+
+GROUPS = {"school": [1, 2, 1, 3, 2, 1], "home": [5, 4, 5, 5, 3, 4]}
+
+
+def test_cache_key_is_canonical():
+    key = make_cache_key("IndependentTTest", "TwoTailedSame", 95, GROUPS)
+    assert key == make_cache_key("IndependentTTest", "TwoTailedSame", 0.95,
+                                 {"school": [1.0, 2, 1, 3, 2, 1], "home": [5, 4, 5, 5, 3, 4.0]})
+    assert key != make_cache_key("IndependentTTest", "TwoTailedSame", 95, dict(reversed(GROUPS.items())))
+    assert key != make_cache_key("PairedTTest", "TwoTailedSame", 95, GROUPS)
+    assert key != make_cache_key("IndependentTTest", "TwoTailedSame", 99, GROUPS)
+
+
+def test_cache_key_includes_engine_and_shapiro_limit(monkeypatch):
+    r_key = make_cache_key("IndependentTTest", "TwoTailedSame", 95, GROUPS, engine="r")
+    assert r_key != make_cache_key("IndependentTTest", "TwoTailedSame", 95, GROUPS, engine="numpy")
+    monkeypatch.setattr(stats_cache, "SHAPIRO_MAX_N", 100)
+    assert r_key != make_cache_key("IndependentTTest", "TwoTailedSame", 95, GROUPS, engine="r")
+
+
+def test_lru_eviction_and_counters():
+    cache = StatisticsCache(max_entries=2, persistent=False)
+    cache.put("a", "OneWayANOVA", {"value": 1})
+    cache.put("b", "OneWayANOVA", {"value": 2})
+    assert cache.get("a") == {"value": 1}
+    cache.put("c", "OneWayANOVA", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"value": 3}
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 1, 1, 2)
+
+
+def test_cached_result_is_not_shared():
+    cache = StatisticsCache(max_entries=2, persistent=False)
+    cache.put("a", "OneWayANOVA", {"test_stats": {"f": 1.0}})
+    cache.get("a")["test_stats"]["f"] = 2.0
+    assert cache.get("a") == {"test_stats": {"f": 1.0}}
@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from schemas import StatisticRequest
+from services import numpy_stats, summary_stats
+from services.summary_stats import GroupSummary
+
+
+def chunk_summaries(values, chunk_size):
+    return [GroupSummary.from_values(values[i:i + chunk_size]).to_dict() for i in range(0, len(values), chunk_size)]
+
+
+def test_merge_matches_single_pass():
+    x = np.random.default_rng(0).normal(100, 15, size=1003)
+    merged = GroupSummary.combine(GroupSummary.from_values(chunk) for chunk in np.array_split(x, 7))
+
+    streamed = GroupSummary()
+    for value in x:
+        streamed.update(value)
+
+    for summary in (merged, streamed):
+        assert summary.n == x.size
+        assert math.isclose(summary.mean, np.mean(x), rel_tol=1e-12)
+        assert math.isclose(summary.variance, np.var(x, ddof=1), rel_tol=1e-10)
+
+
+def test_independent_t_test_matches_raw():
+    rng = np.random.default_rng(1)
+    groups = {"a": rng.normal(0, 1, 200).tolist(), "b": rng.normal(0.3, 2, 150).tolist()}
+    summaries = {name: chunk_summaries(values, 64) for name, values in groups.items()}
+
+    expected = numpy_stats.independent_t_test(groups, 95)["test_stats"]
+    actual = summary_stats.independent_t_test(summaries, 95)["test_stats"]
+    for key, value in expected.items():
+        assert math.isclose(actual[key], value, rel_tol=1e-9), key
+
+
+def test_one_way_anova_matches_raw():
+    rng = np.random.default_rng(2)
+    groups = {f"g{i}": rng.normal(i, 1, 50 + 10 * i).tolist() for i in range(4)}
+    summaries = {name: chunk_summaries(values, 17) for name, values in groups.items()}
+
+    expected = numpy_stats.one_way_anova(groups, 0.95)
+    actual = summary_stats.one_way_anova(summaries, 0.95)
+    for key, value in expected["test_stats"].items():
+        assert math.isclose(actual["test_stats"][key], value, rel_tol=1e-9), key
+    for key, value in expected["total_descriptive_stats"].items():
+        assert math.isclose(actual["total_descriptive_stats"][key], value, rel_tol=1e-9), key
+
+
+def test_paired_t_test_matches_raw():
+    rng = np.random.default_rng(3)
+    before = rng.normal(10, 2, 80)
+    after = before + rng.normal(0.4, 1, 80)
+    diff = (before - after).tolist()
+    summaries = {"before - after": chunk_summaries(diff, 25)}
+
+    expected = numpy_stats.paired_t_test({"before": before.tolist(), "after": after.tolist()}, 95)
+    actual = summary_stats.run("PairedTTest", summaries, 95)
+    for key, value in expected["test_stats"].items():
+        assert math.isclose(actual["test_stats"][key], value, rel_tol=1e-9), key
+    assert actual["diff_stats"]["n"] == 80
+    assert math.isclose(actual["diff_stats"]["mean"], expected["diff_stats"]["mean"], rel_tol=1e-12)
+
+
+def test_paired_t_test_needs_a_differences_summary():
+    # 그룹별 요약 두 개로는 공분산을 알 수 없음
+    summaries = {"a": [{"n": 5, "mean": 1, "m2": 2}], "b": [{"n": 5, "mean": 2, "m2": 2}]}
+    with pytest.raises(ValueError):
+        summary_stats.run("PairedTTest", summaries, 95)
+
+
+def make_request(**data):
+    return StatisticRequest(
+        test="PairedTTest", hypothesis="TwoTailedSame", missingValueHandling="pairwise", confidenceInterval=95,
+        effectSize="", effectSizeValue=0, descriptiveStats=True, **data,
+    )
+
+
+def test_request_needs_exactly_one_data_source():
+    summary = {"diff": [{"n": 10, "mean": 0.5, "sd": 1.2}]}
+    request = make_request(summaries=summary)
+    assert math.isclose(request.summaries["diff"][0].m2, 1.2 ** 2 * 9)
+
+    with pytest.raises(ValidationError):
+        make_request()
+    with pytest.raises(ValidationError):
+        make_request(value={"a": [1, 2], "b": [3, 4]}, summaries=summary)
+    with pytest.raises(ValidationError):
+        make_request(summaries=summary, columns={"a": {"col": 0}})
+    # 순열 검정 / 부트스트랩은 요약 통계로 계산할 수 없음
+    with pytest.raises(ValidationError):
+        make_request(summaries=summary, resampling={})
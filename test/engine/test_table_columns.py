@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, TableData
+from schemas import StatisticRequest
+from services.missing_values import apply_missing_value_handling
+from services.table import resolve_column_requests
+
+GRID = [
+    ["before", "after", "note", "other"],
+    ["1", "2", "a", "7"],
+    ["2", "", "b", "8"],
+    ["3", "5", "c", ""],
+    ["", "6", "d", "9"],
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        TableData(project_id=1, row_num=row, col_num=col, value=value)
+        for row, cells in enumerate(GRID) for col, value in enumerate(cells)
+    ])
+    session.commit()
+    return session
+
+
+def make_request(test, columns, missing="pairwise", **data):
+    return StatisticRequest(
+        test=test, hypothesis="TwoTailedSame", missingValueHandling=missing, confidenceInterval=95,
+        effectSize="", effectSizeValue=0, descriptiveStats=True, columns=columns, **data,
+    )
+
+
+def cleaned(request):
+    groups = apply_missing_value_handling(request.value, request.test, request.missingValueHandling)
+    return {name: values.tolist() for name, values in groups.items()}
+
+
+def test_columns_keep_rows_aligned_with_none(db):
+    request, = resolve_column_requests(db, 1, [make_request(
+        "IndependentTTest", {"pre": {"col": 0}, "post": {"header": "after"}}
+    )])
+    assert request.value == {"pre": [1.0, 2.0, 3.0, None], "post": [2.0, None, 5.0, 6.0]}
+    assert cleaned(request) == {"pre": [1.0, 2.0, 3.0], "post": [2.0, 5.0, 6.0]}
+
+
+def test_listwise_and_paired_drop_incomplete_rows(db):
+    columns = {"pre": {"header": "before"}, "post": {"col": 1}, "other": {"col": 3}}
+    listwise, = resolve_column_requests(db, 1, [make_request("OneWayANOVA", columns, "ListwiseDeletion")])
+    assert cleaned(listwise) == {"pre": [1.0], "post": [2.0], "other": [7.0]}
+
+    paired, = resolve_column_requests(db, 1, [make_request(
+        "PairedTTest", {"pre": {"col": 0}, "post": {"col": 1}}
+    )])
+    assert cleaned(paired) == {"pre": [1.0, 3.0], "post": [2.0, 5.0]}
+
+
+def test_plain_requests_are_untouched(db):
+    plain = make_request("OneSampleTTest", None, value={"a": [1, 2, 3]})
+    assert resolve_column_requests(db, 1, [plain]) == [plain]
+
+
+def test_invalid_references(db):
+    with pytest.raises(ValueError):
+        resolve_column_requests(db, 1, [make_request("OneSampleTTest", {"x": {"header": "missing"}})])
+    with pytest.raises(ValueError):
+        resolve_column_requests(db, 1, [make_request("OneSampleTTest", {"x": {"col": 2}})])
+    with pytest.raises(ValueError):
+        make_request("OneSampleTTest", {"x": {"col": 0, "header": "before"}})
@@ -0,0 +1,99 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from models import Base, Project, TableData
+from services.table_writer import TableWriter, cell_upsert
+
+
+async def _setup():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, expire_on_commit=False)
+    async with session() as db:
+        db.add(Project(id=1, name="p", user_id=1, visibility="private"))
+        db.add(TableData(project_id=1, row_num=0, col_num=0, value="old"))
+        await db.commit()
+    return engine, session
+
+
+async def _cells(session):
+    async with session() as db:
+        rows = (await db.execute(select(TableData.row_num, TableData.col_num, TableData.value))).all()
+    return {(row, col): value for row, col, value in rows}
+
+
+async def _concurrent_edits_share_one_batch():
+    engine, session = await _setup()
+    writer = TableWriter(session)
+    # 여러 연결에서 동시에 들어온 수정은 한 세션/한 커밋으로 저장, 같은 셀은 마지막 값
+    await asyncio.gather(
+        writer.write(1, 0, 0, "a"),
+        writer.write(1, 0, 1, "b"),
+        writer.write(1, 0, 0, "c"),
+    )
+    assert await _cells(session) == {(0, 0): "c", (0, 1): "b"}
+    assert writer.stats()["batches"] == 1
+    assert writer.stats()["writes"] == 2 and writer.stats()["coalesced"] == 1
+    async with session() as db:
+        project = await db.get(Project, 1)
+        assert project.modified_at is not None and project.table_version == 1
+
+    await writer.write(1, 2, 3, "d")
+    await writer.close()
+    assert writer.stats()["batches"] == 2 and writer.stats()["queued"] == 0
+    assert (await _cells(session))[(2, 3)] == "d"
+    async with session() as db:
+        assert (await db.get(Project, 1)).table_version == 2
+    await engine.dispose()
+
+
+def test_concurrent_edits_share_one_batch():
+    asyncio.run(_concurrent_edits_share_one_batch())
+
+
+class _RejectingWriter(TableWriter):
+    # "bad" 값이 들어 있는 저장만 실패
+    async def _write_cells(self, cells):
+        if "bad" in cells.values():
+            raise RuntimeError("rejected")
+        await super()._write_cells(cells)
+
+
+async def _failed_cell_fails_only_its_writer():
+    engine, session = await _setup()
+    writer = _RejectingWriter(session)
+    results = await asyncio.gather(
+        writer.write(1, 0, 0, "a"),
+        writer.write(1, 0, 1, "bad"),
+        writer.write(1, 0, 2, "c"),
+        return_exceptions=True,
+    )
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], RuntimeError)
+    assert writer.stats()["failed"] == 1
+    assert await _cells(session) == {(0, 0): "a", (0, 2): "c"}
+
+    # 실패한 뒤에도 writer 는 계속 동작
+    await writer.write(1, 0, 1, "b")
+    await writer.close()
+    assert (await _cells(session))[(0, 1)] == "b"
+    await engine.dispose()
+
+
+def test_failed_cell_fails_only_its_writer():
+    asyncio.run(_failed_cell_fails_only_its_writer())
+
+
+def test_cell_upsert_is_one_statement():
+    rows = [{"project_id": 1, "row_num": 0, "col_num": col, "value": str(col)} for col in range(3)]
+    sql = str(cell_upsert("mysql", rows).compile(dialect=mysql.dialect()))
+    assert sql.startswith("INSERT INTO table_data") and "ON DUPLICATE KEY UPDATE" in sql
+    assert sql.count("(%s, %s, %s, %s)") == 3
+
+    index, = [index for index in TableData.__table__.indexes if index.name == "ux_table_data_cell"]
+    assert index.unique and [column.name for column in index.columns] == ["project_id", "row_num", "col_num"]
@@ -0,0 +1,35 @@
+import asyncio
+import importlib.util
+
+import pytest
+
+from services import resampling, rworker, warmup
+
+
+@pytest.fixture
+def fresh_readiness(monkeypatch):
+    # 테스트에서는 프로세스 풀 없이 현재 프로세스에서 예열
+    monkeypatch.setattr(rworker, "R_WORKERS", 0)
+    monkeypatch.setattr(resampling, "RESAMPLING_WORKERS", 0)
+    monkeypatch.setattr(warmup, "readiness", warmup.Readiness())
+    return warmup
+
+
+def test_ready_after_default_engine_warm_up(fresh_readiness):
+    assert not fresh_readiness.readiness.ready
+    asyncio.run(fresh_readiness.warm_up(default_engine="numpy"))
+
+    state = fresh_readiness.readiness.to_dict()
+    assert state["ready"]
+    assert state["engines"]["numpy"]["ok"]
+    assert state["warmup_seconds"] is not None
+
+
+@pytest.mark.skipif(importlib.util.find_spec("rpy2") is not None, reason="R engine is available")
+def test_not_ready_when_default_engine_fails(fresh_readiness):
+    asyncio.run(fresh_readiness.warm_up(default_engine="r"))
+
+    state = fresh_readiness.readiness.to_dict()
+    assert not state["ready"]
+    assert not state["engines"]["r"]["ok"]
+    assert state["engines"]["numpy"]["ok"]